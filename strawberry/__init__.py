@@ -4,7 +4,9 @@ Strawberry is a Python library for GraphQL that aims to stay close to the GraphQ
 specification and allow for a more natural way of defining GraphQL schemas.
 """
 
-from . import experimental, federation, relay
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .directive import directive, directive_field
 from .parent import Parent
 from .permission import BasePermission
@@ -26,6 +28,9 @@ from .types.scalar import scalar
 from .types.union import union
 from .types.unset import UNSET
 
+if TYPE_CHECKING:
+    from . import experimental, federation, relay
+
 __all__ = [
     "ID",
     "UNSET",
@@ -59,3 +64,12 @@ __all__ = [
     "type",
     "union",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # these subpackages pull optional dependencies (like pydantic) and many
+    # modules, so they are only imported when used
+    if name in {"experimental", "federation", "relay"}:
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
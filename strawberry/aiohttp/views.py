@@ -108,7 +108,7 @@ class AiohttpWebSocketAdapter(AsyncWebSocketAdapter):
 
     async def send_json(self, message: Mapping[str, object]) -> None:
         try:
-            await self.ws.send_str(self.view.encode_json(message))
+            await self.ws.send_str(self.view.encode_json_text(message))
         except (RuntimeError, ClientConnectionResetError) as exc:
             raise WebSocketDisconnected from exc
 
@@ -171,7 +171,13 @@ class GraphQLView(
             self.graphql_ide = graphql_ide
 
     async def render_graphql_ide(self, request: web.Request) -> web.Response:
-        return web.Response(text=self.graphql_ide_html, content_type="text/html")
+        html = self.graphql_ide_html
+        headers = self.get_graphql_ide_headers(html)
+
+        if self.is_graphql_ide_not_modified(request.headers, headers):
+            return web.Response(status=304, headers=headers)
+
+        return web.Response(text=html, content_type="text/html", headers=headers)
 
     async def get_sub_response(self, request: web.Request) -> web.Response:
         return web.Response()
@@ -212,7 +218,7 @@ class GraphQLView(
     def create_response(
         self, response_data: GraphQLHTTPResponse, sub_response: web.Response
     ) -> web.Response:
-        sub_response.text = self.encode_json(response_data)
+        sub_response.body = self.encode_json(response_data)
         sub_response.content_type = "application/json"
 
         return sub_response
@@ -33,6 +33,7 @@ from strawberry.types.maybe import _annotation_is_maybe
 from strawberry.types.private import is_private
 from strawberry.types.scalar import ScalarDefinition
 from strawberry.types.unset import UNSET
+from strawberry.utils.build_cache import get_build_cache
 from strawberry.utils.typing import eval_type, is_generic, is_type_var
 
 if TYPE_CHECKING:
@@ -107,6 +108,15 @@ class StrawberryAnnotation:
         annotation = self.raw_annotation
 
         if isinstance(annotation, str):
+            build_cache = get_build_cache()
+
+            if build_cache is not None:
+                return build_cache.evaluate(
+                    annotation,
+                    self.namespace,
+                    lambda: eval_type(ForwardRef(annotation), self.namespace, None),
+                )
+
             annotation = ForwardRef(annotation)
 
         return eval_type(annotation, self.namespace, None)
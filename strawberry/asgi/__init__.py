@@ -107,7 +107,7 @@ class ASGIWebSocketAdapter(AsyncWebSocketAdapter):
 
     async def send_json(self, message: Mapping[str, object]) -> None:
         try:
-            await self.ws.send_text(self.view.encode_json(message))
+            await self.ws.send_text(self.view.encode_json_text(message))
         except WebSocketDisconnect as exc:
             raise WebSocketDisconnected from exc
 
@@ -202,7 +202,13 @@ class GraphQL(
         return sub_response
 
     async def render_graphql_ide(self, request: Request) -> Response:
-        return HTMLResponse(self.graphql_ide_html)
+        html = self.graphql_ide_html
+        headers = self.get_graphql_ide_headers(html)
+
+        if self.is_graphql_ide_not_modified(request.headers, headers):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return HTMLResponse(html, headers=headers)
 
     def create_response(
         self, response_data: GraphQLHTTPResponse, sub_response: Response
@@ -80,10 +80,13 @@ class GraphQLView(
         return None
 
     def render_graphql_ide(self, request: Request) -> Response:
-        return Response(
-            self.graphql_ide_html,
-            headers={"Content-Type": "text/html"},
-        )
+        html = self.graphql_ide_html
+        headers = self.get_graphql_ide_headers(html)
+
+        if self.is_graphql_ide_not_modified(request.headers, headers):
+            return Response("", status_code=304, headers=headers)
+
+        return Response(html, headers={**headers, "Content-Type": "text/html"})
 
     def get_sub_response(self, request: Request) -> TemporalResponse:
         return TemporalResponse()
@@ -122,7 +125,8 @@ class GraphQLView(
             status_code = sub_response.status_code
 
         return Response(
-            body=self.encode_json(response_data),
+            # Lambda responses are JSON documents, so the body must be text
+            body=self.encode_json_text(response_data),
             status_code=status_code,
             headers={
                 "Content-Type": "application/json",
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import dataclasses
-import json
 import warnings
 from functools import cached_property
 from io import BytesIO
@@ -188,12 +187,30 @@ class BaseGraphQLHTTPConsumer(ChannelsConsumer, AsyncHttpConsumer):
     def create_response(
         self, response_data: GraphQLHTTPResponse, sub_response: TemporalResponse
     ) -> ChannelsResponse:
+        data = self.encode_json(response_data)
+
         return ChannelsResponse(
-            content=json.dumps(response_data).encode(),
+            content=data if isinstance(data, bytes) else data.encode(),
             status=sub_response.status_code,
             headers={k.encode(): v.encode() for k, v in sub_response.headers.items()},
         )
 
+    def _create_graphql_ide_response(
+        self, request: ChannelsRequest
+    ) -> ChannelsResponse:
+        html = self.graphql_ide_html
+        headers = self.get_graphql_ide_headers(html)
+        encoded_headers = {k.encode(): v.encode() for k, v in headers.items()}
+
+        if self.is_graphql_ide_not_modified(request.headers, headers):
+            return ChannelsResponse(content=b"", status=304, headers=encoded_headers)
+
+        return ChannelsResponse(
+            content=html.encode(),
+            content_type="text/html; charset=utf-8",
+            headers=encoded_headers,
+        )
+
     async def handle(self, body: bytes) -> None:
         request = ChannelsRequest(consumer=self, body=body)
         try:
@@ -292,10 +309,7 @@ class GraphQLHTTPConsumer(
         )
 
     async def render_graphql_ide(self, request: ChannelsRequest) -> ChannelsResponse:
-        return ChannelsResponse(
-            content=self.graphql_ide_html.encode(),
-            content_type="text/html; charset=utf-8",
-        )
+        return self._create_graphql_ide_response(request)
 
     def is_websocket_request(
         self, request: ChannelsRequest
@@ -348,10 +362,7 @@ class SyncGraphQLHTTPConsumer(
         return TemporalResponse()
 
     def render_graphql_ide(self, request: ChannelsRequest) -> ChannelsResponse:
-        return ChannelsResponse(
-            content=self.graphql_ide_html.encode(),
-            content_type="text/html; charset=utf-8",
-        )
+        return self._create_graphql_ide_response(request)
 
     # Sync channels is actually async, but it uses database_sync_to_async to call
     # handlers in a threadpool. Check SyncConsumer's documentation for more info:
@@ -54,7 +54,7 @@ class ChannelsWebSocketAdapter(AsyncWebSocketAdapter):
                     raise NonJsonMessageReceived from e
 
     async def send_json(self, message: Mapping[str, object]) -> None:
-        serialized_message = self.view.encode_json(message)
+        serialized_message = self.view.encode_json_text(message)
         await self.ws_consumer.send(serialized_message)
 
     async def close(self, code: int, reason: str) -> None:
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import warnings
 from typing import (
     TYPE_CHECKING,
@@ -28,6 +27,7 @@ from django.utils.decorators import classonlymethod
 from django.views.generic import View
 
 from strawberry.http.async_base_view import AsyncBaseHTTPView, AsyncHTTPRequestAdapter
+from strawberry.http.codecs import JSONCodec, StdlibJSONCodec
 from strawberry.http.exceptions import HTTPException
 from strawberry.http.sync_base_view import SyncBaseHTTPView, SyncHTTPRequestAdapter
 from strawberry.http.types import FormData, HTTPMethod, QueryParams
@@ -136,6 +136,9 @@ class AsyncDjangoHTTPRequestAdapter(AsyncHTTPRequestAdapter):
 
 class BaseView:
     graphql_ide_html: str
+    # Keeps support for the types handled by Django's encoder (lazy strings,
+    # decimals, etc.), a faster codec can be set with `json_codec`.
+    default_json_codec: JSONCodec = StdlibJSONCodec(encoder=DjangoJSONEncoder)
 
     def __init__(
         self,
@@ -162,6 +165,16 @@ class BaseView:
 
         super().__init__(**kwargs)
 
+    def _create_graphql_ide_response(
+        self, request: HttpRequest, content: str
+    ) -> HttpResponse:
+        headers = self.get_graphql_ide_headers(content)  # type: ignore
+
+        if self.is_graphql_ide_not_modified(request.headers, headers):  # type: ignore
+            return HttpResponse(status=304, headers=headers)
+
+        return HttpResponse(content=content, headers=headers)
+
     def create_response(
         self, response_data: GraphQLHTTPResponse, sub_response: HttpResponse
     ) -> HttpResponseBase:
@@ -199,9 +212,6 @@ class BaseView:
             },
         )
 
-    def encode_json(self, data: object) -> str:
-        return json.dumps(data, cls=DjangoJSONEncoder)
-
 
 class GraphQLView(
     BaseView,
@@ -242,7 +252,7 @@ class GraphQLView(
         except TemplateDoesNotExist:
             content = self.graphql_ide_html
 
-        return HttpResponse(content)
+        return self._create_graphql_ide_response(request, content)
 
 
 class AsyncGraphQLView(
@@ -302,7 +312,7 @@ class AsyncGraphQLView(
         except TemplateDoesNotExist:
             content = self.graphql_ide_html
 
-        return HttpResponse(content=content)
+        return self._create_graphql_ide_response(request, content)
 
     def is_websocket_request(self, request: HttpRequest) -> TypeGuard[HttpRequest]:
         return False
@@ -136,6 +136,23 @@ class MissingQueryError(Exception):
         super().__init__(message)
 
 
+class ResolverTimeoutError(Exception):
+    """Raised when a resolver runs past its timeout or the operation's deadline."""
+
+    def __init__(self, field_name: str, timeout: Optional[float] = None) -> None:
+        if timeout is None:
+            message = (
+                f'Operation deadline exceeded while resolving field "{field_name}"'
+            )
+        else:
+            message = f'Resolver for field "{field_name}" timed out after {timeout:g}s'
+
+        self.field_name = field_name
+        self.timeout = timeout
+
+        super().__init__(message)
+
+
 class InvalidDefaultFactoryError(Exception):
     def __init__(self) -> None:
         message = "`default_factory` must be a callable that requires no arguments"
@@ -188,6 +205,7 @@ __all__ = [
     "ObjectIsNotAnEnumError",
     "ObjectIsNotClassError",
     "PrivateStrawberryFieldError",
+    "ResolverTimeoutError",
     "ScalarAlreadyRegisteredError",
     "StrawberryException",
     "StrawberryGraphQLError",
@@ -1,19 +1,50 @@
+import importlib
 import warnings
+from typing import TYPE_CHECKING, Any
 
 from .add_validation_rules import AddValidationRules
 from .base_extension import LifecycleStep, SchemaExtension
-from .disable_introspection import DisableIntrospection
-from .disable_validation import DisableValidation
 from .field_extension import FieldExtension
-from .mask_errors import MaskErrors
-from .max_aliases import MaxAliasesLimiter
-from .max_tokens import MaxTokensLimiter
-from .parser_cache import ParserCache
-from .query_depth_limiter import IgnoreContext, QueryDepthLimiter
-from .validation_cache import ValidationCache
 
+if TYPE_CHECKING:
+    from .disable_introspection import DisableIntrospection
+    from .disable_validation import DisableValidation
+    from .mask_errors import MaskErrors
+    from .max_aliases import MaxAliasesLimiter
+    from .max_tokens import MaxTokensLimiter
+    from .metrics import MetricsExtension
+    from .parser_cache import ParserCache
+    from .query_cost import QueryCostLimiter
+    from .query_depth_limiter import IgnoreContext, QueryDepthLimiter
+    from .rate_limiter import RateLimiter, RateLimiterSync
+    from .response_cache import ResponseCache, ResponseCacheSync
+    from .validation_cache import ValidationCache
+
+# the built-in extensions are only imported when used, so that importing
+# strawberry doesn't load the modules of the extensions an app doesn't use
+_LAZY_IMPORTS = {
+    "DisableIntrospection": ".disable_introspection",
+    "DisableValidation": ".disable_validation",
+    "IgnoreContext": ".query_depth_limiter",
+    "MaskErrors": ".mask_errors",
+    "MaxAliasesLimiter": ".max_aliases",
+    "MaxTokensLimiter": ".max_tokens",
+    "MetricsExtension": ".metrics",
+    "ParserCache": ".parser_cache",
+    "QueryCostLimiter": ".query_cost",
+    "QueryDepthLimiter": ".query_depth_limiter",
+    "RateLimiter": ".rate_limiter",
+    "RateLimiterSync": ".rate_limiter",
+    "ResponseCache": ".response_cache",
+    "ResponseCacheSync": ".response_cache",
+    "ValidationCache": ".validation_cache",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        return getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
 
-def __getattr__(name: str) -> type[SchemaExtension]:
     if name == "Extension":
         warnings.warn(
             (
@@ -38,8 +69,14 @@ __all__ = [
     "MaskErrors",
     "MaxAliasesLimiter",
     "MaxTokensLimiter",
+    "MetricsExtension",
     "ParserCache",
+    "QueryCostLimiter",
     "QueryDepthLimiter",
+    "RateLimiter",
+    "RateLimiterSync",
+    "ResponseCache",
+    "ResponseCacheSync",
     "SchemaExtension",
     "ValidationCache",
 ]
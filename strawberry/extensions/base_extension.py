@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from contextvars import ContextVar
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Optional
 
 from strawberry.utils.await_maybe import AsyncIteratorOrIterator, AwaitableOrValue
 
@@ -18,14 +19,59 @@ class LifecycleStep(Enum):
     RESOLVE = "resolve"
 
 
+# The execution context of the operation being processed, used by extensions
+# shared between operations, see `SchemaExtension.execution_context`
+_current_execution_context: ContextVar[Optional[ExecutionContext]] = ContextVar(
+    "strawberry_execution_context", default=None
+)
+
+
+def get_execution_context() -> Optional[ExecutionContext]:
+    """Returns the execution context of the operation being processed.
+
+    Returns `None` when called outside of an operation.
+    """
+    return _current_execution_context.get()
+
+
 class SchemaExtension:
-    execution_context: ExecutionContext
+    resolve_trivial_fields: ClassVar[bool] = True
+    """Whether `resolve` is called for fields using the default resolver.
+
+    Set this to `False` for extensions that only care about fields with a
+    custom resolver: fields using the default resolver and introspection
+    fields then skip the extension entirely.
+    """
 
     # to support extensions that still use the old signature
     # we have an optional argument here for ease of initialization.
     def __init__(
         self, *, execution_context: ExecutionContext | None = None
     ) -> None: ...
+
+    @property
+    def execution_context(self) -> ExecutionContext:
+        """The execution context of the operation being processed.
+
+        Extensions passed to the schema as classes are instantiated for every
+        operation, while extensions passed as instances are shared by all the
+        operations. For the latter, the execution context is looked up in a
+        context variable, so concurrent operations each see their own.
+        """
+        execution_context = get_execution_context()
+
+        if execution_context is None:
+            try:
+                return self.__dict__["execution_context"]
+            except KeyError:
+                raise AttributeError("execution_context") from None
+
+        return execution_context
+
+    @execution_context.setter
+    def execution_context(self, execution_context: ExecutionContext) -> None:
+        self.__dict__["execution_context"] = execution_context
+
     def on_operation(  # type: ignore
         self,
     ) -> AsyncIteratorOrIterator[None]:  # pragma: no cover
@@ -60,6 +106,24 @@ class SchemaExtension:
     ) -> AwaitableOrValue[object]:
         return _next(root, info, *args, **kwargs)
 
+    def for_operation(self) -> SchemaExtension:
+        """Returns the extension to use for a single operation.
+
+        This is called for extensions passed to the schema as instances, which
+        by default are shared by all the operations. Extensions keeping
+        per-operation state on `self` should return a copy instead.
+        """
+        return self
+
+    def should_resolve(self) -> bool:
+        """Whether `resolve` should be called for the current operation.
+
+        This is checked right before the execution starts. Returning `False`
+        leaves the extension out of the field middleware for the whole
+        operation, instead of having `resolve` called for every field.
+        """
+        return True
+
     def get_results(self) -> AwaitableOrValue[dict[str, Any]]:
         return {}
 
@@ -78,4 +142,10 @@ HOOK_METHODS: set[str] = {
     SchemaExtension.on_execute.__name__,
 }
 
-__all__ = ["HOOK_METHODS", "Hook", "LifecycleStep", "SchemaExtension"]
+__all__ = [
+    "HOOK_METHODS",
+    "Hook",
+    "LifecycleStep",
+    "SchemaExtension",
+    "get_execution_context",
+]
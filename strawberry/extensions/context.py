@@ -15,6 +15,7 @@ from typing import (
 )
 
 from strawberry.extensions import SchemaExtension
+from strawberry.extensions.base_extension import _current_execution_context
 from strawberry.utils.await_maybe import AwaitableOrValue, await_maybe
 
 if TYPE_CHECKING:
@@ -22,6 +23,7 @@ if TYPE_CHECKING:
     from types import TracebackType
 
     from strawberry.extensions.base_extension import Hook
+    from strawberry.types import ExecutionContext
 
 
 class WrappedHook(NamedTuple):
@@ -41,8 +43,10 @@ class ExtensionContextManagerBase:
         "async_exit_stack",
         "default_hook",
         "deprecation_message",
+        "execution_context",
         "exit_stack",
         "hooks",
+        "previous_execution_context",
     )
 
     def __init_subclass__(cls) -> None:
@@ -57,7 +61,12 @@ class ExtensionContextManagerBase:
     LEGACY_ENTER: str
     LEGACY_EXIT: str
 
-    def __init__(self, extensions: list[SchemaExtension]) -> None:
+    def __init__(
+        self,
+        extensions: list[SchemaExtension],
+        execution_context: Optional[ExecutionContext] = None,
+    ) -> None:
+        self.execution_context = execution_context
         self.hooks: list[WrappedHook] = []
         self.default_hook: Hook = getattr(SchemaExtension, self.HOOK_NAME)
         for extension in extensions:
@@ -161,18 +170,37 @@ class ExtensionContextManagerBase:
 
         return WrappedHook(extension=extension, hook=iterator, is_async=False)
 
+    def activate(self) -> None:
+        # Extensions shared between operations read the execution context from
+        # a context variable, see `SchemaExtension.execution_context`. The
+        # previous value is restored (rather than reset with a token) because
+        # subscriptions can be closed from another context.
+        self.previous_execution_context = _current_execution_context.get()
+
+        if self.execution_context is not None:
+            _current_execution_context.set(self.execution_context)
+
+    def deactivate(self) -> None:
+        if self.execution_context is not None:
+            _current_execution_context.set(self.previous_execution_context)
+
     def __enter__(self) -> None:
+        self.activate()
         self.exit_stack = contextlib.ExitStack()
 
         self.exit_stack.__enter__()
 
-        for hook in self.hooks:
-            if hook.is_async:
-                raise RuntimeError(
-                    f"SchemaExtension hook {hook.extension}.{self.HOOK_NAME} "
-                    "failed to complete synchronously."
-                )
-            self.exit_stack.enter_context(hook.hook())  # type: ignore
+        try:
+            for hook in self.hooks:
+                if hook.is_async:
+                    raise RuntimeError(  # noqa: TRY301
+                        f"SchemaExtension hook {hook.extension}.{self.HOOK_NAME} "
+                        "failed to complete synchronously."
+                    )
+                self.exit_stack.enter_context(hook.hook())  # type: ignore
+        except BaseException:
+            self.deactivate()
+            raise
 
     def __exit__(
         self,
@@ -180,18 +208,26 @@ class ExtensionContextManagerBase:
         exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType],
     ) -> None:
-        self.exit_stack.__exit__(exc_type, exc_val, exc_tb)
+        try:
+            self.exit_stack.__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            self.deactivate()
 
     async def __aenter__(self) -> None:
+        self.activate()
         self.async_exit_stack = contextlib.AsyncExitStack()
 
         await self.async_exit_stack.__aenter__()
 
-        for hook in self.hooks:
-            if hook.is_async:
-                await self.async_exit_stack.enter_async_context(hook.hook())  # type: ignore
-            else:
-                self.async_exit_stack.enter_context(hook.hook())  # type: ignore
+        try:
+            for hook in self.hooks:
+                if hook.is_async:
+                    await self.async_exit_stack.enter_async_context(hook.hook())  # type: ignore
+                else:
+                    self.async_exit_stack.enter_context(hook.hook())  # type: ignore
+        except BaseException:
+            self.deactivate()
+            raise
 
     async def __aexit__(
         self,
@@ -199,7 +235,10 @@ class ExtensionContextManagerBase:
         exc_val: Optional[BaseException],
         exc_tb: Optional[TracebackType],
     ) -> None:
-        await self.async_exit_stack.__aexit__(exc_type, exc_val, exc_tb)
+        try:
+            await self.async_exit_stack.__aexit__(exc_type, exc_val, exc_tb)
+        finally:
+            self.deactivate()
 
 
 class OperationContextManager(ExtensionContextManagerBase):
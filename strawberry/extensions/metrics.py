@@ -0,0 +1,644 @@
+"""In-process execution metrics.
+
+`MetricsExtension` aggregates resolver and operation timings into fixed-bucket
+histograms, without allocating anything per resolver call, so that it can be
+left on in production. The aggregated values are read by exporters.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import socket
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from inspect import isawaitable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from strawberry.extensions.base_extension import SchemaExtension
+from strawberry.extensions.tracing.utils import should_skip_tracing
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Iterable, Iterator, Sequence
+
+    from graphql import GraphQLObjectType, GraphQLResolveInfo
+
+
+logger = logging.getLogger("strawberry.metrics")
+
+# In seconds, the upper bounds of the histogram buckets (+Inf is implicit)
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+PHASES = ("parse", "validate", "execute", "operation")
+
+ANONYMOUS_OPERATION = "anonymous"
+
+_UNKNOWN: Any = object()
+
+# Timings of the operation being executed, per phase. A context variable keeps
+# concurrent operations sharing the same extension instance apart.
+_operation_timings: ContextVar[Optional[dict[str, float]]] = ContextVar(
+    "strawberry_metrics_operation_timings", default=None
+)
+
+
+class Histogram:
+    """A histogram with fixed buckets.
+
+    `counts[i]` is the number of observations that are less than or equal to
+    `buckets[i]` (and greater than the previous bucket), the last item counts
+    the observations over the largest bucket.
+    """
+
+    __slots__ = ("buckets", "count", "counts", "sum")
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def reset(self) -> None:
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+
+class FieldMetrics:
+    __slots__ = ("duration", "errors")
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.duration = Histogram(buckets)
+        self.errors = 0
+
+    @property
+    def calls(self) -> int:
+        return self.duration.count
+
+    def reset(self) -> None:
+        self.duration.reset()
+        self.errors = 0
+
+
+class OperationMetrics:
+    __slots__ = ("count", "errors", "phases")
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.count = 0
+        self.errors = 0
+        self.phases = {phase: Histogram(buckets) for phase in PHASES}
+
+
+class MetricsRegistry:
+    """Holds the metrics aggregated by one or more `MetricsExtension`.
+
+    Fields are keyed by `(parent type name, field name)` and operations by
+    operation name. Updates aren't locked: when resolvers run in several
+    threads at once an increment can occasionally be lost, which is accepted
+    to keep the overhead low.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.fields: dict[tuple[str, str], FieldMetrics] = {}
+        self.operations: dict[str, OperationMetrics] = {}
+
+    def field(self, type_name: str, field_name: str) -> FieldMetrics:
+        key = (type_name, field_name)
+        metrics = self.fields.get(key)
+
+        if metrics is None:
+            metrics = self.fields[key] = FieldMetrics(self.buckets)
+
+        return metrics
+
+    def operation(self, operation_name: str) -> OperationMetrics:
+        metrics = self.operations.get(operation_name)
+
+        if metrics is None:
+            metrics = self.operations[operation_name] = OperationMetrics(self.buckets)
+
+        return metrics
+
+    def reset(self) -> None:
+        # Field metrics are reset in place, as extensions keep references to them
+        for metrics in list(self.fields.values()):
+            metrics.reset()
+
+        self.operations = {}
+
+
+class MetricsExporter:
+    """Base class for exporters, which are called periodically by the extension.
+
+    Exporters are called from a background thread, while operations keep
+    updating the registry.
+    """
+
+    def export(self, registry: MetricsRegistry) -> None:
+        raise NotImplementedError
+
+
+class CallbackExporter(MetricsExporter):
+    """Call a function with the registry, e.g. to forward metrics to a client library."""
+
+    def __init__(self, callback: Callable[[MetricsRegistry], None]) -> None:
+        self.callback = callback
+
+    def export(self, registry: MetricsRegistry) -> None:
+        self.callback(registry)
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class PrometheusExporter(MetricsExporter):
+    """Render metrics in the Prometheus text exposition format.
+
+    `render` can be used to serve a `/metrics` endpoint. When a `path` is
+    given, `export` writes the metrics to that file (atomically), for the
+    node exporter's textfile collector.
+    """
+
+    def __init__(
+        self, path: Union[str, Path, None] = None, namespace: str = "strawberry"
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.namespace = namespace
+
+    def export(self, registry: MetricsRegistry) -> None:
+        if self.path is None:
+            return
+
+        fd, temporary_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}."
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(self.render(registry))
+        Path(temporary_path).replace(self.path)
+
+    def render(self, registry: MetricsRegistry) -> str:
+        lines: list[str] = []
+        namespace = self.namespace
+
+        # Copied first, as other threads may add metrics while rendering
+        fields = [
+            (
+                f'type="{_escape_label(type_name)}",field="{_escape_label(name)}"',
+                metrics,
+            )
+            for (type_name, name), metrics in list(registry.fields.items())
+        ]
+        operations = [
+            (f'operation="{_escape_label(name)}"', metrics)
+            for name, metrics in list(registry.operations.items())
+        ]
+
+        self._counter(
+            lines,
+            f"{namespace}_field_calls_total",
+            "Number of resolver calls.",
+            ((labels, metrics.calls) for labels, metrics in fields),
+        )
+        self._counter(
+            lines,
+            f"{namespace}_field_errors_total",
+            "Number of resolver calls that raised an error.",
+            ((labels, metrics.errors) for labels, metrics in fields),
+        )
+        self._histogram(
+            lines,
+            f"{namespace}_field_duration_seconds",
+            "Duration of resolver calls.",
+            registry.buckets,
+            ((labels, metrics.duration) for labels, metrics in fields),
+        )
+        self._counter(
+            lines,
+            f"{namespace}_operations_total",
+            "Number of operations executed.",
+            ((labels, metrics.count) for labels, metrics in operations),
+        )
+        self._counter(
+            lines,
+            f"{namespace}_operation_errors_total",
+            "Number of operations with errors.",
+            ((labels, metrics.errors) for labels, metrics in operations),
+        )
+        self._histogram(
+            lines,
+            f"{namespace}_operation_duration_seconds",
+            "Duration of the phases of operations.",
+            registry.buckets,
+            (
+                (f'{labels},phase="{phase}"', histogram)
+                for labels, metrics in operations
+                for phase, histogram in metrics.phases.items()
+                if histogram.count
+            ),
+        )
+
+        return "\n".join(lines) + "\n"
+
+    def _counter(
+        self,
+        lines: list[str],
+        name: str,
+        help_text: str,
+        values: Iterator[tuple[str, int]],
+    ) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} counter")
+        lines.extend(f"{name}{{{labels}}} {value}" for labels, value in values)
+
+    def _histogram(
+        self,
+        lines: list[str],
+        name: str,
+        help_text: str,
+        buckets: Sequence[float],
+        values: Iterator[tuple[str, Histogram]],
+    ) -> None:
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+
+        bounds = [_format_number(bucket) for bucket in buckets] + ["+Inf"]
+
+        for labels, histogram in values:
+            cumulative = 0
+
+            for bound, count in zip(bounds, histogram.counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+
+            lines.append(f"{name}_sum{{{labels}}} {_format_number(histogram.sum)}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+
+_INVALID_STATSD_CHARACTERS = re.compile(r"[^A-Za-z0-9_\-]")
+
+
+class StatsDExporter(MetricsExporter):
+    """Send metrics to a StatsD agent over UDP.
+
+    Each export sends what changed since the previous one: call, error and
+    operation counts as counters, and the mean durations over the interval as
+    timers (in milliseconds). UDP is fire and forget, so sending errors are
+    ignored.
+    """
+
+    # Keeps packets under the usual MTU
+    max_packet_size = 1432
+
+    def __init__(
+        self, host: str = "127.0.0.1", port: int = 8125, prefix: str = "strawberry"
+    ) -> None:
+        self.address = (host, port)
+        self.prefix = prefix
+        self._socket: Optional[socket.socket] = None
+        # Values sent by the previous export, as (count, errors, duration sum)
+        self._previous: dict[tuple[str, ...], tuple[int, int, float]] = {}
+
+    def export(self, registry: MetricsRegistry) -> None:
+        packet = ""
+
+        for line in self.format(registry):
+            if packet and len(packet) + len(line) + 1 > self.max_packet_size:
+                self._send(packet)
+                packet = ""
+
+            packet = f"{packet}\n{line}" if packet else line
+
+        if packet:
+            self._send(packet)
+
+    def format(self, registry: MetricsRegistry) -> Iterator[str]:
+        """Yield the StatsD lines for the changes since the previous call."""
+        for (type_name, field_name), metrics in list(registry.fields.items()):
+            name = f"{self.prefix}.field.{self._clean(type_name)}.{self._clean(field_name)}"
+
+            yield from self._format_delta(
+                ("field", type_name, field_name),
+                name,
+                "calls",
+                metrics.calls,
+                metrics.errors,
+                metrics.duration.sum,
+            )
+
+        for operation_name, metrics in list(registry.operations.items()):
+            name = f"{self.prefix}.operation.{self._clean(operation_name)}"
+
+            yield from self._format_delta(
+                ("operation", operation_name),
+                name,
+                "count",
+                metrics.count,
+                metrics.errors,
+                None,
+            )
+
+            for phase, histogram in metrics.phases.items():
+                yield from self._format_delta(
+                    ("phase", operation_name, phase),
+                    name,
+                    None,
+                    histogram.count,
+                    0,
+                    histogram.sum,
+                    timer_name=phase,
+                )
+
+    def _format_delta(
+        self,
+        key: tuple[str, ...],
+        name: str,
+        count_name: Optional[str],
+        count: int,
+        errors: int,
+        duration_sum: Optional[float],
+        timer_name: str = "duration",
+    ) -> Iterator[str]:
+        previous_count, previous_errors, previous_sum = self._previous.get(
+            key, (0, 0, 0.0)
+        )
+
+        if count < previous_count:
+            # The registry was reset
+            previous_count, previous_errors, previous_sum = 0, 0, 0.0
+
+        calls = count - previous_count
+
+        if not calls:
+            return
+
+        self._previous[key] = (count, errors, duration_sum or 0.0)
+
+        if count_name is not None:
+            yield f"{name}.{count_name}:{calls}|c"
+
+            if errors > previous_errors:
+                yield f"{name}.errors:{errors - previous_errors}|c"
+
+        if duration_sum is not None:
+            mean = (duration_sum - previous_sum) / calls * 1000
+            yield f"{name}.{timer_name}:{mean:.3f}|ms"
+
+    def _clean(self, name: str) -> str:
+        return _INVALID_STATSD_CHARACTERS.sub("_", name)
+
+    def _send(self, packet: str) -> None:
+        try:
+            if self._socket is None:
+                self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                self._socket.setblocking(False)
+
+            self._socket.sendto(packet.encode(), self.address)
+        except OSError:
+            pass
+
+
+class MetricsExtension(SchemaExtension):
+    """Aggregate execution metrics in process.
+
+    Example:
+
+    ```python
+    import strawberry
+    from strawberry.extensions import MetricsExtension
+    from strawberry.extensions.metrics import StatsDExporter
+
+    metrics = MetricsExtension(exporters=[StatsDExporter()], export_interval=10)
+
+    schema = strawberry.Schema(Query, extensions=[metrics])
+    ```
+
+    Call counts, error counts and latency histograms are kept per field with
+    a custom resolver (fields using the default resolver and introspection
+    fields aren't measured), along with the parse, validation and execution
+    timings of each operation.
+
+    The extension must be passed as an instance, as the metrics are stored
+    on it (in `registry`).
+    """
+
+    resolve_trivial_fields = False
+
+    def __init__(
+        self,
+        *,
+        exporters: Iterable[MetricsExporter] = (),
+        export_interval: float = 10.0,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+        registry: Optional[MetricsRegistry] = None,
+    ) -> None:
+        """Initialize the MetricsExtension.
+
+        Args:
+            exporters: Exporters called every `export_interval` seconds, from
+                a background thread started by the first operation.
+            export_interval: The number of seconds between exports.
+            buckets: The upper bounds of the latency histogram buckets, in seconds.
+            registry: Where to store the metrics, allows to share them between
+                schemas. A new registry is created by default.
+        """
+        self.registry = registry if registry is not None else MetricsRegistry(buckets)
+        self.exporters = list(exporters)
+        self.export_interval = export_interval
+        self._export_thread: Optional[threading.Thread] = None
+        self._export_lock = threading.Lock()
+        self._stopped = threading.Event()
+        # The metrics of each field (None for the fields that aren't
+        # measured), by parent type and field name
+        self._fields: dict[GraphQLObjectType, dict[str, Optional[FieldMetrics]]] = {}
+
+    def export(self) -> None:
+        """Run all the exporters now."""
+        for exporter in self.exporters:
+            try:
+                exporter.export(self.registry)
+            except Exception:  # noqa: PERF203
+                logger.exception("Metrics exporter %r failed", exporter)
+
+    def stop(self) -> None:
+        """Stop the periodic exports, after running the exporters one last time."""
+        self._stopped.set()
+
+        thread = self._export_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+        self.export()
+
+    def _start_exporting(self) -> None:
+        # Also restarts the thread in processes forked after it was started
+        with self._export_lock:
+            thread = self._export_thread
+
+            if self._stopped.is_set() or (thread is not None and thread.is_alive()):
+                return
+
+            self._export_thread = threading.Thread(
+                target=self._export_periodically,
+                name="strawberry-metrics-exporter",
+                daemon=True,
+            )
+            self._export_thread.start()
+
+    def _export_periodically(self) -> None:
+        while not self._stopped.wait(self.export_interval):
+            self.export()
+
+    def on_operation(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        timings: dict[str, float] = {}
+        token = _operation_timings.set(timings)
+        start = time.perf_counter()
+
+        yield
+
+        timings["operation"] = time.perf_counter() - start
+        _operation_timings.reset(token)
+
+        metrics = self.registry.operation(
+            execution_context.operation_name or ANONYMOUS_OPERATION
+        )
+        metrics.count += 1
+
+        result = execution_context.result
+        if execution_context.errors or (result is not None and result.errors):
+            metrics.errors += 1
+
+        for phase, duration in timings.items():
+            metrics.phases[phase].observe(duration)
+
+        # Exports run in a thread, so that exporters doing I/O (writing a
+        # file, sending packets) don't add latency to operations
+        if self.exporters:
+            thread = self._export_thread
+
+            if thread is None or not thread.is_alive():
+                self._start_exporting()
+
+    def on_parse(self) -> Iterator[None]:
+        yield from self._time_phase("parse")
+
+    def on_validate(self) -> Iterator[None]:
+        yield from self._time_phase("validate")
+
+    def on_execute(self) -> Iterator[None]:
+        yield from self._time_phase("execute")
+
+    def _time_phase(self, phase: str) -> Iterator[None]:
+        start = time.perf_counter()
+
+        yield
+
+        timings = _operation_timings.get()
+        if timings is not None:
+            timings[phase] = time.perf_counter() - start
+
+    def resolve(
+        self,
+        _next: Callable,
+        root: Any,
+        info: GraphQLResolveInfo,
+        *args: str,
+        **kwargs: Any,
+    ) -> Any:
+        # Not a coroutine function: only the resolvers that return awaitables
+        # get wrapped, so the extension works (and adds no awaits) with both
+        # sync and async execution.
+        type_fields = self._fields.get(info.parent_type)
+
+        if type_fields is None:
+            type_fields = self._fields[info.parent_type] = {}
+
+        metrics = type_fields.get(info.field_name, _UNKNOWN)
+
+        if metrics is _UNKNOWN:
+            metrics = type_fields[info.field_name] = self._get_field_metrics(
+                _next, info
+            )
+
+        if metrics is None:
+            return _next(root, info, *args, **kwargs)
+
+        start = time.perf_counter()
+
+        try:
+            result = _next(root, info, *args, **kwargs)
+        except Exception:
+            metrics.errors += 1
+            metrics.duration.observe(time.perf_counter() - start)
+            raise
+
+        if isawaitable(result):
+            return self._resolve_async(result, metrics, start)
+
+        metrics.duration.observe(time.perf_counter() - start)
+
+        return result
+
+    def _get_field_metrics(
+        self, _next: Callable, info: GraphQLResolveInfo
+    ) -> Optional[FieldMetrics]:
+        if should_skip_tracing(_next, info):
+            return None
+
+        return self.registry.field(info.parent_type.name, info.field_name)
+
+    async def _resolve_async(
+        self, result: Awaitable[Any], metrics: FieldMetrics, start: float
+    ) -> Any:
+        try:
+            return await result
+        except Exception:
+            metrics.errors += 1
+            raise
+        finally:
+            metrics.duration.observe(time.perf_counter() - start)
+
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "CallbackExporter",
+    "FieldMetrics",
+    "Histogram",
+    "MetricsExporter",
+    "MetricsExtension",
+    "MetricsRegistry",
+    "OperationMetrics",
+    "PrometheusExporter",
+    "StatsDExporter",
+]
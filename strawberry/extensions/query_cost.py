@@ -0,0 +1,502 @@
+from __future__ import annotations
+
+from copy import copy
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional
+
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    InlineFragmentNode,
+    IntValueNode,
+    VariableNode,
+    get_named_type,
+    is_composite_type,
+)
+from graphql.execution import ExecutionResult as GraphQLExecutionResult
+from graphql.utilities import get_operation_ast
+
+from strawberry.extensions.base_extension import SchemaExtension
+from strawberry.extensions.utils import get_schema_directives, is_introspection_key
+from strawberry.schema_directives import Cost, ListSize
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+    from graphql import (
+        DocumentNode,
+        GraphQLCompositeType,
+        GraphQLField,
+        GraphQLNamedType,
+        GraphQLSchema,
+        SelectionSetNode,
+    )
+
+    from strawberry.types.execution import ExecutionContext
+
+DEFAULT_SLICING_ARGUMENTS = ("first", "last", "limit")
+
+
+@dataclass(frozen=True)
+class ListSizeEstimate:
+    """The number of items of a list, as far as it's known from the document."""
+
+    values: tuple[int, ...]
+    # the names of the variables passed to slicing arguments, with the size
+    # used when a variable isn't provided
+    variables: tuple[tuple[str, Optional[int]], ...]
+    assumed_size: int
+
+    def evaluate(self, variables: Mapping[str, Any]) -> int:
+        sizes = [
+            *self.values,
+            *(
+                value
+                for name, default in self.variables
+                if isinstance(value := variables.get(name, default), int)
+            ),
+        ]
+
+        return max(sizes) if sizes else self.assumed_size
+
+
+@dataclass(frozen=True)
+class FieldCostEstimate:
+    """The cost of a field in a document, along with its selections."""
+
+    weight: int
+    size: Optional[ListSizeEstimate]
+    selections: tuple[FieldCostEstimate, ...]
+
+    def evaluate(
+        self, variables: Mapping[str, Any], maximum: Optional[int] = None
+    ) -> int:
+        """Returns the cost of the field for the given variables.
+
+        When a `maximum` is given, the evaluation stops as soon as the cost
+        goes over it, and the cost returned is the one reached at that point.
+        """
+        return _evaluate(self, variables, maximum, {})
+
+
+def _evaluate(
+    estimate: FieldCostEstimate,
+    variables: Mapping[str, Any],
+    maximum: Optional[int],
+    evaluated: dict[int, int],
+) -> int:
+    # fragments are estimated once, so the same estimates can be found in many
+    # places of the tree
+    cost = evaluated.get(id(estimate))
+
+    if cost is not None:
+        return cost
+
+    size = 1 if estimate.size is None else estimate.size.evaluate(variables)
+    cost = estimate.weight
+
+    if size:
+        for selection in estimate.selections:
+            cost += _evaluate(selection, variables, maximum, evaluated)
+
+            if maximum is not None and cost * size > maximum:
+                break
+
+    cost *= size
+    evaluated[id(estimate)] = cost
+
+    return cost
+
+
+class QueryCostAnalyzer:
+    """Estimates the cost of GraphQL operations.
+
+    The cost of a field is its weight plus the cost of its selections,
+    multiplied by the number of items when the field returns a list. Fields
+    returning an object have a weight of 1 and other fields a weight of 0,
+    unless a `Cost` directive is set on the field or on its type.
+
+    The number of items of a list is the biggest of its slicing arguments
+    (`first`, `last` and `limit` by default), taking the defaults of
+    variables and arguments into account. Slicing arguments of fields
+    returning an object, such as connections, apply to the lists they
+    contain (such as `edges`). When no slicing argument is passed, the
+    `assumed_size` of the `ListSize` directive of the field is used,
+    `relay_max_results` for connections, or `default_list_size`.
+
+    The estimates are cached per document, so only the variables are looked
+    at for every operation. Fragments are estimated once per list size they
+    are spread with, however many times they are spread.
+    """
+
+    def __init__(
+        self,
+        *,
+        default_list_size: int = 1,
+        slicing_arguments: Iterable[str] = DEFAULT_SLICING_ARGUMENTS,
+        maxsize: Optional[int] = 128,
+    ) -> None:
+        self.default_list_size = default_list_size
+        self.slicing_arguments = tuple(slicing_arguments)
+        self._estimate = lru_cache(maxsize=maxsize)(self.estimate)
+
+    def cost(
+        self, execution_context: ExecutionContext, maximum: Optional[int] = None
+    ) -> int:
+        """Returns the cost of the operation of the execution context.
+
+        When a `maximum` is given, the evaluation stops as soon as the cost
+        goes over it, and the cost returned is the one reached at that point.
+        """
+        assert execution_context.graphql_document is not None
+
+        estimates = self._estimate(
+            execution_context.schema._schema,
+            execution_context.graphql_document,
+            execution_context.operation_name,
+        )
+        variables = execution_context.variables or {}
+        evaluated: dict[int, int] = {}
+        cost = 0
+
+        for estimate in estimates:
+            cost += _evaluate(estimate, variables, maximum, evaluated)
+
+            if maximum is not None and cost > maximum:
+                break
+
+        return cost
+
+    def estimate(
+        self,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        operation_name: Optional[str],
+    ) -> tuple[FieldCostEstimate, ...]:
+        """Returns the cost estimates of the root fields of an operation."""
+        operation = get_operation_ast(document, operation_name)
+
+        if operation is None:
+            return ()
+
+        root_type = schema.get_root_type(operation.operation)
+
+        if root_type is None:
+            return ()
+
+        fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+
+        variable_defaults = {
+            definition.variable.name.value: int(definition.default_value.value)
+            for definition in operation.variable_definitions
+            if isinstance(definition.default_value, IntValueNode)
+        }
+
+        return tuple(
+            _Estimator(self, schema, fragments, variable_defaults).selection_set(
+                operation.selection_set, root_type, None
+            )
+        )
+
+
+class _Estimator:
+    def __init__(
+        self,
+        analyzer: QueryCostAnalyzer,
+        schema: GraphQLSchema,
+        fragments: dict[str, FragmentDefinitionNode],
+        variable_defaults: dict[str, int],
+    ) -> None:
+        self.analyzer = analyzer
+        self.schema = schema
+        self.fragments = fragments
+        self.variable_defaults = variable_defaults
+        self.fragment_estimates: dict[
+            tuple[str, str, Optional[ListSizeEstimate]],
+            tuple[FieldCostEstimate, ...],
+        ] = {}
+        self.relay_max_results = schema._strawberry_schema.config.relay_max_results  # type: ignore[attr-defined]
+
+    def selection_set(
+        self,
+        selection_set: SelectionSetNode,
+        parent_type: GraphQLCompositeType,
+        size: Optional[ListSizeEstimate],
+    ) -> Iterator[FieldCostEstimate]:
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                estimate = self.field(selection, parent_type, size)
+
+                if estimate is not None:
+                    yield estimate
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = (
+                    self.schema.get_type(selection.type_condition.name.value)
+                    if selection.type_condition
+                    else parent_type
+                )
+                yield from self.selection_set(
+                    selection.selection_set,
+                    fragment_type,  # type: ignore[arg-type]
+                    size,
+                )
+            elif isinstance(selection, FragmentSpreadNode):
+                yield from self.fragment_spread(selection, parent_type, size)
+
+    def fragment_spread(
+        self,
+        node: FragmentSpreadNode,
+        parent_type: GraphQLCompositeType,
+        size: Optional[ListSizeEstimate],
+    ) -> tuple[FieldCostEstimate, ...]:
+        # spreads of a fragment share their estimates, otherwise fragments
+        # spreading another one several times take exponential time to estimate
+        key = (node.name.value, parent_type.name, size)
+        estimates = self.fragment_estimates.get(key)
+
+        if estimates is None:
+            fragment = self.fragments[node.name.value]
+            estimates = self.fragment_estimates[key] = tuple(
+                self.selection_set(
+                    fragment.selection_set,
+                    self.schema.get_type(fragment.type_condition.name.value),  # type: ignore[arg-type]
+                    size,
+                )
+            )
+
+        return estimates
+
+    def field(
+        self,
+        node: FieldNode,
+        parent_type: GraphQLCompositeType,
+        inherited_size: Optional[ListSizeEstimate],
+    ) -> Optional[FieldCostEstimate]:
+        if is_introspection_key(node.name.value) or not isinstance(
+            parent_type, (GraphQLObjectType, GraphQLInterfaceType)
+        ):
+            return None
+
+        field = parent_type.fields.get(node.name.value)
+
+        if field is None:
+            return None
+
+        field_type = field.type
+        if isinstance(field_type, GraphQLNonNull):
+            field_type = field_type.of_type
+
+        named_type = get_named_type(field_type)
+        own_size = self.size(node, field, named_type)
+
+        if isinstance(field_type, GraphQLList):
+            size = own_size or inherited_size or self.assumed_size(field, named_type)
+            selections_size = None
+        else:
+            size = None
+            selections_size = own_size
+
+        selections: tuple[FieldCostEstimate, ...] = ()
+
+        if node.selection_set and is_composite_type(named_type):
+            selections = tuple(
+                self.selection_set(
+                    node.selection_set,
+                    named_type,  # type: ignore[arg-type]
+                    selections_size,
+                )
+            )
+
+        return FieldCostEstimate(
+            weight=self.weight(field, named_type),
+            size=size,
+            selections=selections,
+        )
+
+    def weight(self, field: GraphQLField, named_type: GraphQLNamedType) -> int:
+        for directive in get_schema_directives(field):
+            if isinstance(directive, Cost):
+                return directive.weight
+
+        for directive in get_schema_directives(named_type):
+            if isinstance(directive, Cost):
+                return directive.weight
+
+        return 1 if is_composite_type(named_type) else 0
+
+    def size(
+        self,
+        node: FieldNode,
+        field: GraphQLField,
+        named_type: GraphQLNamedType,
+    ) -> Optional[ListSizeEstimate]:
+        slicing_arguments = self.analyzer.slicing_arguments
+
+        for directive in get_schema_directives(field):
+            if isinstance(directive, ListSize) and directive.slicing_arguments:
+                slicing_arguments = tuple(directive.slicing_arguments)
+
+        if not any(name in field.args for name in slicing_arguments):
+            return None
+
+        values: list[int] = []
+        variables: list[tuple[str, Optional[int]]] = []
+        passed_arguments = {
+            argument.name.value: argument for argument in node.arguments
+        }
+
+        for name in slicing_arguments:
+            if name not in field.args:
+                continue
+
+            argument_default = field.args[name].default_value
+            if not isinstance(argument_default, int):
+                argument_default = None
+
+            argument = passed_arguments.get(name)
+
+            if argument is None:
+                if argument_default is not None:
+                    values.append(argument_default)
+            elif isinstance(argument.value, IntValueNode):
+                values.append(int(argument.value.value))
+            elif isinstance(argument.value, VariableNode):
+                # a variable that isn't provided has its default value, or
+                # leaves the argument unset when it doesn't have one
+                variable_name = argument.value.name.value
+                variables.append(
+                    (
+                        variable_name,
+                        self.variable_defaults.get(variable_name, argument_default),
+                    )
+                )
+
+        return ListSizeEstimate(
+            values=tuple(values),
+            variables=tuple(variables),
+            assumed_size=self.assumed_size(field, named_type).assumed_size,
+        )
+
+    def assumed_size(
+        self, field: GraphQLField, named_type: GraphQLNamedType
+    ) -> ListSizeEstimate:
+        for directive in get_schema_directives(field):
+            if isinstance(directive, ListSize) and directive.assumed_size:
+                return ListSizeEstimate((), (), directive.assumed_size)
+
+        if _is_connection(named_type):
+            return ListSizeEstimate((), (), self.relay_max_results)
+
+        return ListSizeEstimate((), (), self.analyzer.default_list_size)
+
+
+def _is_connection(named_type: GraphQLNamedType) -> bool:
+    from strawberry.relay.types import Connection
+
+    definition = named_type.extensions.get("strawberry-definition")
+    origin = getattr(definition, "origin", None)
+
+    return isinstance(origin, type) and issubclass(origin, Connection)
+
+
+class QueryCostLimiter(SchemaExtension):
+    """Reject operations whose estimated cost is above a maximum.
+
+    Example:
+
+    ```python
+    import strawberry
+    from strawberry.extensions import QueryCostLimiter
+    from strawberry.schema_directives import Cost
+
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(directives=[Cost(weight=10)])
+        def search(self, query: str, first: int = 10) -> list[Result]: ...
+
+
+    schema = strawberry.Schema(
+        Query,
+        extensions=[QueryCostLimiter(max_cost=1000)],
+    )
+    ```
+
+    The cost is estimated once validation passed and before execution
+    starts, see `QueryCostAnalyzer`, and is added to the `cost` key of the
+    response extensions. The estimation stops as soon as the cost goes over
+    `max_cost`, so the cost of rejected operations is the one reached at that
+    point.
+    """
+
+    cost: Optional[int] = None
+
+    def __init__(
+        self,
+        max_cost: int,
+        *,
+        default_list_size: int = 1,
+        slicing_arguments: Iterable[str] = DEFAULT_SLICING_ARGUMENTS,
+        maxsize: Optional[int] = 128,
+    ) -> None:
+        """Initialize the QueryCostLimiter.
+
+        Args:
+            max_cost: The maximum allowed cost of an operation.
+            default_list_size: The number of items assumed for lists without
+                slicing arguments or `ListSize` directive.
+            slicing_arguments: The names of the arguments limiting the number of
+                items of a list.
+            maxsize: The maximum number of documents whose cost estimates are
+                cached, `None` for no limit.
+        """
+        self.max_cost = max_cost
+        self.analyzer = QueryCostAnalyzer(
+            default_list_size=default_list_size,
+            slicing_arguments=slicing_arguments,
+            maxsize=maxsize,
+        )
+
+    def for_operation(self) -> QueryCostLimiter:
+        return copy(self)
+
+    def on_execute(self) -> Iterator[None]:
+        execution_context = self.execution_context
+
+        if execution_context.result is None:
+            self.cost = self.analyzer.cost(execution_context, self.max_cost)
+
+            if self.cost > self.max_cost:
+                error = GraphQLError(
+                    f"Query cost of {self.cost} exceeds the maximum of {self.max_cost}"
+                )
+                execution_context.result = GraphQLExecutionResult(
+                    data=None, errors=[error]
+                )
+
+        yield
+
+    def get_results(self) -> dict[str, Any]:
+        if self.cost is None:
+            return {}
+
+        return {"cost": {"requested": self.cost, "maximum": self.max_cost}}
+
+
+__all__ = [
+    "FieldCostEstimate",
+    "ListSizeEstimate",
+    "QueryCostAnalyzer",
+    "QueryCostLimiter",
+]
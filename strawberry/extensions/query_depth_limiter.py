@@ -28,7 +28,7 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+import weakref
 from typing import (
     TYPE_CHECKING,
     Callable,
@@ -69,12 +69,32 @@ FieldArgumentType = Union[
 FieldArgumentsType = dict[str, FieldArgumentType]
 
 
-@dataclass
 class IgnoreContext:
-    field_name: str
-    field_args: FieldArgumentsType
-    node: Node
-    context: ValidationContext
+    """The field passed to `should_ignore`.
+
+    When `field_args` is `None`, the arguments are only read from `node` the
+    first time they are accessed.
+    """
+
+    def __init__(
+        self,
+        field_name: str,
+        field_args: Optional[FieldArgumentsType],
+        node: Node,
+        context: ValidationContext,
+    ) -> None:
+        self.field_name = field_name
+        self._field_args = field_args
+        self.node = node
+        self.context = context
+
+    @property
+    def field_args(self) -> FieldArgumentsType:
+        if self._field_args is None:
+            assert isinstance(self.node, FieldNode)
+            self._field_args = get_field_arguments(self.node)
+
+        return self._field_args
 
 
 ShouldIgnoreType = Callable[[IgnoreContext], bool]
@@ -125,28 +145,56 @@ def create_validator(
     should_ignore: Optional[ShouldIgnoreType],
     callback: Optional[Callable[[dict[str, int]], None]] = None,
 ) -> type[ValidationRule]:
+    # documents returned by the parser cache are reused across requests, so
+    # their depths are kept for as long as they are alive
+    depths_cache: dict[int, dict[str, int]] = {}
+
+    def get_query_depths(validation_context: ValidationContext) -> dict[str, int]:
+        document = validation_context.document
+        query_depths = depths_cache.get(id(document))
+
+        if query_depths is not None:
+            return query_depths
+
+        definitions = document.definitions
+        fragments = get_fragments(definitions)
+        queries = get_queries_and_mutations(definitions)
+        fragment_depths: dict[str, int] = {}
+
+        query_depths = {
+            name: determine_depth(
+                node=query,
+                fragments=fragments,
+                depth_so_far=0,
+                max_depth=max_depth,
+                context=validation_context,
+                should_ignore=should_ignore,
+                fragment_depths=fragment_depths,
+            )
+            for name, query in queries.items()
+        }
+
+        depths_cache[id(document)] = query_depths
+        weakref.finalize(document, depths_cache.pop, id(document), None)
+
+        return query_depths
+
     class DepthLimitValidator(ValidationRule):
         def __init__(self, validation_context: ValidationContext) -> None:
-            document = validation_context.document
-            definitions = document.definitions
-
-            fragments = get_fragments(definitions)
-            queries = get_queries_and_mutations(definitions)
-            query_depths = {}
-
-            for query in queries:
-                query_depths[query] = determine_depth(
-                    node=queries[query],
-                    fragments=fragments,
-                    depth_so_far=0,
-                    max_depth=max_depth,
-                    context=validation_context,
-                    operation_name=query,
-                    should_ignore=should_ignore,
-                )
+            query_depths = get_query_depths(validation_context)
+            queries = get_queries_and_mutations(validation_context.document.definitions)
+
+            for name, depth in query_depths.items():
+                if depth > max_depth:
+                    validation_context.report_error(
+                        GraphQLError(
+                            f"'{name}' exceeds maximum operation depth of {max_depth}",
+                            [queries[name]],
+                        )
+                    )
 
             if callable(callback):
-                callback(query_depths)
+                callback(dict(query_depths))
             super().__init__(validation_context)
 
     return DepthLimitValidator
@@ -217,37 +265,31 @@ def determine_depth(
     depth_so_far: int,
     max_depth: int,
     context: ValidationContext,
-    operation_name: str,
     should_ignore: Optional[ShouldIgnoreType],
+    fragment_depths: dict[str, int],
 ) -> int:
-    if depth_so_far > max_depth:
-        context.report_error(
-            GraphQLError(
-                f"'{operation_name}' exceeds maximum operation depth of {max_depth}",
-                [node],
-            )
-        )
-        return depth_so_far
+    """Returns the depth of the selections of `node`, relative to it.
 
+    Selections are not explored any further once `max_depth` is exceeded, so
+    depths larger than `max_depth` are not exact. The depth of each fragment
+    is computed once and stored in `fragment_depths`.
+    """
     if isinstance(node, FieldNode):
+        if not node.selection_set:
+            return 0
+
         # by default, ignore the introspection fields which begin
         # with double underscores
-        should_ignore_field = is_introspection_key(node.name.value) or (
-            should_ignore(
-                IgnoreContext(
-                    get_field_name(node),
-                    get_field_arguments(node),
-                    node,
-                    context,
-                )
-            )
-            if should_ignore is not None
-            else False
-        )
-
-        if should_ignore_field or not node.selection_set:
+        if is_introspection_key(node.name.value) or (
+            should_ignore is not None
+            and should_ignore(IgnoreContext(get_field_name(node), None, node, context))
+        ):
             return 0
 
+        if depth_so_far >= max_depth:
+            # this field is already one level too deep
+            return 1
+
         return 1 + max(
             determine_depth(
                 node=selection,
@@ -255,21 +297,35 @@ def determine_depth(
                 depth_so_far=depth_so_far + 1,
                 max_depth=max_depth,
                 context=context,
-                operation_name=operation_name,
                 should_ignore=should_ignore,
+                fragment_depths=fragment_depths,
             )
             for selection in node.selection_set.selections
         )
     if isinstance(node, FragmentSpreadNode):
-        return determine_depth(
-            node=fragments[node.name.value],
-            fragments=fragments,
-            depth_so_far=depth_so_far,
-            max_depth=max_depth,
-            context=context,
-            operation_name=operation_name,
-            should_ignore=should_ignore,
-        )
+        name = node.name.value
+        depth = fragment_depths.get(name)
+
+        if depth is None:
+            fragment = fragments.get(name)
+
+            if fragment is None:
+                # unknown fragments are reported by another rule
+                return 0
+
+            # cycles are reported by another rule, this stops the recursion
+            fragment_depths[name] = 0
+            depth = fragment_depths[name] = determine_depth(
+                node=fragment,
+                fragments=fragments,
+                depth_so_far=0,
+                max_depth=max_depth,
+                context=context,
+                should_ignore=should_ignore,
+                fragment_depths=fragment_depths,
+            )
+
+        return depth
     if isinstance(
         node, (InlineFragmentNode, FragmentDefinitionNode, OperationDefinitionNode)
     ):
@@ -280,8 +336,8 @@ def determine_depth(
                 depth_so_far=depth_so_far,
                 max_depth=max_depth,
                 context=context,
-                operation_name=operation_name,
                 should_ignore=should_ignore,
+                fragment_depths=fragment_depths,
             )
             for selection in node.selection_set.selections
         )
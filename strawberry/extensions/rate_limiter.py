@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import math
+import time
+from copy import copy
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from graphql import GraphQLError
+from graphql.execution import ExecutionResult as GraphQLExecutionResult
+
+from strawberry.extensions.base_extension import SchemaExtension
+from strawberry.extensions.query_cost import QueryCostAnalyzer
+from strawberry.utils.await_maybe import await_maybe
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Hashable, Iterator
+
+
+class RateLimiterBackend:
+    """Stores the token buckets of a `RateLimiter`.
+
+    A bucket holds up to `capacity` tokens and is refilled with `refill_rate`
+    tokens per second. Buckets that were never used are full.
+    """
+
+    def available(self, key: Hashable, capacity: float, refill_rate: float) -> float:
+        """Returns the number of tokens in the bucket of `key`."""
+        raise NotImplementedError
+
+    def consume(
+        self, key: Hashable, tokens: float, capacity: float, refill_rate: float
+    ) -> float:
+        """Takes `tokens` from the bucket of `key` if it holds enough of them.
+
+        Returns 0 when the tokens were taken, otherwise the number of seconds
+        until the bucket holds enough tokens.
+        """
+        raise NotImplementedError
+
+
+class AsyncRateLimiterBackend:
+    """Stores the token buckets of a `RateLimiter` in a shared store.
+
+    This is the asynchronous version of `RateLimiterBackend`, for stores
+    reached over the network, such as Redis, where the buckets are shared by
+    several processes. Implementations should update a bucket atomically on
+    the store side.
+    """
+
+    async def available(
+        self, key: Hashable, capacity: float, refill_rate: float
+    ) -> float:
+        """Returns the number of tokens in the bucket of `key`."""
+        raise NotImplementedError
+
+    async def consume(
+        self, key: Hashable, tokens: float, capacity: float, refill_rate: float
+    ) -> float:
+        """Takes `tokens` from the bucket of `key` if it holds enough of them.
+
+        Returns 0 when the tokens were taken, otherwise the number of seconds
+        until the bucket holds enough tokens.
+        """
+        raise NotImplementedError
+
+
+class InMemoryRateLimiterBackend(RateLimiterBackend):
+    """Keeps the token buckets in the memory of the current process.
+
+    Buckets are spread over `shards` dictionaries and stored as immutable
+    `(tokens, timestamp)` tuples, so that they are updated without locks: a
+    bucket is read and replaced by a single dictionary operation each. Under
+    contention between threads a few operations may be let through on the
+    same tokens, which is accepted in exchange for never blocking. Within a
+    single event loop the updates are exact.
+
+    A shard holds at most `max_keys_per_shard` buckets. Once it is full, the
+    buckets that are full again, and so behave like new buckets, are dropped
+    from it, along with the least recently used ones if that isn't enough to
+    free a tenth of the shard.
+    """
+
+    def __init__(
+        self,
+        *,
+        shards: int = 16,
+        max_keys_per_shard: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_keys_per_shard = max_keys_per_shard
+        self.clock = clock
+        self._shards: list[dict[Hashable, tuple[float, float]]] = [
+            {} for _ in range(shards)
+        ]
+
+    def _get_shard(self, key: Hashable) -> dict[Hashable, tuple[float, float]]:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _refill(
+        self,
+        shard: dict[Hashable, tuple[float, float]],
+        key: Hashable,
+        now: float,
+        capacity: float,
+        refill_rate: float,
+    ) -> float:
+        bucket = shard.get(key)
+
+        if bucket is None:
+            return capacity
+
+        tokens, updated_at = bucket
+
+        return min(capacity, tokens + (now - updated_at) * refill_rate)
+
+    def available(self, key: Hashable, capacity: float, refill_rate: float) -> float:
+        return self._refill(
+            self._get_shard(key), key, self.clock(), capacity, refill_rate
+        )
+
+    def consume(
+        self, key: Hashable, tokens: float, capacity: float, refill_rate: float
+    ) -> float:
+        shard = self._get_shard(key)
+        now = self.clock()
+        available = self._refill(shard, key, now, capacity, refill_rate)
+
+        if available < tokens:
+            if tokens > capacity or refill_rate <= 0:
+                return math.inf
+
+            return (tokens - available) / refill_rate
+
+        # moved to the end of the shard, which is kept in the order buckets
+        # were last used
+        if shard.pop(key, None) is None and len(shard) >= self.max_keys_per_shard:
+            self._prune(shard, now, capacity, refill_rate)
+
+        shard[key] = (available - tokens, now)
+
+        return 0
+
+    def _prune(
+        self,
+        shard: dict[Hashable, tuple[float, float]],
+        now: float,
+        capacity: float,
+        refill_rate: float,
+    ) -> None:
+        for key, (tokens, updated_at) in list(shard.items()):
+            if tokens + (now - updated_at) * refill_rate >= capacity:
+                shard.pop(key, None)
+
+        # a tenth of the shard is freed, so that it isn't scanned again before
+        # that many new keys were added
+        excess = len(shard) - (
+            self.max_keys_per_shard - max(self.max_keys_per_shard // 10, 1)
+        )
+
+        for key in list(shard)[: max(excess, 0)]:
+            shard.pop(key, None)
+
+
+class _RateLimiterBase(SchemaExtension):
+    key: Optional[Hashable] = None
+
+    def __init__(
+        self,
+        *,
+        capacity: float,
+        refill_rate: float,
+        key: Callable[[Any], Optional[Hashable]],
+        analyzer: Optional[QueryCostAnalyzer] = None,
+        backend: Optional[Union[RateLimiterBackend, AsyncRateLimiterBackend]] = None,
+    ) -> None:
+        """Initialize the RateLimiter.
+
+        Args:
+            capacity: The number of tokens of a full bucket, that is the
+                highest cost that can be spent at once.
+            refill_rate: The number of tokens added to a bucket every second.
+            key: A function receiving the context of an operation and
+                returning the key of its bucket, for example an API key or the
+                IP address of the client. Operations for which it returns
+                `None` are not limited.
+            analyzer: The `QueryCostAnalyzer` computing the cost of operations.
+            backend: Where the buckets are stored, in memory by default.
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.get_key = key
+        self.analyzer = analyzer or QueryCostAnalyzer()
+        self.backend = backend or InMemoryRateLimiterBackend()
+
+    def for_operation(self) -> _RateLimiterBase:
+        return copy(self)
+
+    def get_cost(self) -> int:
+        # every operation costs at least one token, so that the number of
+        # operations is limited even when they only query scalars
+        return max(self.analyzer.cost(self.execution_context), 1)
+
+    def _reject_empty_bucket(self, available: float) -> None:
+        if available < 1:
+            raise self._error(
+                (1 - available) / self.refill_rate if self.refill_rate > 0 else math.inf
+            )
+
+    def _reject(self, retry_after: float) -> None:
+        if retry_after:
+            self.execution_context.result = GraphQLExecutionResult(
+                data=None, errors=[self._error(retry_after)]
+            )
+
+    def _error(self, retry_after: float) -> GraphQLError:
+        extensions: dict[str, Any] = {"code": "RATE_LIMITED"}
+
+        if math.isfinite(retry_after):
+            extensions["retryAfter"] = math.ceil(retry_after)
+
+        return GraphQLError("Rate limit exceeded", extensions=extensions)
+
+
+class RateLimiter(_RateLimiterBase):
+    """Limit the cost clients can spend over time.
+
+    Every client gets a token bucket, and the cost of its operations, as
+    estimated by `QueryCostAnalyzer`, is taken from it. Operations costing
+    more than what is left in the bucket are rejected.
+
+    Example:
+
+    ```python
+    import strawberry
+    from strawberry.extensions import RateLimiter
+
+
+    schema = strawberry.Schema(
+        Query,
+        extensions=[
+            RateLimiter(
+                capacity=1000,
+                refill_rate=10,
+                key=lambda context: context["request"].headers.get("x-api-key"),
+            ),
+        ],
+    )
+    ```
+
+    Operations of clients with an empty bucket are rejected as soon as they
+    start, before the query is parsed. The buckets can be stored in a shared
+    store by passing an `AsyncRateLimiterBackend`, see `RateLimiterSync` for
+    synchronous execution.
+    """
+
+    async def on_operation(self) -> AsyncIterator[None]:
+        self.key = self.get_key(self.execution_context.context)
+
+        if self.key is not None:
+            self._reject_empty_bucket(
+                await await_maybe(
+                    self.backend.available(self.key, self.capacity, self.refill_rate)
+                )
+            )
+
+        yield
+
+    async def on_execute(self) -> AsyncIterator[None]:
+        if self.key is not None and self.execution_context.result is None:
+            self._reject(
+                await await_maybe(
+                    self.backend.consume(
+                        self.key, self.get_cost(), self.capacity, self.refill_rate
+                    )
+                )
+            )
+
+        yield
+
+
+class RateLimiterSync(_RateLimiterBase):
+    """The synchronous version of `RateLimiter`.
+
+    It can only be used with a synchronous backend, such as the default
+    `InMemoryRateLimiterBackend`.
+    """
+
+    backend: RateLimiterBackend
+
+    def __init__(
+        self,
+        *,
+        capacity: float,
+        refill_rate: float,
+        key: Callable[[Any], Optional[Hashable]],
+        analyzer: Optional[QueryCostAnalyzer] = None,
+        backend: Optional[RateLimiterBackend] = None,
+    ) -> None:
+        if isinstance(backend, AsyncRateLimiterBackend):
+            raise TypeError(
+                "RateLimiterSync can't be used with an asynchronous backend, "
+                "use RateLimiter instead"
+            )
+
+        super().__init__(
+            capacity=capacity,
+            refill_rate=refill_rate,
+            key=key,
+            analyzer=analyzer,
+            backend=backend,
+        )
+
+    def on_operation(self) -> Iterator[None]:
+        self.key = self.get_key(self.execution_context.context)
+
+        if self.key is not None:
+            self._reject_empty_bucket(
+                self.backend.available(self.key, self.capacity, self.refill_rate)
+            )
+
+        yield
+
+    def on_execute(self) -> Iterator[None]:
+        if self.key is not None and self.execution_context.result is None:
+            self._reject(
+                self.backend.consume(
+                    self.key, self.get_cost(), self.capacity, self.refill_rate
+                )
+            )
+
+        yield
+
+
+__all__ = [
+    "AsyncRateLimiterBackend",
+    "InMemoryRateLimiterBackend",
+    "RateLimiter",
+    "RateLimiterBackend",
+    "RateLimiterSync",
+]
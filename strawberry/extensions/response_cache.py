@@ -0,0 +1,495 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+from copy import copy, deepcopy
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from graphql import (
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLInterfaceType,
+    GraphQLObjectType,
+    InlineFragmentNode,
+    OperationType,
+    get_named_type,
+    is_composite_type,
+)
+from graphql.execution import ExecutionResult as GraphQLExecutionResult
+from graphql.utilities import get_operation_ast
+
+from strawberry.extensions.base_extension import SchemaExtension
+from strawberry.extensions.utils import get_schema_directives, is_introspection_key
+from strawberry.schema_directives import CacheControl, CacheControlScope
+from strawberry.utils.await_maybe import await_maybe
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+    from graphql import (
+        DocumentNode,
+        GraphQLCompositeType,
+        GraphQLSchema,
+        SelectionSetNode,
+    )
+
+    from strawberry.types.execution import ExecutionContext
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How long, and for whom, the response of an operation can be cached."""
+
+    max_age: int
+    scope: CacheControlScope = CacheControlScope.PUBLIC
+
+    @property
+    def is_cacheable(self) -> bool:
+        return self.max_age > 0
+
+    def http_header(self, max_age: Optional[int] = None) -> str:
+        """Returns the value of the Cache-Control header for this policy."""
+        if max_age is None:
+            max_age = self.max_age
+
+        return f"max-age={max_age}, {self.scope.value.lower()}"
+
+
+class CachePolicyAnalyzer:
+    """Computes the cache policy of GraphQL operations.
+
+    The max age of an operation is the lowest max age of its fields. A field
+    gets its max age from its `CacheControl` directive, or from the directive
+    of the type it returns. Root fields and fields returning a composite type
+    without such a hint get `default_max_age`, while other fields (scalars
+    and enums) inherit the max age of their parent. The scope is `PRIVATE`
+    as soon as one of the hints is.
+
+    The policies are computed from the selections of the document, so fields
+    of fragments on all the possible types of an abstract type are taken
+    into account. They are cached per document.
+    """
+
+    def __init__(
+        self, *, default_max_age: int = 0, maxsize: Optional[int] = 128
+    ) -> None:
+        self.default_max_age = default_max_age
+        self._policy = lru_cache(maxsize=maxsize)(self.policy)
+
+    def policy_for(self, execution_context: ExecutionContext) -> CachePolicy:
+        """Returns the cache policy of the operation of the execution context."""
+        assert execution_context.graphql_document is not None
+
+        return self._policy(
+            execution_context.schema._schema,
+            execution_context.graphql_document,
+            execution_context.operation_name,
+        )
+
+    def policy(
+        self,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        operation_name: Optional[str],
+    ) -> CachePolicy:
+        """Returns the cache policy of an operation, not cacheable for mutations."""
+        operation = get_operation_ast(document, operation_name)
+
+        if operation is None or operation.operation != OperationType.QUERY:
+            return CachePolicy(max_age=0)
+
+        collector = _PolicyCollector(
+            schema,
+            {
+                definition.name.value: definition
+                for definition in document.definitions
+                if isinstance(definition, FragmentDefinitionNode)
+            },
+            self.default_max_age,
+        )
+        collector.selection_set(
+            operation.selection_set, schema.query_type, self.default_max_age, True
+        )
+
+        return CachePolicy(
+            max_age=min(collector.max_ages, default=self.default_max_age),
+            scope=collector.scope,
+        )
+
+
+class _PolicyCollector:
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        fragments: dict[str, FragmentDefinitionNode],
+        default_max_age: int,
+    ) -> None:
+        self.schema = schema
+        self.fragments = fragments
+        self.default_max_age = default_max_age
+        self.max_ages: list[int] = []
+        self.scope = CacheControlScope.PUBLIC
+
+    def selection_set(
+        self,
+        selection_set: SelectionSetNode,
+        parent_type: GraphQLCompositeType,
+        parent_max_age: int,
+        is_root: bool,
+    ) -> None:
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                self.field(selection, parent_type, parent_max_age, is_root)
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = (
+                    self.schema.get_type(selection.type_condition.name.value)
+                    if selection.type_condition
+                    else parent_type
+                )
+                self.selection_set(
+                    selection.selection_set,
+                    fragment_type,  # type: ignore[arg-type]
+                    parent_max_age,
+                    is_root,
+                )
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = self.fragments[selection.name.value]
+                self.selection_set(
+                    fragment.selection_set,
+                    self.schema.get_type(fragment.type_condition.name.value),  # type: ignore[arg-type]
+                    parent_max_age,
+                    is_root,
+                )
+
+    def field(
+        self,
+        node: FieldNode,
+        parent_type: GraphQLCompositeType,
+        parent_max_age: int,
+        is_root: bool,
+    ) -> None:
+        if is_introspection_key(node.name.value) or not isinstance(
+            parent_type, (GraphQLObjectType, GraphQLInterfaceType)
+        ):
+            return
+
+        field = parent_type.fields.get(node.name.value)
+
+        if field is None:
+            return
+
+        named_type = get_named_type(field.type)
+        hints = [
+            hint
+            for hint in (self.hint(field), self.hint(named_type))
+            if hint is not None
+        ]
+
+        if any(hint.scope == CacheControlScope.PRIVATE for hint in hints):
+            self.scope = CacheControlScope.PRIVATE
+
+        # the hint of the field takes precedence over the one of its type
+        hinted_max_age = next(
+            (hint.max_age for hint in hints if isinstance(hint.max_age, int)), None
+        )
+
+        if hinted_max_age is not None:
+            max_age = hinted_max_age
+            self.max_ages.append(max_age)
+        elif not is_root and any(hint.inherit_max_age for hint in hints):
+            max_age = parent_max_age
+        elif is_root or is_composite_type(named_type):
+            max_age = self.default_max_age
+            self.max_ages.append(max_age)
+        else:
+            max_age = parent_max_age
+
+        if node.selection_set and is_composite_type(named_type):
+            self.selection_set(
+                node.selection_set,
+                named_type,  # type: ignore[arg-type]
+                max_age,
+                False,
+            )
+
+    def hint(self, graphql_object: Any) -> Optional[CacheControl]:
+        for directive in get_schema_directives(graphql_object):
+            if isinstance(directive, CacheControl):
+                return directive
+
+        return None
+
+
+class ResponseCacheBackend:
+    """Stores the responses cached by `ResponseCache`.
+
+    The entries returned must not be shared with the cache, as responses can
+    be modified once returned.
+    """
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Returns the entry stored for `key`, `None` if missing or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: dict[str, Any], ttl: int) -> None:
+        """Stores an entry for `ttl` seconds."""
+        raise NotImplementedError
+
+
+class AsyncResponseCacheBackend:
+    """Stores the responses cached by `ResponseCache` in a shared store.
+
+    This is the asynchronous version of `ResponseCacheBackend`, for stores
+    reached over the network, such as Redis or Memcached. The entries are
+    dictionaries that can be serialized to JSON.
+    """
+
+    async def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Returns the entry stored for `key`, `None` if missing or expired."""
+        raise NotImplementedError
+
+    async def set(self, key: str, value: dict[str, Any], ttl: int) -> None:
+        """Stores an entry for `ttl` seconds."""
+        raise NotImplementedError
+
+
+class InMemoryResponseCacheBackend(ResponseCacheBackend):
+    """Keeps the cached responses in the memory of the current process.
+
+    Entries expire after their TTL, and the least recently used ones are
+    evicted once there are more than `maxsize` of them. Entries are copied
+    when stored and when returned, so that changes made to a response don't
+    reach the cache.
+    """
+
+    def __init__(
+        self, maxsize: int = 1024, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.maxsize = maxsize
+        self.clock = clock
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+
+            if expires_at <= self.clock():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+        return deepcopy(value)
+
+    def set(self, key: str, value: dict[str, Any], ttl: int) -> None:
+        value = deepcopy(value)
+
+        with self._lock:
+            self._entries[key] = (self.clock() + ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+class _ResponseCacheBase(SchemaExtension):
+    policy: Optional[CachePolicy] = None
+    key: Optional[str] = None
+
+    def __init__(
+        self,
+        *,
+        backend: Optional[
+            Union[ResponseCacheBackend, AsyncResponseCacheBackend]
+        ] = None,
+        scope_key: Optional[Callable[[Any], Optional[str]]] = None,
+        default_max_age: int = 0,
+        maxsize: Optional[int] = 128,
+    ) -> None:
+        """Initialize the ResponseCache.
+
+        Args:
+            backend: Where the responses are stored, in memory by default.
+            scope_key: A function receiving the context of an operation and
+                returning a key identifying the client, such as a user ID.
+                Responses with a `PRIVATE` scope are only cached when it
+                returns a key.
+            default_max_age: The max age of root fields and fields returning
+                a composite type without cache hint.
+            maxsize: The maximum number of documents whose cache policy is
+                cached, `None` for no limit.
+        """
+        self.backend = backend or InMemoryResponseCacheBackend()
+        self.scope_key = scope_key
+        self.analyzer = CachePolicyAnalyzer(
+            default_max_age=default_max_age, maxsize=maxsize
+        )
+
+    def for_operation(self) -> _ResponseCacheBase:
+        return copy(self)
+
+    def get_key(self) -> Optional[str]:
+        """Returns the key of the response, `None` if it can't be cached."""
+        execution_context = self.execution_context
+
+        if execution_context.result is not None or execution_context.query is None:
+            return None
+
+        self.policy = self.analyzer.policy_for(execution_context)
+
+        if not self.policy.is_cacheable:
+            return None
+
+        scope_key = None
+
+        if self.policy.scope == CacheControlScope.PRIVATE:
+            if self.scope_key is not None:
+                scope_key = self.scope_key(execution_context.context)
+
+            if scope_key is None:
+                return None
+
+        document_hash = hashlib.sha256(execution_context.query.encode()).hexdigest()
+        request = json.dumps(
+            [execution_context.operation_name, execution_context.variables, scope_key],
+            sort_keys=True,
+            default=str,
+        )
+
+        return f"{document_hash}:{hashlib.sha256(request.encode()).hexdigest()}"
+
+    def use_cached(self, entry: Optional[dict[str, Any]]) -> None:
+        if entry is None:
+            return
+
+        assert self.policy is not None
+        max_age = math.floor(entry["expires_at"] - time.time())
+
+        if max_age <= 0:
+            return
+
+        self.execution_context.result = GraphQLExecutionResult(
+            data=entry["data"], errors=None
+        )
+        self.execution_context.cache_control = self.policy.http_header(max_age)
+        self.key = None
+
+    def get_entry(self) -> Optional[dict[str, Any]]:
+        """Returns the entry to cache, `None` if the response can't be cached."""
+        result = self.execution_context.result
+
+        if self.key is None or result is None or result.errors:
+            return None
+
+        assert self.policy is not None
+        self.execution_context.cache_control = self.policy.http_header()
+
+        return {"data": result.data, "expires_at": time.time() + self.policy.max_age}
+
+
+class ResponseCache(_ResponseCacheBase):
+    """Cache whole responses, for as long as their cache hints allow.
+
+    Example:
+
+    ```python
+    import strawberry
+    from strawberry.extensions import ResponseCache
+    from strawberry.schema_directives import CacheControl
+
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(directives=[CacheControl(max_age=30)])
+        def top_products(self) -> list[Product]: ...
+
+
+    schema = strawberry.Schema(Query, extensions=[ResponseCache()])
+    ```
+
+    The cache policy of an operation is computed from the `CacheControl`
+    hints of the fields it selects, see `CachePolicyAnalyzer`. Responses are
+    cached by document, variables and, for `PRIVATE` responses, the key
+    returned by `scope_key`. Cached responses are returned without executing
+    the operation, and the HTTP integrations send the policy as a
+    Cache-Control header. See `ResponseCacheSync` for synchronous execution.
+    """
+
+    async def on_execute(self) -> AsyncIterator[None]:
+        self.key = self.get_key()
+
+        if self.key is not None:
+            self.use_cached(await await_maybe(self.backend.get(self.key)))
+
+        yield
+
+        if self.key is not None and (entry := self.get_entry()) is not None:
+            assert self.policy is not None
+            await await_maybe(self.backend.set(self.key, entry, self.policy.max_age))
+
+
+class ResponseCacheSync(_ResponseCacheBase):
+    """The synchronous version of `ResponseCache`.
+
+    It can only be used with a synchronous backend, such as the default
+    `InMemoryResponseCacheBackend`.
+    """
+
+    backend: ResponseCacheBackend
+
+    def __init__(
+        self,
+        *,
+        backend: Optional[ResponseCacheBackend] = None,
+        scope_key: Optional[Callable[[Any], Optional[str]]] = None,
+        default_max_age: int = 0,
+        maxsize: Optional[int] = 128,
+    ) -> None:
+        if isinstance(backend, AsyncResponseCacheBackend):
+            raise TypeError(
+                "ResponseCacheSync can't be used with an asynchronous backend, "
+                "use ResponseCache instead"
+            )
+
+        super().__init__(
+            backend=backend,
+            scope_key=scope_key,
+            default_max_age=default_max_age,
+            maxsize=maxsize,
+        )
+
+    def on_execute(self) -> Iterator[None]:
+        self.key = self.get_key()
+
+        if self.key is not None:
+            self.use_cached(self.backend.get(self.key))
+
+        yield
+
+        if self.key is not None and (entry := self.get_entry()) is not None:
+            assert self.policy is not None
+            self.backend.set(self.key, entry, self.policy.max_age)
+
+
+__all__ = [
+    "AsyncResponseCacheBackend",
+    "CachePolicy",
+    "CachePolicyAnalyzer",
+    "InMemoryResponseCacheBackend",
+    "ResponseCache",
+    "ResponseCacheBackend",
+    "ResponseCacheSync",
+]
@@ -3,6 +3,7 @@ from __future__ import annotations
 import inspect
 from typing import TYPE_CHECKING, Any, Optional
 
+from strawberry.extensions.base_extension import _current_execution_context
 from strawberry.extensions.context import (
     ExecutingContextManager,
     OperationContextManager,
@@ -29,32 +30,41 @@ class SchemaExtensionsRunner:
         self.extensions = extensions or []
 
     def operation(self) -> OperationContextManager:
-        return OperationContextManager(self.extensions)
+        return OperationContextManager(self.extensions, self.execution_context)
 
     def validation(self) -> ValidationContextManager:
-        return ValidationContextManager(self.extensions)
+        return ValidationContextManager(self.extensions, self.execution_context)
 
     def parsing(self) -> ParsingContextManager:
-        return ParsingContextManager(self.extensions)
+        return ParsingContextManager(self.extensions, self.execution_context)
 
     def executing(self) -> ExecutingContextManager:
-        return ExecutingContextManager(self.extensions)
+        return ExecutingContextManager(self.extensions, self.execution_context)
 
     def get_extensions_results_sync(self) -> dict[str, Any]:
         data: dict[str, Any] = {}
-        for extension in self.extensions:
-            if inspect.iscoroutinefunction(extension.get_results):
-                msg = "Cannot use async extension hook during sync execution"
-                raise RuntimeError(msg)
-            data.update(extension.get_results())  # type: ignore
+        token = _current_execution_context.set(self.execution_context)
+
+        try:
+            for extension in self.extensions:
+                if inspect.iscoroutinefunction(extension.get_results):
+                    msg = "Cannot use async extension hook during sync execution"
+                    raise RuntimeError(msg)
+                data.update(extension.get_results())  # type: ignore
+        finally:
+            _current_execution_context.reset(token)
 
         return data
 
     async def get_extensions_results(self, ctx: ExecutionContext) -> dict[str, Any]:
         data: dict[str, Any] = {}
+        token = _current_execution_context.set(self.execution_context)
 
-        for extension in self.extensions:
-            data.update(await await_maybe(extension.get_results()))
+        try:
+            for extension in self.extensions:
+                data.update(await await_maybe(extension.get_results()))
+        finally:
+            _current_execution_context.reset(token)
 
         data.update(ctx.extensions_results)
         return data
@@ -9,8 +9,6 @@ from typing import TYPE_CHECKING, Any, Callable, Optional
 from strawberry.extensions import SchemaExtension
 from strawberry.extensions.utils import get_path_from_info
 
-from .utils import should_skip_tracing
-
 if TYPE_CHECKING:
     from collections.abc import Generator
 
@@ -82,6 +80,8 @@ class ApolloTracingStats:
 
 
 class ApolloTracingExtension(SchemaExtension):
+    resolve_trivial_fields = False
+
     def __init__(self, execution_context: ExecutionContext) -> None:
         self._resolver_stats: list[ApolloResolverStats] = []
         self.execution_context = execution_context
@@ -134,14 +134,6 @@ class ApolloTracingExtension(SchemaExtension):
         *args: str,
         **kwargs: Any,
     ) -> Any:
-        if should_skip_tracing(_next, info):
-            result = _next(root, info, *args, **kwargs)
-
-            if isawaitable(result):
-                result = await result  # pragma: no cover
-
-            return result
-
         start_timestamp = self.now()
 
         resolver_stats = ApolloResolverStats(
@@ -174,9 +166,6 @@ class ApolloTracingExtensionSync(ApolloTracingExtension):
         *args: str,
         **kwargs: Any,
     ) -> Any:
-        if should_skip_tracing(_next, info):
-            return _next(root, info, *args, **kwargs)
-
         start_timestamp = self.now()
 
         resolver_stats = ApolloResolverStats(
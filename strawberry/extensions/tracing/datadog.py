@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import hashlib
+import time
+from copy import copy
 from functools import cached_property
 from inspect import isawaitable
 from typing import TYPE_CHECKING, Any, Callable, Optional
@@ -9,7 +11,7 @@ import ddtrace
 from packaging import version
 
 from strawberry.extensions import LifecycleStep, SchemaExtension
-from strawberry.extensions.tracing.utils import should_skip_tracing
+from strawberry.extensions.tracing.utils import TracingSampler
 
 parsed_ddtrace_version = version.parse(ddtrace.__version__)
 if parsed_ddtrace_version >= version.parse("3.0.0"):
@@ -19,7 +21,7 @@ else:
 
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterator
+    from collections.abc import Generator, Iterable, Iterator
 
     from graphql import GraphQLResolveInfo
 
@@ -27,14 +29,34 @@ if TYPE_CHECKING:
 
 
 class DatadogTracingExtension(SchemaExtension):
+    _sampled: bool = True
+
+    resolve_trivial_fields = False
+
     def __init__(
         self,
         *,
         execution_context: Optional[ExecutionContext] = None,
+        sample_rate: float = 1.0,
+        slow_operation_threshold: Optional[float] = None,
+        include_fields: Optional[Iterable[str]] = None,
+        exclude_fields: Optional[Iterable[str]] = None,
     ) -> None:
+        self._sampler = TracingSampler(
+            sample_rate=sample_rate,
+            slow_operation_threshold=slow_operation_threshold,
+            include_fields=include_fields,
+            exclude_fields=exclude_fields,
+        )
         if execution_context:
             self.execution_context = execution_context
 
+    def for_operation(self) -> DatadogTracingExtension:
+        return copy(self)
+
+    def should_resolve(self) -> bool:
+        return self._sampled
+
     @cached_property
     def _resource_name(self) -> str:
         if self.execution_context.query is None:
@@ -78,18 +100,47 @@ class DatadogTracingExtension(SchemaExtension):
         return hashlib.md5(query.encode("utf-8")).hexdigest()  # noqa: S324
 
     def on_operation(self) -> Iterator[None]:
+        self._sampled = self._sampler.sample_operation()
         self._operation_name = self.execution_context.operation_name
+
+        if not self._sampled:
+            yield from self._trace_unsampled_operation()
+            return
+
+        self.request_span = self._create_operation_span()
+
+        yield
+
+        self.request_span.finish()
+
+    def _trace_unsampled_operation(self) -> Iterator[None]:
+        # Only slow operations get a span, created once we know how long
+        # the operation took
+        start_ns = time.time_ns()
+
+        yield
+
+        if self._sampler.is_slow((time.time_ns() - start_ns) / 1e9):
+            if not self._operation_name:
+                self._operation_name = self.execution_context.operation_name
+
+            span = self._create_operation_span()
+            span.start_ns = start_ns
+            span.set_tag("graphql.sampled", False)
+            span.finish()
+
+    def _create_operation_span(self) -> Span:
         span_name = (
             f"{self._operation_name}" if self._operation_name else "Anonymous Query"
         )
 
-        self.request_span = self.create_span(
+        span = self.create_span(
             LifecycleStep.OPERATION,
             span_name,
             resource=self._resource_name,
             service="strawberry",
         )
-        self.request_span.set_tag("graphql.operation_name", self._operation_name)
+        span.set_tag("graphql.operation_name", self._operation_name)
 
         query = self.execution_context.query
 
@@ -104,13 +155,15 @@ class DatadogTracingExtension(SchemaExtension):
         else:
             operation_type = "query_missing"
 
-        self.request_span.set_tag("graphql.operation_type", operation_type)
+        span.set_tag("graphql.operation_type", operation_type)
 
-        yield
-
-        self.request_span.finish()
+        return span
 
     def on_validate(self) -> Generator[None, None, None]:
+        if not self._sampled:
+            yield
+            return
+
         self.validation_span = self.create_span(
             lifecycle_step=LifecycleStep.VALIDATION,
             name="Validation",
@@ -119,6 +172,10 @@ class DatadogTracingExtension(SchemaExtension):
         self.validation_span.finish()
 
     def on_parse(self) -> Generator[None, None, None]:
+        if not self._sampled:
+            yield
+            return
+
         self.parsing_span = self.create_span(
             lifecycle_step=LifecycleStep.PARSE,
             name="Parsing",
@@ -134,7 +191,7 @@ class DatadogTracingExtension(SchemaExtension):
         *args: str,
         **kwargs: Any,
     ) -> Any:
-        if should_skip_tracing(_next, info):
+        if not self._sampler.should_trace_field(info):
             result = _next(root, info, *args, **kwargs)
 
             if isawaitable(result):  # pragma: no cover
@@ -170,7 +227,7 @@ class DatadogTracingExtensionSync(DatadogTracingExtension):
         *args: str,
         **kwargs: Any,
     ) -> Any:
-        if should_skip_tracing(_next, info):
+        if not self._sampler.should_trace_field(info):
             return _next(root, info, *args, **kwargs)
 
         field_path = f"{info.parent_type}.{info.field_name}"
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from copy import deepcopy
+import time
+from copy import copy, deepcopy
 from inspect import isawaitable
 from typing import (
     TYPE_CHECKING,
@@ -11,12 +12,12 @@ from typing import (
 )
 
 from opentelemetry import trace
-from opentelemetry.trace import SpanKind
+from opentelemetry.trace import NonRecordingSpan, SpanKind
 
 from strawberry.extensions import LifecycleStep, SchemaExtension
 from strawberry.extensions.utils import get_path_from_info
 
-from .utils import should_skip_tracing
+from .utils import TracingSampler
 
 if TYPE_CHECKING:
     from collections.abc import Generator, Iterable
@@ -36,6 +37,9 @@ class OpenTelemetryExtension(SchemaExtension):
     _arg_filter: Optional[ArgFilter]
     _span_holder: dict[LifecycleStep, Span]
     _tracer: Tracer
+    _sampled: bool = True
+
+    resolve_trivial_fields = False
 
     def __init__(
         self,
@@ -43,30 +47,40 @@ class OpenTelemetryExtension(SchemaExtension):
         execution_context: Optional[ExecutionContext] = None,
         arg_filter: Optional[ArgFilter] = None,
         tracer_provider: Optional[trace.TracerProvider] = None,
+        sample_rate: float = 1.0,
+        slow_operation_threshold: Optional[float] = None,
+        include_fields: Optional[Iterable[str]] = None,
+        exclude_fields: Optional[Iterable[str]] = None,
     ) -> None:
         self._arg_filter = arg_filter
         self._tracer = trace.get_tracer("strawberry", tracer_provider=tracer_provider)
+        self._sampler = TracingSampler(
+            sample_rate=sample_rate,
+            slow_operation_threshold=slow_operation_threshold,
+            include_fields=include_fields,
+            exclude_fields=exclude_fields,
+        )
         self._span_holder = {}
         if execution_context:
             self.execution_context = execution_context
 
+    def for_operation(self) -> OpenTelemetryExtension:
+        extension = copy(self)
+        extension._span_holder = {}
+        return extension
+
+    def should_resolve(self) -> bool:
+        return self._sampled
+
     def on_operation(self) -> Generator[None, None, None]:
+        self._sampled = self._sampler.sample_operation()
         self._operation_name = self.execution_context.operation_name
-        span_name = (
-            f"GraphQL Query: {self._operation_name}"
-            if self._operation_name
-            else "GraphQL Query"
-        )
 
-        self._span_holder[LifecycleStep.OPERATION] = self._tracer.start_span(
-            span_name, kind=SpanKind.SERVER
-        )
-        self._span_holder[LifecycleStep.OPERATION].set_attribute("component", "graphql")
+        if not self._sampled:
+            yield from self._trace_unsampled_operation()
+            return
 
-        if self.execution_context.query:
-            self._span_holder[LifecycleStep.OPERATION].set_attribute(
-                "query", self.execution_context.query
-            )
+        self._span_holder[LifecycleStep.OPERATION] = self._start_operation_span()
 
         yield
         # If the client doesn't provide an operation name then GraphQL will
@@ -79,7 +93,49 @@ class OpenTelemetryExtension(SchemaExtension):
             self._span_holder[LifecycleStep.OPERATION].update_name(span_name)
         self._span_holder[LifecycleStep.OPERATION].end()
 
+    def _start_operation_span(self, start_time: Optional[int] = None) -> Span:
+        span_name = (
+            f"GraphQL Query: {self._operation_name}"
+            if self._operation_name
+            else "GraphQL Query"
+        )
+
+        if start_time is None:
+            span = self._tracer.start_span(span_name, kind=SpanKind.SERVER)
+        else:
+            span = self._tracer.start_span(
+                span_name, kind=SpanKind.SERVER, start_time=start_time
+            )
+
+        span.set_attribute("component", "graphql")
+
+        if self.execution_context.query:
+            span.set_attribute("query", self.execution_context.query)
+
+        return span
+
+    def _trace_unsampled_operation(self) -> Generator[None, None, None]:
+        # Only slow operations get a span, created once we know how long
+        # the operation took
+        start_time = time.time_ns()
+
+        yield
+
+        if not self._sampler.is_slow((time.time_ns() - start_time) / 1e9):
+            return
+
+        if not self._operation_name:
+            self._operation_name = self.execution_context.operation_name
+
+        span = self._start_operation_span(start_time=start_time)
+        span.set_attribute("graphql.sampled", False)
+        span.end()
+
     def on_validate(self) -> Generator[None, None, None]:
+        if not self._sampled:
+            yield
+            return
+
         ctx = trace.set_span_in_context(self._span_holder[LifecycleStep.OPERATION])
         self._span_holder[LifecycleStep.VALIDATION] = self._tracer.start_span(
             "GraphQL Validation",
@@ -89,6 +145,10 @@ class OpenTelemetryExtension(SchemaExtension):
         self._span_holder[LifecycleStep.VALIDATION].end()
 
     def on_parse(self) -> Generator[None, None, None]:
+        if not self._sampled:
+            yield
+            return
+
         ctx = trace.set_span_in_context(self._span_holder[LifecycleStep.OPERATION])
         self._span_holder[LifecycleStep.PARSE] = self._tracer.start_span(
             "GraphQL Parsing", context=ctx
@@ -144,7 +204,9 @@ class OpenTelemetryExtension(SchemaExtension):
         span.set_attribute("graphql.parentType", info.parent_type.name)
         span.set_attribute("graphql.path", graphql_path)
 
-        if kwargs:
+        # Converting the arguments can be expensive, skip it when the span
+        # was dropped by the tracer's sampler
+        if kwargs and not isinstance(span, NonRecordingSpan):
             filtered_kwargs = self.filter_resolver_args(kwargs, info)
 
             for kwarg, value in filtered_kwargs.items():
@@ -159,7 +221,7 @@ class OpenTelemetryExtension(SchemaExtension):
         *args: str,
         **kwargs: Any,
     ) -> Any:
-        if should_skip_tracing(_next, info):
+        if not self._sampler.should_trace_field(info):
             result = _next(root, info, *args, **kwargs)
 
             if isawaitable(result):  # pragma: no cover
@@ -191,7 +253,7 @@ class OpenTelemetryExtensionSync(OpenTelemetryExtension):
         *args: str,
         **kwargs: Any,
     ) -> Any:
-        if should_skip_tracing(_next, info):
+        if not self._sampler.should_trace_field(info):
             return _next(root, info, *args, **kwargs)
 
         with self._tracer.start_as_current_span(
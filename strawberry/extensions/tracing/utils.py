@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable
+import random
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from strawberry.extensions.utils import is_introspection_field
 from strawberry.resolvers import is_default_resolver
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from graphql import GraphQLResolveInfo
 
 
@@ -20,4 +23,80 @@ def should_skip_tracing(resolver: Callable[..., Any], info: GraphQLResolveInfo)
     )
 
 
-__all__ = ["should_skip_tracing"]
+def _parse_field_coordinates(
+    coordinates: Optional[Iterable[str]],
+) -> Optional[dict[str, frozenset[str]]]:
+    if coordinates is None:
+        return None
+
+    fields: dict[str, set[str]] = {}
+
+    for coordinate in coordinates:
+        type_name, _, field_name = coordinate.partition(".")
+
+        if not field_name:
+            raise ValueError(
+                f"Invalid field {coordinate!r}, expected `Type.field` or `Type.*`"
+            )
+
+        fields.setdefault(type_name, set()).add(field_name)
+
+    return {type_name: frozenset(names) for type_name, names in fields.items()}
+
+
+class TracingSampler:
+    """Decide which operations and fields the tracing extensions trace.
+
+    Operations are sampled when they start (head-based sampling), with a
+    probability of `sample_rate`. When `slow_operation_threshold` (in
+    seconds) is set, operations that weren't sampled but took longer than
+    that still get their operation span.
+
+    Fields are given as `Type.field` coordinates, `Type.*` matches all the
+    fields of a type. When `include_fields` is set only those fields are
+    traced, fields in `exclude_fields` are never traced.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        slow_operation_threshold: Optional[float] = None,
+        include_fields: Optional[Iterable[str]] = None,
+        exclude_fields: Optional[Iterable[str]] = None,
+    ) -> None:
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+
+        self.sample_rate = sample_rate
+        self.slow_operation_threshold = slow_operation_threshold
+        self._include_fields = _parse_field_coordinates(include_fields)
+        self._exclude_fields = _parse_field_coordinates(exclude_fields)
+
+    def sample_operation(self) -> bool:
+        return self.sample_rate >= 1 or random.random() < self.sample_rate  # noqa: S311
+
+    def is_slow(self, duration: float) -> bool:
+        return (
+            self.slow_operation_threshold is not None
+            and duration >= self.slow_operation_threshold
+        )
+
+    def should_trace_field(self, info: GraphQLResolveInfo) -> bool:
+        type_name = info.parent_type.name
+
+        if self._include_fields is not None:
+            fields = self._include_fields.get(type_name)
+
+            if fields is None or (info.field_name not in fields and "*" not in fields):
+                return False
+
+        if self._exclude_fields is not None:
+            fields = self._exclude_fields.get(type_name)
+
+            if fields is not None and (info.field_name in fields or "*" in fields):
+                return False
+
+        return True
+
+
+__all__ = ["TracingSampler", "should_skip_tracing"]
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Any, Union
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from graphql import GraphQLResolveInfo
 
 
@@ -37,4 +39,16 @@ def get_path_from_info(info: GraphQLResolveInfo) -> list[str]:
     return elements[::-1]
 
 
-__all__ = ["get_path_from_info", "is_introspection_field", "is_introspection_key"]
+def get_schema_directives(graphql_object: Any) -> Iterable[object]:
+    """Returns the schema directives of a GraphQL type or field."""
+    definition = graphql_object.extensions.get("strawberry-definition")
+
+    return getattr(definition, "directives", None) or ()
+
+
+__all__ = [
+    "get_path_from_info",
+    "get_schema_directives",
+    "is_introspection_field",
+    "is_introspection_key",
+]
@@ -259,8 +259,14 @@ class GraphQLRouter(
         ) -> None:
             await self.run(request=websocket, context=context, root_value=root_value)
 
-    async def render_graphql_ide(self, request: Request) -> HTMLResponse:
-        return HTMLResponse(self.graphql_ide_html)
+    async def render_graphql_ide(self, request: Request) -> Response:
+        html = self.graphql_ide_html
+        headers = self.get_graphql_ide_headers(html)
+
+        if self.is_graphql_ide_not_modified(request.headers, headers):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return HTMLResponse(html, headers=headers)
 
     async def get_context(
         self, request: Union[Request, WebSocket], response: Union[Response, WebSocket]
@@ -61,6 +61,7 @@ def field(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[list[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    timeout: Optional[float] = None,
 ) -> T: ...
 
 
@@ -90,6 +91,7 @@ def field(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[list[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    timeout: Optional[float] = None,
 ) -> T: ...
 
 
@@ -118,6 +120,7 @@ def field(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[list[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    timeout: Optional[float] = None,
 ) -> Any: ...
 
 
@@ -146,6 +149,7 @@ def field(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[list[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    timeout: Optional[float] = None,
 ) -> StrawberryField: ...
 
 
@@ -174,6 +178,7 @@ def field(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[list[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    timeout: Optional[float] = None,
 ) -> StrawberryField: ...
 
 
@@ -201,6 +206,7 @@ def field(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[list[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    timeout: Optional[float] = None,
     # This init parameter is used by PyRight to determine whether this field
     # is added in the constructor or not. It is not used to change
     # any behavior at the moment.
@@ -269,6 +275,7 @@ def field(
         metadata=metadata,
         extensions=extensions,
         graphql_type=graphql_type,
+        timeout=timeout,
     )
 
 
@@ -1,6 +1,8 @@
+import asyncio
 from collections import defaultdict
-from collections.abc import Iterable, Mapping
+from collections.abc import Awaitable, Iterable, Mapping
 from functools import cached_property
+from inspect import isawaitable
 from itertools import chain
 from typing import (
     TYPE_CHECKING,
@@ -12,7 +14,6 @@ from typing import (
 )
 
 from strawberry.annotation import StrawberryAnnotation
-from strawberry.printer import print_schema
 from strawberry.schema import Schema as BaseSchema
 from strawberry.types.base import (
     StrawberryContainer,
@@ -34,6 +35,7 @@ if TYPE_CHECKING:
     from strawberry.federation.schema_directives import ComposeDirective
     from strawberry.schema.config import StrawberryConfig
     from strawberry.schema_directive import StrawberrySchemaDirective
+    from strawberry.types.arguments import ArgumentConverter
     from strawberry.types.enum import EnumDefinition
     from strawberry.types.scalar import ScalarDefinition, ScalarWrapper
 
@@ -76,6 +78,7 @@ class Schema(BaseSchema):
         )
 
         self.schema_directives = list(schema_directives)
+        self._entity_resolvers: dict[str, _EntityResolver] = {}
 
         if enable_federation_2:
             composed_directives = self._add_compose_directives()
@@ -111,7 +114,7 @@ class Schema(BaseSchema):
         @strawberry.type(name="_Service")
         class Service:
             sdl: str = strawberry.field(
-                resolver=lambda: print_schema(self),
+                resolver=lambda: self.as_str(),
             )
 
         @strawberry.field(name="_service")
@@ -152,45 +155,91 @@ class Schema(BaseSchema):
     def entities_resolver(
         self, info: Info, representations: list[FederationAny]
     ) -> list[FederationAny]:
-        results = []
+        results: list[Any] = [None] * len(representations)
+        batches: dict[str, list[int]] = defaultdict(list)
 
-        for representation in representations:
-            type_name = representation.pop("__typename")
-            type_ = self.schema_converter.type_map[type_name]
+        for index, representation in enumerate(representations):
+            type_name = representation["__typename"]
+            entity = self._get_entity_resolver(type_name)
 
-            definition = cast("StrawberryObjectDefinition", type_.definition)
-
-            if hasattr(definition.origin, "resolve_reference"):
-                resolve_reference = definition.origin.resolve_reference
-
-                func_args = get_func_args(resolve_reference)
-                kwargs = representation
+            if entity.resolve_references is not None:
+                batches[type_name].append(index)
+            elif entity.resolve_reference is not None:
+                kwargs = _without_typename(representation)
 
                 # TODO: use the same logic we use for other resolvers
-                if "info" in func_args:
+                if entity.pass_info:
                     kwargs["info"] = info
 
                 try:
-                    result = resolve_reference(**kwargs)
+                    results[index] = entity.resolve_reference(**kwargs)
                 except Exception as e:  # noqa: BLE001
-                    result = e
+                    results[index] = e
             else:
-                from strawberry.types.arguments import convert_argument
+                results[index] = entity.convert(representation)
 
-                config = info.schema.config
-                scalar_registry = info.schema.schema_converter.scalar_registry
+        pending: list[tuple[str, list[int], Awaitable[Any]]] = []
 
-                try:
-                    result = convert_argument(
-                        representation,
-                        type_=definition.origin,
-                        scalar_registry=scalar_registry,
-                        config=config,
-                    )
-                except Exception:  # noqa: BLE001
-                    result = TypeError(f"Unable to resolve reference for {type_name}")
+        for type_name, indexes in batches.items():
+            entity = self._entity_resolvers[type_name]
+            assert entity.resolve_references is not None
 
-            results.append(result)
+            kwargs = {
+                "representations": [
+                    _without_typename(representations[index]) for index in indexes
+                ]
+            }
+
+            if entity.pass_info:
+                kwargs["info"] = info
+
+            try:
+                batch = entity.resolve_references(**kwargs)
+            except Exception as e:  # noqa: BLE001
+                batch = e
+
+            # sync hooks can also return awaitables, like DataLoader.load_many
+            if isawaitable(batch):
+                pending.append((type_name, indexes, batch))
+            else:
+                _stitch_references(results, type_name, indexes, batch)
+
+        if pending:
+            return self._gather_references(results, pending)  # type: ignore
+
+        return results
+
+    def _get_entity_resolver(self, type_name: str) -> "_EntityResolver":
+        """Returns how representations of `type_name` are resolved.
+
+        Resolvers are built the first time a type is looked up, as only the
+        entity types are ever resolved.
+        """
+        entity = self._entity_resolvers.get(type_name)
+
+        if entity is None:
+            definition = self.schema_converter.type_map[type_name].definition
+            entity = _EntityResolver(
+                cast("StrawberryObjectDefinition", definition), self
+            )
+            self._entity_resolvers[type_name] = entity
+
+        return entity
+
+    async def _gather_references(
+        self,
+        results: list[Any],
+        pending: list[tuple[str, list[int], Awaitable[Any]]],
+    ) -> list[Any]:
+        batches = await asyncio.gather(
+            *(batch for _, _, batch in pending), return_exceptions=True
+        )
+
+        for (type_name, indexes, _), batch in zip(pending, batches):
+            if isinstance(batch, BaseException) and not isinstance(batch, Exception):
+                raise batch
+
+            _stitch_references(results, type_name, indexes, batch)
 
         return results
 
@@ -311,6 +360,104 @@ class Schema(BaseSchema):
         pass
 
 
+class _EntityResolver:
+    """How the representations of an entity type are turned into objects.
+
+    Everything that only depends on the type is looked up once, the first
+    time the type is resolved, rather than for each representation.
+    """
+
+    def __init__(self, definition: StrawberryObjectDefinition, schema: Schema) -> None:
+        origin = definition.origin
+
+        self.type_name = definition.name
+        self.origin = origin
+        self.resolve_reference = getattr(origin, "resolve_reference", None)
+        self.resolve_references = getattr(origin, "resolve_references", None)
+        self.pass_info = False
+
+        if resolver := self.resolve_references or self.resolve_reference:
+            self.pass_info = "info" in get_func_args(resolver)
+
+        # (graphql name, python name, converter), the converter is None for
+        # scalars, which are passed as they are
+        self.fields: list[tuple[str, str, Optional[ArgumentConverter]]] = []
+
+        if self.resolve_reference is None and self.resolve_references is None:
+            from strawberry.relay.types import GlobalID
+            from strawberry.types.arguments import (
+                _is_leaf_type,
+                get_argument_converter,
+            )
+
+            schema_converter = schema.schema_converter
+
+            for field in definition.fields:
+                field_type = field.resolve_type(type_definition=definition)
+                is_leaf = _is_leaf_type(
+                    field_type,
+                    schema_converter.scalar_registry,
+                    skip_classes=(GlobalID,),
+                )
+
+                self.fields.append(
+                    (
+                        schema.config.name_converter.from_field(field),
+                        field.python_name,
+                        None
+                        if is_leaf
+                        else get_argument_converter(
+                            field_type,
+                            schema_converter.scalar_registry,
+                            schema.config,
+                            schema_converter.argument_converters,
+                        ),
+                    )
+                )
+
+    def convert(self, representation: Mapping[str, Any]) -> Any:
+        """Instantiates the type with the fields of the representation."""
+        kwargs = {}
+
+        try:
+            for graphql_name, python_name, convert in self.fields:
+                if graphql_name not in representation:
+                    continue
+
+                value = representation[graphql_name]
+
+                if convert is not None:
+                    value = convert(value)
+
+                kwargs[python_name] = value
+
+            return self.origin(**kwargs)
+        except Exception:  # noqa: BLE001
+            return TypeError(f"Unable to resolve reference for {self.type_name}")
+
+
+def _without_typename(representation: Mapping[str, Any]) -> dict[str, Any]:
+    # a copy, since the representations are the variables of the operation
+    return {key: value for key, value in representation.items() if key != "__typename"}
+
+
+def _stitch_references(
+    results: list[Any], type_name: str, indexes: list[int], batch: Any
+) -> None:
+    """Puts the entities returned by `resolve_references` back in place."""
+    if not isinstance(batch, Exception):
+        batch = list(batch)
+
+        if len(batch) != len(indexes):
+            batch = TypeError(
+                f"`resolve_references` of {type_name} returned {len(batch)} "
+                f"entities for {len(indexes)} representations"
+            )
+
+    for position, index in enumerate(indexes):
+        results[index] = batch if isinstance(batch, Exception) else batch[position]
+
+
 def _get_entity_type(
     query: Optional[type[WithStrawberryObjectDefinition]],
     mutation: Optional[type[WithStrawberryObjectDefinition]],
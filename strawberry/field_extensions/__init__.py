@@ -1,5 +1,7 @@
+from .cached_field import CachedField
 from .input_mutation import InputMutationExtension
 
 __all__ = [
+    "CachedField",
     "InputMutationExtension",
 ]
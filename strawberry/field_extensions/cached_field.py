@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from strawberry.extensions.base_extension import get_execution_context
+from strawberry.extensions.field_extension import (
+    AsyncExtensionResolver,
+    FieldExtension,
+    SyncExtensionResolver,
+)
+from strawberry.utils.await_maybe import await_maybe
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from strawberry.types.info import Info
+
+
+class CachedFieldBackend:
+    """Stores the values cached by `CachedField` between operations.
+
+    The methods can be coroutines when the field's resolver is async, to use
+    stores reached over the network.
+    """
+
+    def load(self, key: Hashable) -> Any:
+        """Returns the value stored for `key`.
+
+        Raises `KeyError` when there is no value, or when it expired.
+        """
+        raise NotImplementedError
+
+    def store(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Stores a value for `ttl` seconds."""
+        raise NotImplementedError
+
+
+class InMemoryCachedFieldBackend(CachedFieldBackend):
+    """Keeps the cached values in the memory of the current process.
+
+    Values expire after their TTL, and the least recently used ones are
+    evicted once there are more than `maxsize` of them.
+    """
+
+    def __init__(
+        self, maxsize: int = 1024, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.maxsize = maxsize
+        self.clock = clock
+        self._values: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, key: Hashable) -> Any:
+        with self._lock:
+            expires_at, value = self._values[key]
+
+            if expires_at <= self.clock():
+                del self._values[key]
+                raise KeyError(key)
+
+            self._values.move_to_end(key)
+
+            return value
+
+    def store(self, key: Hashable, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._values[key] = (self.clock() + ttl, value)
+            self._values.move_to_end(key)
+
+            while len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+
+
+class _RequestCache:
+    __slots__ = ("in_flight", "values")
+
+    def __init__(self) -> None:
+        self.values: dict[Hashable, Any] = {}
+        self.in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+
+
+def freeze_arguments(value: Any) -> Hashable:
+    """Turns converted arguments into a hashable value, to be used in keys."""
+    if isinstance(value, dict):
+        return tuple(
+            sorted((key, freeze_arguments(item)) for key, item in value.items())
+        )
+
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_arguments(item) for item in value)
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze_arguments(item) for item in value)
+
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return (
+            type(value),
+            tuple(
+                (field.name, freeze_arguments(getattr(value, field.name)))
+                for field in dataclasses.fields(value)
+            ),
+        )
+
+    return value
+
+
+class CachedField(FieldExtension):
+    """Memoize the results of a resolver.
+
+    Example:
+
+    ```python
+    import strawberry
+    from strawberry.field_extensions import CachedField
+
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(extensions=[CachedField(ttl=5)])
+        def exchange_rate(self, currency: str) -> float:
+            return rates.fetch(currency)
+    ```
+
+    Results are cached by field and arguments, and by the key returned by
+    `parent_key` for fields whose value depends on the object they belong to.
+    Without `ttl`, they are only kept for the current operation. With a
+    `ttl`, they are shared by all the operations of the process, or stored in
+    `backend`. Errors are never cached.
+
+    Concurrent calls of an async resolver with the same key share the same
+    call, rather than all calling the resolver.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: Optional[float] = None,
+        parent_key: Optional[Callable[[Any], Hashable]] = None,
+        backend: Optional[CachedFieldBackend] = None,
+        maxsize: int = 1024,
+    ) -> None:
+        """Initialize the CachedField.
+
+        Args:
+            ttl: For how many seconds results are kept across operations,
+                `None` to only keep them for the current operation.
+            parent_key: A function receiving the parent object of the field
+                and returning a hashable key identifying it.
+            backend: Where results are stored when a `ttl` is set, in memory
+                by default.
+            maxsize: The maximum number of results kept in memory when a `ttl`
+                is set and no backend is passed.
+        """
+        if backend is not None and ttl is None:
+            raise ValueError("CachedField needs a ttl to be used with a backend")
+
+        self.ttl = ttl
+        self.parent_key = parent_key
+        self.backend = backend
+
+        if self.backend is None and ttl is not None:
+            self.backend = InMemoryCachedFieldBackend(maxsize)
+
+        self._in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._request_caches: dict[int, _RequestCache] = {}
+
+    def get_key(self, source: Any, info: Info, kwargs: dict[str, Any]) -> Hashable:
+        return (
+            info._raw_info.parent_type.name,
+            info.field_name,
+            self.parent_key(source) if self.parent_key is not None else None,
+            freeze_arguments(kwargs),
+        )
+
+    def _get_request_cache(self) -> Optional[_RequestCache]:
+        if self.backend is not None:
+            return None
+
+        execution_context = get_execution_context()
+
+        if execution_context is None:
+            return None
+
+        key = id(execution_context)
+        cache = self._request_caches.get(key)
+
+        if cache is None:
+            cache = self._request_caches[key] = _RequestCache()
+            weakref.finalize(execution_context, self._request_caches.pop, key, None)
+
+        return cache
+
+    def _load(self, key: Hashable, request_cache: Optional[_RequestCache]) -> Any:
+        if self.backend is not None:
+            return self.backend.load(key)
+
+        if request_cache is None:
+            raise KeyError(key)
+
+        return request_cache.values[key]
+
+    def _store(
+        self, key: Hashable, value: Any, request_cache: Optional[_RequestCache]
+    ) -> Any:
+        if self.backend is not None:
+            assert self.ttl is not None
+            return self.backend.store(key, value, self.ttl)
+
+        if request_cache is not None:
+            request_cache.values[key] = value
+
+        return None
+
+    def resolve(
+        self, next_: SyncExtensionResolver, source: Any, info: Info, **kwargs: Any
+    ) -> Any:
+        key = self.get_key(source, info, kwargs)
+        request_cache = self._get_request_cache()
+
+        try:
+            return self._load(key, request_cache)
+        except KeyError:
+            pass
+
+        value = next_(source, info, **kwargs)
+        self._store(key, value, request_cache)
+
+        return value
+
+    async def resolve_async(
+        self, next_: AsyncExtensionResolver, source: Any, info: Info, **kwargs: Any
+    ) -> Any:
+        key = self.get_key(source, info, kwargs)
+        request_cache = self._get_request_cache()
+
+        try:
+            return await await_maybe(self._load(key, request_cache))
+        except KeyError:
+            pass
+
+        in_flight = (
+            request_cache.in_flight if request_cache is not None else self._in_flight
+        )
+
+        task = in_flight.get(key)
+
+        if task is None:
+            # the resolver runs in its own task, so that cancelling the caller
+            # that started it doesn't cancel the callers waiting for its value
+            task = asyncio.ensure_future(
+                self._resolve_and_store(next_, source, info, kwargs, key, request_cache)
+            )
+            in_flight[key] = task
+            task.add_done_callback(partial(_finish_in_flight, in_flight, key))
+
+        return await asyncio.shield(task)
+
+    async def _resolve_and_store(
+        self,
+        next_: AsyncExtensionResolver,
+        source: Any,
+        info: Info,
+        kwargs: dict[str, Any],
+        key: Hashable,
+        request_cache: Optional[_RequestCache],
+    ) -> Any:
+        value = await await_maybe(next_(source, info, **kwargs))
+        await await_maybe(self._store(key, value, request_cache))
+
+        return value
+
+
+def _finish_in_flight(
+    in_flight: dict[Hashable, asyncio.Future[Any]],
+    key: Hashable,
+    task: asyncio.Future[Any],
+) -> None:
+    if in_flight.get(key) is task:
+        del in_flight[key]
+
+    # the error is raised to the callers waiting for the value, if there are
+    # any left, nothing else has to retrieve it
+    if not task.cancelled():
+        task.exception()
+
+
+__all__ = [
+    "CachedField",
+    "CachedFieldBackend",
+    "InMemoryCachedFieldBackend",
+    "freeze_arguments",
+]
@@ -126,7 +126,13 @@ class GraphQLView(
             )
 
     def render_graphql_ide(self, request: Request) -> Response:
-        return render_template_string(self.graphql_ide_html)  # type: ignore
+        html = render_template_string(self.graphql_ide_html)
+        headers = self.get_graphql_ide_headers(html)
+
+        if self.is_graphql_ide_not_modified(request.headers, headers):
+            return Response(status=304, headers=headers)
+
+        return Response(html, status=200, content_type="text/html", headers=headers)
 
 
 class AsyncFlaskHTTPRequestAdapter(AsyncHTTPRequestAdapter):
@@ -189,8 +195,13 @@ class AsyncGraphQLView(
             )
 
     async def render_graphql_ide(self, request: Request) -> Response:
-        content = render_template_string(self.graphql_ide_html)
-        return Response(content, status=200, content_type="text/html")
+        html = render_template_string(self.graphql_ide_html)
+        headers = self.get_graphql_ide_headers(html)
+
+        if self.is_graphql_ide_not_modified(request.headers, headers):
+            return Response(status=304, headers=headers)
+
+        return Response(html, status=200, content_type="text/html", headers=headers)
 
     def is_websocket_request(self, request: Request) -> TypeGuard[Request]:
         return False
@@ -4,14 +4,27 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Optional
 from typing_extensions import Literal, TypedDict
 
+from strawberry.types.execution import IncrementalExecutionResult
+
 if TYPE_CHECKING:
-    from strawberry.types import ExecutionResult
+    from strawberry.types import ExecutionResult, SubsequentExecutionResult
 
 
 class GraphQLHTTPResponse(TypedDict, total=False):
     data: Optional[dict[str, object]]
     errors: Optional[list[object]]
     extensions: Optional[dict[str, object]]
+    # Only present in the initial payload of an incremental (@defer/@stream) result
+    pending: list[object]
+    hasNext: bool
+
+
+class GraphQLHTTPSubsequentResponse(TypedDict, total=False):
+    hasNext: bool
+    pending: list[object]
+    incremental: list[object]
+    completed: list[object]
+    extensions: dict[str, object]
 
 
 def process_result(result: ExecutionResult) -> GraphQLHTTPResponse:
@@ -21,6 +34,26 @@ def process_result(result: ExecutionResult) -> GraphQLHTTPResponse:
         data["errors"] = [err.formatted for err in result.errors]
     if result.extensions:
         data["extensions"] = result.extensions
+    if isinstance(result, IncrementalExecutionResult):
+        data["pending"] = [pending.formatted for pending in result.pending]
+        data["hasNext"] = result.has_next
+
+    return data
+
+
+def process_subsequent_result(
+    result: SubsequentExecutionResult,
+) -> GraphQLHTTPSubsequentResponse:
+    data: GraphQLHTTPSubsequentResponse = {"hasNext": result.has_next}
+
+    if result.pending:
+        data["pending"] = [pending.formatted for pending in result.pending]
+    if result.incremental:
+        data["incremental"] = [item.formatted for item in result.incremental]
+    if result.completed:
+        data["completed"] = [item.formatted for item in result.completed]
+    if result.extensions:
+        data["extensions"] = result.extensions
 
     return data
 
@@ -38,6 +71,8 @@ class GraphQLRequestData:
 
 __all__ = [
     "GraphQLHTTPResponse",
+    "GraphQLHTTPSubsequentResponse",
     "GraphQLRequestData",
     "process_result",
+    "process_subsequent_result",
 ]
@@ -21,9 +21,12 @@ from strawberry.exceptions import MissingQueryError
 from strawberry.file_uploads.utils import replace_placeholders_with_files
 from strawberry.http import (
     GraphQLHTTPResponse,
+    GraphQLHTTPSubsequentResponse,
     GraphQLRequestData,
     process_result,
+    process_subsequent_result,
 )
+from strawberry.http.codecs import JSONPath, iter_json_chunks
 from strawberry.http.ides import GraphQL_IDE
 from strawberry.schema.base import BaseSchema
 from strawberry.schema.exceptions import (
@@ -31,13 +34,20 @@ from strawberry.schema.exceptions import (
     InvalidOperationTypeError,
 )
 from strawberry.subscriptions import GRAPHQL_TRANSPORT_WS_PROTOCOL, GRAPHQL_WS_PROTOCOL
+from strawberry.subscriptions.heartbeat import HeartbeatScheduler
 from strawberry.subscriptions.protocols.graphql_transport_ws.handlers import (
     BaseGraphQLTransportWSHandler,
 )
 from strawberry.subscriptions.protocols.graphql_ws.handlers import BaseGraphQLWSHandler
-from strawberry.types import ExecutionResult, SubscriptionExecutionResult
+from strawberry.types import (
+    ExecutionResult,
+    IncrementalExecutionResult,
+    SubscriptionExecutionResult,
+    SubsequentExecutionResult,
+)
 from strawberry.types.graphql import OperationType
 from strawberry.types.unset import UNSET, UnsetType
+from strawberry.utils.aio import aclosing
 
 from .base import BaseView
 from .exceptions import HTTPException
@@ -112,6 +122,9 @@ class AsyncBaseHTTPView(
     debug: bool
     keep_alive = False
     keep_alive_interval: Optional[float] = None
+    heartbeat_interval: float = 5
+    stream_json_responses: bool = False
+    json_stream_chunk_size: int = 64 * 1024
     connection_init_wait_timeout: timedelta = timedelta(minutes=1)
     request_adapter_class: Callable[[Request], AsyncHTTPRequestAdapter]
     websocket_adapter_class: Callable[
@@ -353,21 +366,122 @@ class AsyncBaseHTTPView(
                 },
             )
 
+        if (
+            isinstance(result, IncrementalExecutionResult)
+            and result.subsequent_results is not None
+        ):
+            headers = {
+                key.lower(): value for key, value in request_adapter.headers.items()
+            }
+
+            if not self._accepts_incremental_delivery(headers.get("accept", "")):
+                await result.subsequent_results.aclose()
+
+                raise HTTPException(
+                    406,
+                    "The operation uses @defer or @stream, "
+                    "but the request doesn't accept multipart/mixed responses",
+                )
+
         response_data = await self.process_result(request=request, result=result)
 
         if result.errors:
             self._handle_errors(result.errors, response_data)
 
+        if result.cache_control:
+            self._set_cache_control(sub_response, result.cache_control)
+
+        if (
+            isinstance(result, IncrementalExecutionResult)
+            and result.subsequent_results is not None
+        ):
+            return await self.create_streaming_response(
+                request,
+                self._get_incremental_stream(request, response_data, result),
+                sub_response,
+                headers={
+                    "Transfer-Encoding": "chunked",
+                    "Content-Type": "multipart/mixed;boundary=graphql;deferSpec=20220824,application/json",
+                },
+            )
+
+        if self.stream_json_responses:
+            return await self.create_streaming_response(
+                request,
+                self._get_json_stream(response_data),
+                sub_response,
+                headers={"Content-Type": "application/json"},
+            )
+
         return self.create_response(
             response_data=response_data, sub_response=sub_response
         )
 
+    def _get_json_stream(
+        self, response_data: GraphQLHTTPResponse
+    ) -> Callable[[], AsyncGenerator[str, None]]:
+        """Encode a response incrementally, in chunks of `json_stream_chunk_size`.
+
+        This avoids building the whole encoded document in memory (once as
+        bytes and again inside the framework's response) for large results.
+
+        Values that can't be encoded are written as `null` and reported in
+        the `errors` of the response, which are written last, as the status
+        code has already been sent by then.
+        """
+        encode = self._get_stream_encoder()
+        chunk_size = self.json_stream_chunk_size
+
+        async def stream() -> AsyncGenerator[str, None]:
+            errors: list[dict[str, object]] = []
+            separator = "{"
+
+            for key, value in response_data.items():
+                if key == "errors":
+                    continue
+
+                def on_error(path: JSONPath, error: Exception, key: str = key) -> None:
+                    error_data: dict[str, object] = {
+                        "message": "Unable to encode the value as JSON"
+                    }
+
+                    if key == "data":
+                        error_data["path"] = list(path)
+
+                    errors.append(error_data)
+
+                yield separator + self.encode_json_text(key) + ":"
+                separator = ","
+
+                for chunk in iter_json_chunks(value, encode, chunk_size, on_error):
+                    yield chunk.decode()
+
+            errors = [*(response_data.get("errors") or []), *errors]
+
+            if errors:
+                yield separator + '"errors":'
+
+                for chunk in iter_json_chunks(errors, encode, chunk_size):
+                    yield chunk.decode()
+
+            yield "}" if separator == "," or errors else "{}"
+
+        return stream
+
+    def _get_stream_encoder(self) -> Callable[[object], Union[str, bytes]]:
+        # an `encode_json` overridden on the view is still used, otherwise
+        # the codec is looked up once rather than for each piece
+        if type(self).encode_json is not BaseView.encode_json:
+            return self.encode_json
+
+        return self.get_json_codec().encode
+
     def encode_multipart_data(self, data: Any, separator: str) -> str:
         return "".join(
             [
                 f"\r\n--{separator}\r\n",
                 "Content-Type: application/json\r\n\r\n",
-                self.encode_json(data),
+                self.encode_json_text(data),
                 "\n",
             ]
         )
@@ -379,8 +493,14 @@ class AsyncBaseHTTPView(
 
         This method wraps an async stream generator with heartbeat functionality by:
         1. Creating a queue to coordinate between data and heartbeat messages
-        2. Running two concurrent tasks: one for original stream data, one for heartbeats
-        3. Merging both message types into a single output stream
+        2. Running a task that forwards the original stream data to the queue
+        3. Registering the stream with the shared `HeartbeatScheduler`, which
+           enqueues a heartbeat whenever the queue is idle at the heartbeat interval
+        4. Merging both message types into a single output stream
+
+        Heartbeats don't need a task of their own: the scheduler is a single timer
+        wheel per event loop that serves every open stream (and graphql-ws
+        keep-alives), so idle streams cost no event loop wakeups.
 
         Messages in the queue are tuples of (raised, done, data) where:
         - raised (bool): True if this contains an exception to be re-raised
@@ -402,18 +522,19 @@ class AsyncBaseHTTPView(
 
         2. Flow control: The queue has maxsize=1, which is essential because:
            - It provides natural backpressure between producers and consumer
-           - Prevents heartbeat messages from accumulating when drain is active
+           - Prevents heartbeat messages from accumulating when drain is active,
+             heartbeats are only enqueued when the queue is empty
            - Ensures proper task coordination without complex synchronization
            - Guarantees the done signal is queued before drain task completes
 
-        Heartbeats are sent every 5 seconds when the drain task isn't sending data.
+        Heartbeats are sent every `heartbeat_interval` seconds (5 by default).
 
-        Note: Due to the asynchronous nature of the heartbeat task, an extra heartbeat
-        message may be sent after the final stream boundary message. This is safe because
-        both the MIME specification (RFC 2046) and Apollo's GraphQL Multipart HTTP protocol
-        require clients to ignore any content after the final boundary marker. Additionally,
-        Apollo's protocol defines heartbeats as empty JSON objects that clients must
-        silently ignore.
+        Note: Due to the asynchronous nature of the heartbeat scheduler, an extra
+        heartbeat message may be sent after the final stream boundary message. This is
+        safe because both the MIME specification (RFC 2046) and Apollo's GraphQL
+        Multipart HTTP protocol require clients to ignore any content after the final
+        boundary marker. Additionally, Apollo's protocol defines heartbeats as empty
+        JSON objects that clients must silently ignore.
         """
         queue: asyncio.Queue[tuple[bool, bool, Any]] = asyncio.Queue(
             maxsize=1,  # Critical: maxsize=1 for flow control.
@@ -434,30 +555,29 @@ class AsyncBaseHTTPView(
             # when task.done() is True, the final stream message has been dequeued.
             await queue.put((False, True, None))  # Always use None with done=True
 
-        async def heartbeat() -> None:
-            while True:
+        def heartbeat() -> None:
+            # Only fill an idle queue: if data is waiting to be consumed the
+            # connection isn't idle and there's no need for a heartbeat.
+            if queue.empty():
                 item = self.encode_multipart_data({}, separator)
-                await queue.put((False, False, item))
-
-                await asyncio.sleep(5)
+                queue.put_nowait((False, False, item))
 
         async def merged() -> AsyncGenerator[str, None]:
-            heartbeat_task = asyncio.create_task(heartbeat())
+            heartbeat()
+            heartbeat_handle = HeartbeatScheduler.get().register(
+                self.heartbeat_interval, heartbeat
+            )
             task = asyncio.create_task(drain())
 
             async def cancel_tasks() -> None:
                 nonlocal cancelling
                 cancelling = True
+                heartbeat_handle.cancel()
                 task.cancel()
 
                 with contextlib.suppress(asyncio.CancelledError):
                     await task
 
-                heartbeat_task.cancel()
-
-                with contextlib.suppress(asyncio.CancelledError):
-                    await heartbeat_task
-
             try:
                 # When task.done() is True, the final stream message has been
                 # dequeued due to queue size 1 and the blocking nature of queue.put().
@@ -498,6 +618,28 @@ class AsyncBaseHTTPView(
 
         return self._stream_with_heartbeat(stream, separator)
 
+    def _get_incremental_stream(
+        self,
+        request: Request,
+        initial_response: GraphQLHTTPResponse,
+        result: IncrementalExecutionResult,
+        separator: str = "graphql",
+    ) -> Callable[[], AsyncGenerator[str, None]]:
+        assert result.subsequent_results is not None
+        subsequent_results = result.subsequent_results
+
+        async def stream() -> AsyncGenerator[str, None]:
+            yield self.encode_multipart_data(initial_response, separator)
+
+            async with aclosing(subsequent_results):
+                async for value in subsequent_results:
+                    response = await self.process_subsequent_result(request, value)
+                    yield self.encode_multipart_data(response, separator)
+
+            yield f"\r\n--{separator}--\r\n"
+
+        return stream
+
     async def parse_multipart_subscriptions(
         self, request: AsyncHTTPRequestAdapter
     ) -> dict[str, str]:
@@ -561,6 +703,11 @@ class AsyncBaseHTTPView(
     ) -> GraphQLHTTPResponse:
         return process_result(result)
 
+    async def process_subsequent_result(
+        self, request: Request, result: SubsequentExecutionResult
+    ) -> GraphQLHTTPSubsequentResponse:
+        return process_subsequent_result(result)
+
     async def on_ws_connect(
         self, context: Context
     ) -> Union[UnsetType, None, dict[str, object]]:
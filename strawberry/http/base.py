@@ -3,10 +3,17 @@ from collections.abc import Mapping
 from typing import Any, Generic, Optional, Union
 from typing_extensions import Protocol
 
-from strawberry.http.ides import GraphQL_IDE, get_graphql_ide_html
+from strawberry.http.codecs import JSONCodec, default_json_codec
+from strawberry.http.ides import (
+    GraphQL_IDE,
+    get_graphql_ide_etag,
+    get_graphql_ide_html,
+    is_not_modified,
+)
 from strawberry.http.types import HTTPMethod, QueryParams
 
 from .exceptions import HTTPException
+from .parse_content_type import parse_content_type
 from .typevars import Request
 
 
@@ -24,6 +31,12 @@ class BaseRequestProtocol(Protocol):
 class BaseView(Generic[Request]):
     graphql_ide: Optional[GraphQL_IDE]
     multipart_uploads_enabled: bool = False
+    # Takes precedence over the codec configured on the schema
+    json_codec: Optional[JSONCodec] = None
+    # Used when neither the view nor the schema configure a codec
+    default_json_codec: JSONCodec = default_json_codec
+    # Sent along with the IDE page, browsers revalidate it with its ETag
+    graphql_ide_cache_control: Optional[str] = "no-cache"
 
     def should_render_graphql_ide(self, request: BaseRequestProtocol) -> bool:
         return (
@@ -44,11 +57,27 @@ class BaseView(Generic[Request]):
         except json.JSONDecodeError as e:
             raise HTTPException(400, "Unable to parse request body as JSON") from e
 
+    def get_json_codec(self) -> JSONCodec:
+        if self.json_codec is not None:
+            return self.json_codec
+
+        schema = getattr(self, "schema", None)
+        if schema is not None and schema.config.json_codec is not None:
+            return schema.config.json_codec
+
+        return self.default_json_codec
+
     def decode_json(self, data: Union[str, bytes]) -> object:
-        return json.loads(data)
+        return self.get_json_codec().decode(data)
+
+    def encode_json(self, data: object) -> Union[str, bytes]:
+        return self.get_json_codec().encode(data)
+
+    def encode_json_text(self, data: object) -> str:
+        """Encode data with `encode_json`, for transports that need text."""
+        encoded = self.encode_json(data)
 
-    def encode_json(self, data: object) -> str:
-        return json.dumps(data)
+        return encoded.decode() if isinstance(encoded, bytes) else encoded
 
     def parse_query_params(self, params: QueryParams) -> dict[str, Any]:
         params = dict(params)
@@ -71,6 +100,28 @@ class BaseView(Generic[Request]):
     def graphql_ide_html(self) -> str:
         return get_graphql_ide_html(graphql_ide=self.graphql_ide)
 
+    def get_graphql_ide_headers(self, html: str) -> dict[str, str]:
+        headers = {"ETag": get_graphql_ide_etag(html)}
+
+        if self.graphql_ide_cache_control:
+            headers["Cache-Control"] = self.graphql_ide_cache_control
+
+        return headers
+
+    def is_graphql_ide_not_modified(
+        self, request_headers: Mapping[str, str], headers: Mapping[str, str]
+    ) -> bool:
+        """Whether the client already has the IDE page described by `headers`."""
+        return is_not_modified(request_headers.get("if-none-match"), headers["ETag"])
+
+    def _set_cache_control(self, sub_response: Any, cache_control: str) -> None:
+        """Sets the Cache-Control header, unless a resolver already set it."""
+        headers = sub_response.headers
+
+        # most integrations have case insensitive headers, some use a dict
+        if "Cache-Control" not in headers and "cache-control" not in headers:
+            headers["Cache-Control"] = cache_control
+
     def _is_multipart_subscriptions(
         self, content_type: str, params: dict[str, str]
     ) -> bool:
@@ -82,5 +133,28 @@ class BaseView(Generic[Request]):
 
         return params.get("subscriptionspec", "").startswith("1.0")
 
+    def _accepts_incremental_delivery(self, accept: str) -> bool:
+        """Whether a multipart response of deferred payloads can be sent back."""
+        # requests without an Accept header accept any response
+        if not accept.strip():
+            return True
+
+        for media_range in accept.split(","):
+            if not media_range.strip():
+                continue
+
+            media_type, params = parse_content_type(media_range.strip())
+
+            if media_type in ("*/*", "multipart/*"):
+                return True
+
+            if (
+                media_type == "multipart/mixed"
+                and params.get("deferspec", "20220824") == "20220824"
+            ):
+                return True
+
+        return False
+
 
 __all__ = ["BaseView"]
@@ -0,0 +1,290 @@
+"""JSON codecs used by the HTTP views and WebSocket handlers.
+
+A codec turns Python data into JSON `bytes` and back. The standard library is
+used by default, the faster backends (orjson, msgspec) are opted into per view
+with the `json_codec` attribute or per schema with `StrawberryConfig.json_codec`.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+from typing_extensions import Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+
+class JSONCodec(Protocol):
+    def encode(self, data: object) -> bytes: ...
+
+    def decode(self, data: Union[str, bytes]) -> object:
+        """Decode a JSON document.
+
+        Invalid documents must raise `json.JSONDecodeError` (or a subclass),
+        which is what the views catch to return a 400 response.
+        """
+
+
+class StdlibJSONCodec:
+    def __init__(
+        self,
+        encoder: Optional[type[json.JSONEncoder]] = None,
+        decoder: Optional[type[json.JSONDecoder]] = None,
+        loads_params: Optional[dict[str, Any]] = None,
+        **dumps_params: Any,
+    ) -> None:
+        self.encoder = encoder
+        self.decoder = decoder
+        self.loads_params = loads_params or {}
+        self.dumps_params = dumps_params
+
+    def encode(self, data: object) -> bytes:
+        return json.dumps(data, cls=self.encoder, **self.dumps_params).encode()
+
+    def decode(self, data: Union[str, bytes]) -> object:
+        return json.loads(data, cls=self.decoder, **self.loads_params)
+
+
+class OrjsonCodec:
+    def __init__(
+        self, default: Optional[Callable[[Any], Any]] = None, option: int = 0
+    ) -> None:
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+        self.default = default
+        self.option = option
+
+    def encode(self, data: object) -> bytes:
+        try:
+            return self._dumps(data, default=self.default, option=self.option)
+        except TypeError:
+            # orjson is stricter than the standard library (e.g. about
+            # non-string keys or integers over 64 bits), fall back to it
+            # rather than failing the request.
+            return json.dumps(data, default=self.default).encode()
+
+    def decode(self, data: Union[str, bytes]) -> object:
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        return self._loads(data)
+
+
+class MsgspecJSONCodec:
+    def __init__(self, enc_hook: Optional[Callable[[Any], Any]] = None) -> None:
+        import msgspec
+
+        self._encoder = msgspec.json.Encoder(enc_hook=enc_hook)
+        self._decoder = msgspec.json.Decoder()
+        self._decode_error = msgspec.DecodeError
+        self.enc_hook = enc_hook
+
+    def encode(self, data: object) -> bytes:
+        try:
+            return self._encoder.encode(data)
+        except (TypeError, OverflowError):
+            return json.dumps(data, default=self.enc_hook).encode()
+
+    def decode(self, data: Union[str, bytes]) -> object:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            document = data if isinstance(data, str) else data.decode(errors="replace")
+            raise json.JSONDecodeError(str(e), document, 0) from e
+
+
+def get_fastest_json_codec() -> JSONCodec:
+    """Return a codec for the fastest JSON library that is installed.
+
+    orjson is tried first, then msgspec, falling back to the standard library.
+    Their output can differ slightly from the standard library's (e.g. for
+    floats or non-string keys), which is why they have to be opted into.
+    """
+    for codec_class in (OrjsonCodec, MsgspecJSONCodec):
+        try:
+            return codec_class()
+        except ImportError:  # noqa: PERF203
+            continue
+
+    return StdlibJSONCodec()
+
+
+default_json_codec: JSONCodec = StdlibJSONCodec()
+
+JSONPath = tuple[Union[str, int], ...]
+
+
+def iter_json_chunks(
+    data: object,
+    encode: Callable[[object], Union[str, bytes]],
+    chunk_size: int = 64 * 1024,
+    on_error: Optional[Callable[[JSONPath, Exception], None]] = None,
+) -> Iterator[bytes]:
+    """Encode `data` as JSON, yielding chunks of roughly `chunk_size` bytes.
+
+    Objects and lists are written in batches of items, each encoded with a
+    single call to `encode`, sized from the items encoded so far so that a
+    batch is about `chunk_size` bytes. Items that are too big on their own are
+    walked in turn. This keeps the peak memory of large responses close to the
+    chunk size (and the largest single leaf), while most of the encoding is
+    still done by the codec.
+
+    When encoding a value fails, `on_error` is called with its path and the
+    exception, and `null` is written instead, so that the document stays
+    valid. Without `on_error`, the exception is raised.
+
+    Chunks always end on a boundary between two encoded pieces, so they are
+    valid UTF-8 on their own.
+    """
+
+    def encode_bytes(value: object) -> bytes:
+        piece = encode(value)
+        return piece.encode() if isinstance(piece, str) else piece
+
+    buffer: list[bytes] = []
+    size = 0
+
+    for piece in _iter_json_pieces(data, encode_bytes, chunk_size, on_error, ()):
+        buffer.append(piece)
+        size += len(piece)
+
+        if size >= chunk_size:
+            yield b"".join(buffer)
+            buffer.clear()
+            size = 0
+
+    if buffer:
+        yield b"".join(buffer)
+
+
+def _is_container(value: object) -> bool:
+    return isinstance(value, (dict, list, tuple)) and bool(value)
+
+
+def _encode_key(key: object, encode: Callable[[object], bytes]) -> bytes:
+    # like the standard library, which is what the codecs follow for keys
+    if isinstance(key, str):
+        return encode(key)
+
+    if key is True or key is False or key is None:
+        return b'"' + json.dumps(key).encode() + b'"'
+
+    return b'"' + encode(key) + b'"'
+
+
+def _encode_leaf(
+    value: object,
+    encode: Callable[[object], bytes],
+    on_error: Optional[Callable[[JSONPath, Exception], None]],
+    path: JSONPath,
+) -> bytes:
+    try:
+        return encode(value)
+    except Exception as error:
+        if on_error is None:
+            raise
+
+        on_error(path, error)
+
+        return b"null"
+
+
+def _iter_json_pieces(  # noqa: PLR0915
+    value: object,
+    encode: Callable[[object], bytes],
+    chunk_size: int,
+    on_error: Optional[Callable[[JSONPath, Exception], None]],
+    path: JSONPath,
+) -> Iterator[bytes]:
+    items: Sequence[Any]
+
+    if isinstance(value, dict) and value:
+        is_object = True
+        items = list(value.items())
+        yield b"{"
+    elif isinstance(value, (list, tuple)) and value:
+        is_object = False
+        items = value
+        yield b"["
+    else:
+        yield _encode_leaf(value, encode, on_error, path)
+        return
+
+    index = 0
+    batch_size = 1
+    encoded_size = 0
+    # items encoded one at a time until this index, after a batch failed
+    isolate_until = 0
+
+    while index < len(items):
+        batch = items[index : index + batch_size]
+        separator = b"," if index else b""
+        item = batch[0]
+        key, child = item if is_object else (index, item)
+        written = 0
+
+        # the first item, and items bigger than a chunk, are walked rather
+        # than encoded at once
+        walk = len(batch) == 1 and _is_container(child)
+
+        if walk and index >= isolate_until and encoded_size:
+            walk = encoded_size / index > chunk_size
+
+        if not walk:
+            try:
+                piece = encode(dict(batch) if is_object else batch)
+            except Exception:  # noqa: BLE001
+                if len(batch) > 1:
+                    # the value that failed is found by encoding the items of
+                    # the batch one by one
+                    isolate_until = index + len(batch)
+                    batch_size = 1
+                    continue
+
+                if _is_container(child):
+                    walk = True
+                else:
+                    if is_object:
+                        separator += _encode_key(key, encode) + b":"
+
+                    piece = _encode_leaf(child, encode, on_error, (*path, key))
+                    yield separator + piece
+                    written = len(piece)
+            else:
+                # without the brackets of the batch
+                piece = piece.strip()[1:-1]
+                yield separator + piece
+                written = len(piece)
+
+        if walk:
+            if is_object:
+                separator += _encode_key(key, encode) + b":"
+
+            yield separator
+
+            for piece in _iter_json_pieces(
+                child, encode, chunk_size, on_error, (*path, key)
+            ):
+                written += len(piece)
+                yield piece
+
+        index += len(batch)
+        encoded_size += written
+
+        if index >= isolate_until:
+            batch_size = max(chunk_size * index // max(encoded_size, 1), 1)
+
+    yield b"}" if is_object else b"]"
+
+
+__all__ = [
+    "JSONCodec",
+    "JSONPath",
+    "MsgspecJSONCodec",
+    "OrjsonCodec",
+    "StdlibJSONCodec",
+    "default_json_codec",
+    "get_fastest_json_codec",
+    "iter_json_chunks",
+]
@@ -1,13 +1,21 @@
+import hashlib
 import pathlib
+from functools import cache, lru_cache
 from typing import Optional
 from typing_extensions import Literal
 
 GraphQL_IDE = Literal["graphiql", "apollo-sandbox", "pathfinder"]
 
 
+@cache
 def get_graphql_ide_html(
     graphql_ide: Optional[GraphQL_IDE] = "graphiql",
 ) -> str:
+    """Return the HTML of the given IDE.
+
+    The file is only read once per IDE, the same string is returned to every
+    caller afterwards.
+    """
     here = pathlib.Path(__file__).parents[1]
 
     if graphql_ide == "apollo-sandbox":
@@ -20,4 +28,36 @@ def get_graphql_ide_html(
     return path.read_text(encoding="utf-8")
 
 
-__all__ = ["GraphQL_IDE", "get_graphql_ide_html"]
+@lru_cache(maxsize=64)
+def get_graphql_ide_etag(html: str) -> str:
+    """Return a strong ETag for a rendered IDE page.
+
+    Strings cache their own hash, so looking up the (cached) page returned by
+    `get_graphql_ide_html` doesn't hash the document again.
+    """
+    return f'"{hashlib.sha256(html.encode()).hexdigest()[:32]}"'
+
+
+def is_not_modified(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an `If-None-Match` request header against `etag`.
+
+    As required for `If-None-Match`, tags are compared weakly, that is
+    ignoring any `W/` prefix.
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+__all__ = [
+    "GraphQL_IDE",
+    "get_graphql_ide_etag",
+    "get_graphql_ide_html",
+    "is_not_modified",
+]
@@ -229,6 +229,9 @@ class SyncBaseHTTPView(
         if result.errors:
             self._handle_errors(result.errors, response_data)
 
+        if result.cache_control:
+            self._set_cache_control(sub_response, result.cache_control)
+
         return self.create_response(
             response_data=response_data, sub_response=sub_response
         )
@@ -37,7 +37,7 @@ from litestar.exceptions import (
     WebSocketDisconnect,
 )
 from litestar.response.streaming import Stream
-from litestar.status_codes import HTTP_200_OK
+from litestar.status_codes import HTTP_200_OK, HTTP_304_NOT_MODIFIED
 from strawberry.exceptions import InvalidCustomContext
 from strawberry.http.async_base_view import (
     AsyncBaseHTTPView,
@@ -216,7 +216,7 @@ class LitestarWebSocketAdapter(AsyncWebSocketAdapter):
 
     async def send_json(self, message: Mapping[str, object]) -> None:
         try:
-            await self.ws.send_data(data=self.view.encode_json(message))
+            await self.ws.send_data(data=self.view.encode_json_text(message))
         except WebSocketDisconnect as exc:
             raise WebSocketDisconnected from exc
 
@@ -299,13 +299,20 @@ class GraphQLController(
     async def render_graphql_ide(
         self, request: Request[Any, Any, Any]
     ) -> Response[str]:
-        return Response(self.graphql_ide_html, media_type=MediaType.HTML)
+        html = self.graphql_ide_html
+        headers = self.get_graphql_ide_headers(html)
+
+        if self.is_graphql_ide_not_modified(request.headers, headers):
+            return Response("", status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return Response(html, media_type=MediaType.HTML, headers=headers)
 
     def create_response(
         self, response_data: GraphQLHTTPResponse, sub_response: Response[bytes]
     ) -> Response[bytes]:
+        data = self.encode_json(response_data)
         response = Response(
-            self.encode_json(response_data).encode(),
+            data if isinstance(data, bytes) else data.encode(),
             status_code=HTTP_200_OK,
             media_type=MediaType.JSON,
         )
@@ -91,7 +91,7 @@ class QuartWebSocketAdapter(AsyncWebSocketAdapter):
         try:
             # Raises asyncio.CancelledError when the connection is closed.
             # https://quart.palletsprojects.com/en/latest/how_to_guides/websockets.html#detecting-disconnection
-            await self.ws.send(self.view.encode_json(message))
+            await self.ws.send(self.view.encode_json_text(message))
         except asyncio.CancelledError as exc:
             raise WebSocketDisconnected from exc
 
@@ -146,7 +146,13 @@ class GraphQLView(
             self.graphql_ide = graphql_ide
 
     async def render_graphql_ide(self, request: Request) -> Response:
-        return Response(self.graphql_ide_html)
+        html = self.graphql_ide_html
+        headers = self.get_graphql_ide_headers(html)
+
+        if self.is_graphql_ide_not_modified(request.headers, headers):
+            return Response("", status=304, headers=headers)
+
+        return Response(html, headers=headers)
 
     def create_response(
         self, response_data: "GraphQLHTTPResponse", sub_response: Response
@@ -152,7 +152,13 @@ class GraphQLView(
         return {"request": request, "response": response}  # type: ignore
 
     async def render_graphql_ide(self, request: Request) -> HTTPResponse:
-        return html(self.graphql_ide_html)
+        content = self.graphql_ide_html
+        headers = self.get_graphql_ide_headers(content)
+
+        if self.is_graphql_ide_not_modified(request.headers, headers):
+            return HTTPResponse(status=304, headers=headers)
+
+        return html(content, headers=headers)
 
     async def get_sub_response(self, request: Request) -> TemporalResponse:
         return TemporalResponse()
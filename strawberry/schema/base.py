@@ -4,6 +4,7 @@ from abc import abstractmethod
 from typing import TYPE_CHECKING, Any, Optional, Union
 from typing_extensions import Protocol
 
+from strawberry.types.unset import UNSET
 from strawberry.utils.logging import StrawberryLogger
 
 if TYPE_CHECKING:
@@ -48,6 +49,7 @@ class BaseSchema(Protocol):
         operation_name: Optional[str] = None,
         allowed_operation_types: Optional[Iterable[OperationType]] = None,
         operation_extensions: Optional[dict[str, Any]] = None,
+        operation_timeout: Optional[float] = UNSET,
     ) -> ExecutionResult:
         raise NotImplementedError
 
@@ -61,6 +63,7 @@ class BaseSchema(Protocol):
         operation_name: Optional[str] = None,
         allowed_operation_types: Optional[Iterable[OperationType]] = None,
         operation_extensions: Optional[dict[str, Any]] = None,
+        operation_timeout: Optional[float] = UNSET,
     ) -> ExecutionResult:
         raise NotImplementedError
 
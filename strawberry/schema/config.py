@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import InitVar, dataclass, field
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from strawberry.types.info import Info
 
 from .name_converter import NameConverter
 
+if TYPE_CHECKING:
+    from strawberry.http.codecs import JSONCodec
+
 
 @dataclass
 class StrawberryConfig:
@@ -17,6 +20,9 @@ class StrawberryConfig:
     relay_use_legacy_global_id: bool = False
     disable_field_suggestions: bool = False
     info_class: type[Info] = Info
+    enable_experimental_incremental_execution: bool = False
+    json_codec: Optional[JSONCodec] = None
+    operation_timeout: Optional[float] = None
     _unsafe_disable_same_type_validation: bool = False
 
     def __post_init__(
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from functools import partial, reduce
+from typing import TYPE_CHECKING, Any, Callable, Union
+
+from graphql import GraphQLObjectType, default_field_resolver
+from graphql.execution.middleware import MiddlewareManager, get_middleware_resolvers
+from graphql.type.introspection import (
+    SchemaMetaFieldDef,
+    TypeMetaFieldDef,
+    TypeNameMetaFieldDef,
+)
+
+from strawberry.resolvers import is_default_resolver
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable, Iterator, Sequence
+
+    from graphql import GraphQLFieldResolver, GraphQLResolveInfo, GraphQLSchema
+
+    from strawberry.extensions import SchemaExtension
+
+# The extensions resolving the fields of the operation being executed, see
+# `OperationMiddleware`
+_operation_middlewares: ContextVar[Sequence[SchemaExtension]] = ContextVar(
+    "strawberry_operation_middlewares", default=()
+)
+
+
+class FieldKind(Enum):
+    TRIVIAL = "trivial"
+    """The field uses the default resolver, which reads an attribute."""
+
+    INTROSPECTION = "introspection"
+    """The field belongs to the introspection system."""
+
+    CUSTOM = "custom"
+    """The field has a custom resolver."""
+
+
+def classify_fields(schema: GraphQLSchema) -> dict[tuple[str, str], FieldKind]:
+    """Returns the kind of every field of the object types of the schema.
+
+    The fields are keyed by `(type_name, field_name)`.
+    """
+    kinds: dict[tuple[str, str], FieldKind] = {}
+
+    for type_name, type_ in schema.type_map.items():
+        if not isinstance(type_, GraphQLObjectType):
+            continue
+
+        is_introspection_type = type_name.startswith("__")
+
+        for field_name, field in type_.fields.items():
+            if is_introspection_type:
+                kind = FieldKind.INTROSPECTION
+            elif field.resolve is None or is_default_resolver(field.resolve):
+                kind = FieldKind.TRIVIAL
+            else:
+                kind = FieldKind.CUSTOM
+
+            kinds[type_name, field_name] = kind
+
+    return kinds
+
+
+def get_trivial_resolvers(schema: GraphQLSchema) -> frozenset[GraphQLFieldResolver]:
+    """Returns the resolvers of the trivial and introspection fields of the schema.
+
+    This includes the resolvers of the `__schema`, `__type` and `__typename` meta
+    fields, and the resolver used for fields without one.
+    """
+    resolvers: set[GraphQLFieldResolver] = {
+        default_field_resolver,
+        SchemaMetaFieldDef.resolve,  # type: ignore[arg-type]
+        TypeMetaFieldDef.resolve,  # type: ignore[arg-type]
+        TypeNameMetaFieldDef.resolve,  # type: ignore[arg-type]
+    }
+
+    for (type_name, field_name), kind in classify_fields(schema).items():
+        if kind is FieldKind.CUSTOM:
+            continue
+
+        type_ = schema.type_map[type_name]
+        assert isinstance(type_, GraphQLObjectType)
+
+        resolver = type_.fields[field_name].resolve
+
+        if resolver is not None:
+            resolvers.add(resolver)
+
+    return frozenset(resolvers)
+
+
+@contextmanager
+def operation_middlewares(middlewares: Sequence[SchemaExtension]) -> Iterator[None]:
+    """Sets the extensions called by the `OperationMiddleware`s run inside."""
+    token = _operation_middlewares.set(middlewares)
+
+    try:
+        yield
+    finally:
+        _operation_middlewares.reset(token)
+
+
+class OperationMiddleware:
+    """Calls `resolve` on an extension of the operation being executed.
+
+    Extensions instantiated for every operation are replaced by one of these
+    in the middleware managers, so that a manager, along with the resolvers it
+    wraps, can be used by every operation with the same extension classes.
+    The extension is the one at `index` in `operation_middlewares`.
+    """
+
+    __slots__ = ("index", "resolve_trivial_fields")
+
+    def __init__(self, index: int, resolve_trivial_fields: bool) -> None:
+        self.index = index
+        self.resolve_trivial_fields = resolve_trivial_fields
+
+    def resolve(
+        self,
+        _next: Callable,
+        root: Any,
+        info: GraphQLResolveInfo,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        return _operation_middlewares.get()[self.index].resolve(
+            _next, root, info, *args, **kwargs
+        )
+
+
+class StrawberryMiddlewareManager(MiddlewareManager):
+    """Middleware manager that leaves trivial fields out of most extensions.
+
+    Resolvers in `trivial_resolvers` are only wrapped with the extensions that
+    set `resolve_trivial_fields`, all the other resolvers are wrapped with all
+    the extensions.
+    """
+
+    __slots__ = ("_trivial_middleware_resolvers", "trivial_resolvers")
+
+    def __init__(
+        self,
+        *middlewares: Union[SchemaExtension, OperationMiddleware],
+        trivial_resolvers: Collection[GraphQLFieldResolver] = frozenset(),
+    ) -> None:
+        super().__init__(*middlewares)
+
+        self.trivial_resolvers = trivial_resolvers
+        self._trivial_middleware_resolvers = list(
+            get_middleware_resolvers(
+                tuple(
+                    middleware
+                    for middleware in middlewares
+                    if middleware.resolve_trivial_fields
+                )
+            )
+        )
+
+    def get_field_resolver(
+        self, field_resolver: GraphQLFieldResolver
+    ) -> GraphQLFieldResolver:
+        if self._middleware_resolvers is None:
+            return field_resolver
+
+        try:
+            return self._cached_resolvers[field_resolver]
+        except KeyError:
+            pass
+
+        middleware_resolvers: Iterable[Any] = (
+            self._trivial_middleware_resolvers
+            if field_resolver in self.trivial_resolvers
+            else self._middleware_resolvers
+        )
+
+        resolver = reduce(
+            lambda chained_fns, next_fn: partial(next_fn, chained_fns),
+            middleware_resolvers,
+            field_resolver,
+        )
+        self._cached_resolvers[field_resolver] = resolver
+
+        return resolver
+
+
+__all__ = [
+    "FieldKind",
+    "OperationMiddleware",
+    "StrawberryMiddlewareManager",
+    "classify_fields",
+    "get_trivial_resolvers",
+    "operation_middlewares",
+]
@@ -32,10 +32,19 @@ class HasGraphQLName(Protocol):
 class NameConverter:
     def __init__(self, auto_camel_case: bool = True) -> None:
         self.auto_camel_case = auto_camel_case
+        # the names of fields and arguments are looked up every time arguments
+        # are converted, so each name is only converted to camel case once
+        self._camel_case_names: dict[str, str] = {}
 
     def apply_naming_config(self, name: str) -> str:
         if self.auto_camel_case:
-            name = to_camel_case(name)
+            camel_case_name = self._camel_case_names.get(name)
+
+            if camel_case_name is None:
+                camel_case_name = to_camel_case(name)
+                self._camel_case_names[name] = camel_case_name
+
+            name = camel_case_name
 
         return name
 
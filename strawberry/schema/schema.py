@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import time
 import warnings
 from asyncio import ensure_future
 from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Iterable
-from functools import cached_property, lru_cache
+from functools import cached_property
 from inspect import isawaitable
 from typing import (
     TYPE_CHECKING,
@@ -37,11 +38,9 @@ from graphql import (
     validate_schema,
 )
 from graphql.execution import execute, subscribe
-from graphql.execution.middleware import MiddlewareManager
 from graphql.type.directives import specified_directives
 from graphql.validation import validate
 
-from strawberry import relay
 from strawberry.annotation import StrawberryAnnotation
 from strawberry.exceptions import MissingQueryError
 from strawberry.extensions import SchemaExtension
@@ -50,7 +49,12 @@ from strawberry.extensions.directives import (
     DirectivesExtensionSync,
 )
 from strawberry.extensions.runner import SchemaExtensionsRunner
-from strawberry.printer import print_schema
+from strawberry.schema.middleware import (
+    OperationMiddleware,
+    StrawberryMiddlewareManager,
+    get_trivial_resolvers,
+    operation_middlewares,
+)
 from strawberry.schema.schema_converter import GraphQLCoreConverter
 from strawberry.schema.validation_rules.one_of import OneOfInputValidationRule
 from strawberry.types.base import (
@@ -61,18 +65,35 @@ from strawberry.types.base import (
 from strawberry.types.execution import (
     ExecutionContext,
     ExecutionResult,
+    IncrementalExecutionResult,
     PreExecutionError,
+    SubsequentExecutionResult,
 )
 from strawberry.types.graphql import OperationType
+from strawberry.types.unset import UNSET
 from strawberry.utils import IS_GQL_32, IS_GQL_33
 from strawberry.utils.aio import aclosing
 from strawberry.utils.await_maybe import await_maybe
+from strawberry.utils.deadline import await_with_deadline, operation_deadline
 
 from . import compat
 from .base import BaseSchema
 from .config import StrawberryConfig
 from .exceptions import CannotGetOperationTypeError, InvalidOperationTypeError
 
+try:
+    from graphql.execution import (
+        ExperimentalIncrementalExecutionResults,
+        experimental_execute_incrementally,
+    )
+    from graphql.type.directives import GraphQLDeferDirective, GraphQLStreamDirective
+
+    incremental_execution_directives = (GraphQLDeferDirective, GraphQLStreamDirective)
+except ImportError:  # graphql-core < 3.3
+    ExperimentalIncrementalExecutionResults = None  # type: ignore
+    experimental_execute_incrementally = None  # type: ignore
+    incremental_execution_directives = ()  # type: ignore
+
 if TYPE_CHECKING:
     from collections.abc import Iterable, Mapping
     from typing_extensions import TypeAlias
@@ -80,7 +101,11 @@ if TYPE_CHECKING:
     from graphql.execution.collect_fields import FieldGroup  # type: ignore
     from graphql.language import DocumentNode
     from graphql.pyutils import Path
-    from graphql.type import GraphQLResolveInfo
+    from graphql.type import (
+        GraphQLInputObjectType,
+        GraphQLInterfaceType,
+        GraphQLResolveInfo,
+    )
     from graphql.validation import ASTValidationRule
 
     from strawberry.directive import StrawberryDirective
@@ -201,7 +226,10 @@ class StrawberryGraphQLCoreExecutionContext(GraphQLExecutionContext):
 
 
 class Schema(BaseSchema):
-    def __init__(
+    # the printed SDL, see `as_str`
+    _sdl: Optional[str] = None
+
+    def __init__(  # noqa: PLR0915
         self,
         # TODO: can we make sure we only allow to pass
         # something that has been decorated?
@@ -258,7 +286,9 @@ class Schema(BaseSchema):
         self.subscription = subscription
 
         self.extensions = extensions
-        self._cached_middleware_manager: MiddlewareManager | None = None
+        self._cached_middleware_managers: dict[
+            tuple[object, ...], StrawberryMiddlewareManager
+        ] = {}
         self.execution_context_class = (
             execution_context_class or StrawberryGraphQLCoreExecutionContext
         )
@@ -273,6 +303,16 @@ class Schema(BaseSchema):
         self.directives = directives
         self.schema_directives = list(schema_directives)
 
+        self._execute_function = execute
+        if self.config.enable_experimental_incremental_execution:
+            if experimental_execute_incrementally is None:
+                raise RuntimeError(
+                    "Incremental execution requires a version of graphql-core "
+                    "that supports `@defer` and `@stream` (3.3.0a7 or newer)"
+                )
+
+            self._execute_function = experimental_execute_incrementally
+
         query_type = self.schema_converter.from_object(
             cast(
                 "type[WithStrawberryObjectDefinition]", query
@@ -301,6 +341,16 @@ class Schema(BaseSchema):
             self.schema_converter.from_directive(directive) for directive in directives
         ]
 
+        self._directives_by_name: dict[str, StrawberryDirective] = {}
+
+        for directive in self.directives:
+            self._directives_by_name.setdefault(
+                self.config.name_converter.from_directive(directive), directive
+            )
+
+        if self.config.enable_experimental_incremental_execution:
+            graphql_directives.extend(incremental_execution_directives)
+
         graphql_types = []
         for type_ in types:
             if compat.is_schema_directive(type_):
@@ -350,6 +400,7 @@ class Schema(BaseSchema):
         self._warn_for_federation_directives()
         self._resolve_node_ids()
         self._extend_introspection()
+        self._fields_by_graphql_name = self._index_fields()
 
         # Validate schema early because we want developers to know about
         # possible issues as soon as possible
@@ -358,25 +409,62 @@ class Schema(BaseSchema):
             formatted_errors = "\n\n".join(f"❌ {error.message}" for error in errors)
             raise ValueError(f"Invalid Schema. Errors:\n\n{formatted_errors}")
 
-    def get_extensions(self, sync: bool = False) -> list[SchemaExtension]:
-        extensions: list[type[SchemaExtension] | SchemaExtension] = []
-        extensions.extend(self.extensions)
+        self._trivial_resolvers = get_trivial_resolvers(self._schema)
+
+    def get_extensions(
+        self,
+        sync: bool = False,
+        execution_context: Optional[ExecutionContext] = None,
+    ) -> list[SchemaExtension]:
+        """Returns the extensions to use for an operation.
+
+        Extensions passed as classes are instantiated for every call, so they
+        can keep per-operation state on `self`. Extensions passed as instances
+        are shared by all the operations, unless their `for_operation` method
+        returns a copy.
+        """
+        extensions: list[SchemaExtension] = []
+
+        for extension in self.extensions:
+            if isinstance(extension, SchemaExtension):
+                instance = extension.for_operation()
+            else:
+                instance = extension(execution_context=execution_context)
+
+            # shared instances read the execution context from a context
+            # variable, this is only used outside of the operation's hooks
+            if execution_context is not None:
+                instance.execution_context = execution_context
+
+            extensions.append(instance)
+
         if self.directives:
-            extensions.extend(
-                [DirectivesExtensionSync if sync else DirectivesExtension]
+            extensions.append(
+                self._directives_extension_sync if sync else self._directives_extension
             )
-        return [
-            ext if isinstance(ext, SchemaExtension) else ext(execution_context=None)
-            for ext in extensions
-        ]
+
+        return extensions
 
     @cached_property
-    def _sync_extensions(self) -> list[SchemaExtension]:
-        return self.get_extensions(sync=True)
+    def _directives_extension(self) -> DirectivesExtension:
+        return DirectivesExtension(execution_context=None)
 
     @cached_property
-    def _async_extensions(self) -> list[SchemaExtension]:
-        return self.get_extensions(sync=False)
+    def _directives_extension_sync(self) -> DirectivesExtensionSync:
+        return DirectivesExtensionSync(execution_context=None)
+
+    @cached_property
+    def _shared_extensions(self) -> frozenset[int]:
+        # ids of the extensions used by every operation
+        return frozenset(
+            id(extension)
+            for extension in (
+                *self.extensions,
+                self._directives_extension,
+                self._directives_extension_sync,
+            )
+            if isinstance(extension, SchemaExtension)
+        )
 
     def create_extensions_runner(
         self, execution_context: ExecutionContext, extensions: list[SchemaExtension]
@@ -394,15 +482,53 @@ class Schema(BaseSchema):
 
         return {"operation_extensions": operation_extensions}
 
-    def _get_middleware_manager(
+    def _get_middlewares(
         self, extensions: list[SchemaExtension]
-    ) -> MiddlewareManager:
-        # create a middleware manager with all the extensions that implement resolve
-        if not self._cached_middleware_manager:
-            self._cached_middleware_manager = MiddlewareManager(
-                *(ext for ext in extensions if ext._implements_resolve())
+    ) -> list[SchemaExtension]:
+        # the extensions that implement resolve and want to resolve the
+        # current operation
+        return [
+            ext
+            for ext in extensions
+            if ext._implements_resolve() and ext.should_resolve()
+        ]
+
+    def _create_middleware_manager(
+        self, middlewares: list[SchemaExtension]
+    ) -> StrawberryMiddlewareManager:
+        return StrawberryMiddlewareManager(
+            *middlewares, trivial_resolvers=self._trivial_resolvers
+        )
+
+    def _get_middleware_manager(
+        self, middlewares: list[SchemaExtension]
+    ) -> StrawberryMiddlewareManager:
+        """Returns a middleware manager shared by the operations using `middlewares`.
+
+        Extensions instantiated for every operation are called through an
+        `OperationMiddleware`, so the manager must be used inside
+        `operation_middlewares(middlewares)`.
+        """
+        # one manager per combination of shared extensions and classes of
+        # extensions instantiated for every operation
+        key = tuple(
+            id(ext) if id(ext) in self._shared_extensions else type(ext)
+            for ext in middlewares
+        )
+        middleware_manager = self._cached_middleware_managers.get(key)
+
+        if middleware_manager is None:
+            middleware_manager = self._create_middleware_manager(
+                [
+                    ext
+                    if id(ext) in self._shared_extensions
+                    else OperationMiddleware(index, ext.resolve_trivial_fields)  # type: ignore[misc]
+                    for index, ext in enumerate(middlewares)
+                ]
             )
-        return self._cached_middleware_manager
+            self._cached_middleware_managers[key] = middleware_manager
+
+        return middleware_manager
 
     def _create_execution_context(
         self,
@@ -413,7 +539,14 @@ class Schema(BaseSchema):
         root_value: Optional[Any] = None,
         operation_name: Optional[str] = None,
         operation_extensions: Optional[dict[str, Any]] = None,
+        operation_timeout: Optional[float] = UNSET,
     ) -> ExecutionContext:
+        timeout = (
+            self.config.operation_timeout
+            if operation_timeout is UNSET
+            else operation_timeout
+        )
+
         return ExecutionContext(
             query=query,
             schema=self,
@@ -423,9 +556,9 @@ class Schema(BaseSchema):
             variables=variable_values,
             provided_operation_name=operation_name,
             operation_extensions=operation_extensions,
+            deadline=None if timeout is None else time.monotonic() + timeout,
         )
 
-    @lru_cache
     def get_type_by_name(
         self, name: str
     ) -> Optional[
@@ -437,10 +570,9 @@ class Schema(BaseSchema):
         ]
     ]:
         # TODO: respect auto_camel_case
-        if name in self.schema_converter.type_map:
-            return self.schema_converter.type_map[name].definition
+        concrete_type = self.schema_converter.type_map.get(name)
 
-        return None
+        return concrete_type.definition if concrete_type is not None else None
 
     def get_field_for_type(
         self, field_name: str, type_name: str
@@ -452,25 +584,42 @@ class Schema(BaseSchema):
 
         assert isinstance(type_, StrawberryObjectDefinition)
 
-        return next(
-            (
-                field
-                for field in type_.fields
-                if self.config.name_converter.get_graphql_name(field) == field_name
-            ),
-            None,
-        )
+        return self.get_fields_by_graphql_name(type_name).get(field_name)
+
+    def get_fields_by_graphql_name(
+        self, type_name: str
+    ) -> Mapping[str, StrawberryField]:
+        """Return the fields of a type of the schema, keyed by their GraphQL name.
+
+        The indexes are built when the schema is created, lookups are O(1).
+        """
+        return self._fields_by_graphql_name.get(type_name, {})
+
+    def _index_fields(self) -> dict[str, dict[str, StrawberryField]]:
+        fields_by_graphql_name: dict[str, dict[str, StrawberryField]] = {}
+
+        for name, concrete_type in self.schema_converter.type_map.items():
+            definition = concrete_type.definition
+
+            if not isinstance(definition, StrawberryObjectDefinition):
+                continue
+
+            # build the python name index while we are at it
+            _ = definition.fields_by_python_name
+
+            implementation = cast(
+                "Union[GraphQLObjectType, GraphQLInterfaceType, GraphQLInputObjectType]",
+                concrete_type.implementation,
+            )
+            fields_by_graphql_name[name] = {
+                field_name: field.extensions[GraphQLCoreConverter.DEFINITION_BACKREF]
+                for field_name, field in implementation.fields.items()
+            }
+
+        return fields_by_graphql_name
 
-    @lru_cache
     def get_directive_by_name(self, graphql_name: str) -> Optional[StrawberryDirective]:
-        return next(
-            (
-                directive
-                for directive in self.directives
-                if self.config.name_converter.from_directive(directive) == graphql_name
-            ),
-            None,
-        )
+        return self._directives_by_name.get(graphql_name)
 
     def get_fields(
         self, type_definition: StrawberryObjectDefinition
@@ -533,6 +682,7 @@ class Schema(BaseSchema):
         if isinstance(result, GraphQLExecutionResult):
             result = ExecutionResult(data=result.data, errors=result.errors)
         result.extensions = await extensions_runner.get_extensions_results(context)
+        result.cache_control = context.cache_control
         context.result = result  # type: ignore  # mypy failed to deduce correct type.
         return result
 
@@ -545,6 +695,7 @@ class Schema(BaseSchema):
         operation_name: Optional[str] = None,
         allowed_operation_types: Optional[Iterable[OperationType]] = None,
         operation_extensions: Optional[dict[str, Any]] = None,
+        operation_timeout: Optional[float] = UNSET,
     ) -> ExecutionResult:
         if allowed_operation_types is None:
             allowed_operation_types = DEFAULT_ALLOWED_OPERATION_TYPES
@@ -557,14 +708,11 @@ class Schema(BaseSchema):
             root_value=root_value,
             operation_name=operation_name,
             operation_extensions=operation_extensions,
+            operation_timeout=operation_timeout,
         )
-        extensions = self.get_extensions()
-        # TODO (#3571): remove this when we implement execution context as parameter.
-        for extension in extensions:
-            extension.execution_context = execution_context
+        extensions = self.get_extensions(execution_context=execution_context)
 
         extensions_runner = self.create_extensions_runner(execution_context, extensions)
-        middleware_manager = self._get_middleware_manager(extensions)
 
         custom_context_kwargs = self._get_custom_context_kwargs(operation_extensions)
 
@@ -585,8 +733,20 @@ class Schema(BaseSchema):
                 assert execution_context.graphql_document
                 async with extensions_runner.executing():
                     if not execution_context.result:
-                        result = await await_maybe(
-                            execute(
+                        middlewares = self._get_middlewares(extensions)
+                        # deferred payloads are resolved once the operation's
+                        # middlewares are unset, see `operation_middlewares`
+                        middleware_manager = (
+                            self._create_middleware_manager(middlewares)
+                            if self.config.enable_experimental_incremental_execution
+                            else self._get_middleware_manager(middlewares)
+                        )
+
+                        with (
+                            operation_deadline(execution_context.deadline),
+                            operation_middlewares(middlewares),
+                        ):
+                            result = self._execute_function(
                                 self._schema,
                                 execution_context.graphql_document,
                                 root_value=execution_context.root_value,
@@ -597,8 +757,19 @@ class Schema(BaseSchema):
                                 execution_context_class=self.execution_context_class,
                                 **custom_context_kwargs,
                             )
-                        )
-                        execution_context.result = result
+
+                            if isawaitable(result):
+                                result = await await_with_deadline(
+                                    result, execution_context.deadline
+                                )
+
+                        if self.config.enable_experimental_incremental_execution and (
+                            isinstance(result, ExperimentalIncrementalExecutionResults)
+                        ):
+                            result = self._create_incremental_result(
+                                result, execution_context
+                            )
+                        execution_context.result = result  # type: ignore
                     else:
                         result = execution_context.result
                     # Also set errors on the execution_context so that it's easier
@@ -629,6 +800,51 @@ class Schema(BaseSchema):
             execution_context, result, extensions_runner, skip_process_errors=True
         )
 
+    def _create_incremental_result(
+        self,
+        results: ExperimentalIncrementalExecutionResults,
+        execution_context: ExecutionContext,
+    ) -> IncrementalExecutionResult:
+        initial_result = results.initial_result
+
+        return IncrementalExecutionResult(
+            data=initial_result.data,
+            errors=initial_result.errors,
+            pending=initial_result.pending,
+            has_next=initial_result.has_next,
+            subsequent_results=self._stream_subsequent_results(
+                results.subsequent_results, execution_context
+            ),
+        )
+
+    async def _stream_subsequent_results(
+        self,
+        results: AsyncGenerator[Any, None],
+        execution_context: ExecutionContext,
+    ) -> AsyncGenerator[SubsequentExecutionResult, None]:
+        # Note: the operation hooks of schema extensions have already finished
+        # by the time deferred fragments and streamed items are delivered.
+        async with aclosing(results):
+            async for result in results:
+                errors = [
+                    error
+                    for payload in (
+                        *(result.incremental or ()),
+                        *(result.completed or ()),
+                    )
+                    for error in payload.errors or ()
+                ]
+                if errors:
+                    self._process_errors(errors, execution_context)
+
+                yield SubsequentExecutionResult(
+                    has_next=result.has_next,
+                    pending=result.pending or None,
+                    incremental=result.incremental,
+                    completed=result.completed,
+                    extensions=result.extensions,
+                )
+
     def execute_sync(
         self,
         query: Optional[str],
@@ -638,6 +854,7 @@ class Schema(BaseSchema):
         operation_name: Optional[str] = None,
         allowed_operation_types: Optional[Iterable[OperationType]] = None,
         operation_extensions: Optional[dict[str, Any]] = None,
+        operation_timeout: Optional[float] = UNSET,
     ) -> ExecutionResult:
         if allowed_operation_types is None:
             allowed_operation_types = DEFAULT_ALLOWED_OPERATION_TYPES
@@ -650,14 +867,11 @@ class Schema(BaseSchema):
             root_value=root_value,
             operation_name=operation_name,
             operation_extensions=operation_extensions,
+            operation_timeout=operation_timeout,
         )
-        extensions = self._sync_extensions
-        # TODO (#3571): remove this when we implement execution context as parameter.
-        for extension in extensions:
-            extension.execution_context = execution_context
+        extensions = self.get_extensions(sync=True, execution_context=execution_context)
 
         extensions_runner = self.create_extensions_runner(execution_context, extensions)
-        middleware_manager = self._get_middleware_manager(extensions)
 
         custom_context_kwargs = self._get_custom_context_kwargs(operation_extensions)
 
@@ -709,17 +923,23 @@ class Schema(BaseSchema):
 
                 with extensions_runner.executing():
                     if not execution_context.result:
-                        result = execute(
-                            self._schema,
-                            execution_context.graphql_document,
-                            root_value=execution_context.root_value,
-                            middleware=middleware_manager,
-                            variable_values=execution_context.variables,
-                            operation_name=execution_context.operation_name,
-                            context_value=execution_context.context,
-                            execution_context_class=self.execution_context_class,
-                            **custom_context_kwargs,
-                        )
+                        middlewares = self._get_middlewares(extensions)
+
+                        with (
+                            operation_deadline(execution_context.deadline),
+                            operation_middlewares(middlewares),
+                        ):
+                            result = execute(
+                                self._schema,
+                                execution_context.graphql_document,
+                                root_value=execution_context.root_value,
+                                middleware=self._get_middleware_manager(middlewares),
+                                variable_values=execution_context.variables,
+                                operation_name=execution_context.operation_name,
+                                context_value=execution_context.context,
+                                execution_context_class=self.execution_context_class,
+                                **custom_context_kwargs,
+                            )
 
                         if isawaitable(result):
                             result = cast("Awaitable[GraphQLExecutionResult]", result)  # type: ignore[redundant-cast]
@@ -759,13 +979,13 @@ class Schema(BaseSchema):
             data=execution_context.result.data,
             errors=execution_context.result.errors,
             extensions=extensions_runner.get_extensions_results_sync(),
+            cache_control=execution_context.cache_control,
         )
 
     async def _subscribe(
         self,
         execution_context: ExecutionContext,
         extensions_runner: SchemaExtensionsRunner,
-        middleware_manager: MiddlewareManager,
         execution_context_class: type[GraphQLExecutionContext] | None = None,
         operation_extensions: Optional[dict[str, Any]] = None,
     ) -> AsyncGenerator[ExecutionResult, None]:
@@ -784,7 +1004,11 @@ class Schema(BaseSchema):
                 async with extensions_runner.executing():
                     assert execution_context.graphql_document is not None
                     gql_33_kwargs = {
-                        "middleware": middleware_manager,
+                        # events are resolved while the subscription is
+                        # iterated, outside of `operation_middlewares`
+                        "middleware": self._create_middleware_manager(
+                            self._get_middlewares(extensions_runner.extensions)
+                        ),
                         "execution_context_class": execution_context_class,
                         "operation_extensions": operation_extensions,
                     }
@@ -861,22 +1085,20 @@ class Schema(BaseSchema):
             root_value=root_value,
             operation_name=operation_name,
         )
-        extensions = self._async_extensions
-        # TODO (#3571): remove this when we implement execution context as parameter.
-        for extension in extensions:
-            extension.execution_context = execution_context
+        extensions = self.get_extensions(execution_context=execution_context)
 
         return self._subscribe(
             execution_context,
             extensions_runner=self.create_extensions_runner(
                 execution_context, extensions
             ),
-            middleware_manager=self._get_middleware_manager(extensions),
             execution_context_class=self.execution_context_class,
             operation_extensions=operation_extensions,
         )
 
     def _resolve_node_ids(self) -> None:
+        from strawberry import relay
+
         for concrete_type in self.schema_converter.type_map.values():
             type_def = concrete_type.definition
 
@@ -942,10 +1164,32 @@ class Schema(BaseSchema):
         instrospection_type.fields["isOneOf"].resolve = _resolve_is_one_of  # type: ignore[attr-defined]
 
     def as_str(self) -> str:
-        return print_schema(self)
+        """Return the SDL of the schema.
+
+        The schema is only printed the first time, call `invalidate_sdl` if
+        it is changed afterwards.
+        """
+        if self._sdl is None:
+            from strawberry.printer import print_schema
+
+            self._sdl = print_schema(self)
+
+        return self._sdl
 
     __str__ = as_str
 
+    def load_sdl(self, sdl: str) -> None:
+        """Use an SDL printed beforehand instead of printing the schema.
+
+        This avoids printing large schemas at startup, for example by loading
+        the output of `strawberry export-schema` generated at build time.
+        """
+        self._sdl = sdl
+
+    def invalidate_sdl(self) -> None:
+        """Print the schema again the next time its SDL is requested."""
+        self._sdl = None
+
     def introspect(self) -> dict[str, Any]:
         """Return the introspection query result for the current schema.
 
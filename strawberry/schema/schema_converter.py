@@ -3,6 +3,7 @@ from __future__ import annotations
 import dataclasses
 import sys
 from functools import partial, reduce
+from inspect import isawaitable
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -50,13 +51,16 @@ from strawberry.exceptions import (
     UnresolvedFieldTypeError,
 )
 from strawberry.extensions.field_extension import build_field_extension_resolvers
-from strawberry.relay.types import GlobalID
 from strawberry.schema.types.scalar import (
     DEFAULT_SCALAR_REGISTRY,
     _get_scalar_definition,
     _make_scalar_type,
 )
-from strawberry.types.arguments import StrawberryArgument, convert_arguments
+from strawberry.types.arguments import (
+    ArgumentConverter,
+    StrawberryArgument,
+    convert_arguments,
+)
 from strawberry.types.base import (
     StrawberryList,
     StrawberryMaybe,
@@ -75,6 +79,7 @@ from strawberry.types.scalar import ScalarWrapper, scalar
 from strawberry.types.union import StrawberryUnion
 from strawberry.types.unset import UNSET
 from strawberry.utils.await_maybe import await_maybe
+from strawberry.utils.deadline import await_with_timeout, check_deadline
 
 from . import compat
 from .types.concrete_type import ConcreteType
@@ -193,6 +198,7 @@ def get_arguments(
     kwargs: Any,
     config: StrawberryConfig,
     scalar_registry: Mapping[object, Union[ScalarWrapper, ScalarDefinition]],
+    argument_converters: Optional[dict[object, ArgumentConverter]] = None,
 ) -> tuple[list[Any], dict[str, Any]]:
     # TODO: An extension might have changed the resolver arguments,
     # but we need them here since we are calling it.
@@ -214,6 +220,7 @@ def get_arguments(
         field_arguments,
         scalar_registry=scalar_registry,
         config=config,
+        converters=argument_converters,
     )
 
     # the following code allows to omit info and root arguments
@@ -256,11 +263,18 @@ class GraphQLCoreConverter:
         self.config = config
         self.scalar_registry = self._get_scalar_registry(scalar_overrides)
         self.get_fields = get_fields
+        # the GraphQL types of the classes converted so far, most fields use
+        # the same few scalars and types
+        self._class_types: dict[type, GraphQLNullableType] = {}
+        # the functions converting argument values, compiled on first use
+        self.argument_converters: dict[object, ArgumentConverter] = {}
 
     def _get_scalar_registry(
         self,
         scalar_overrides: Mapping[object, Union[ScalarWrapper, ScalarDefinition]],
     ) -> Mapping[object, Union[ScalarWrapper, ScalarDefinition]]:
+        from strawberry.relay.types import GlobalID
+
         scalar_registry = {**DEFAULT_SCALAR_REGISTRY}
 
         global_id_name = "GlobalID" if self.config.relay_use_legacy_global_id else "ID"
@@ -738,6 +752,7 @@ class GraphQLCoreConverter:
                     kwargs=kwargs,
                     config=self.config,
                     scalar_registry=self.scalar_registry,
+                    argument_converters=self.argument_converters,
                 )
 
                 resolver_requested_info = False
@@ -770,29 +785,44 @@ class GraphQLCoreConverter:
             return extension_resolver
 
         _get_result_with_extensions = wrap_field_extensions()
+        timeout = field.timeout
 
         def _resolver(_source: Any, info: GraphQLResolveInfo, **kwargs: Any) -> Any:
             strawberry_info = _strawberry_info_from_graphql(info)
+            check_deadline(info.field_name)
 
-            return _get_result_with_extensions(
+            result = _get_result_with_extensions(
                 _source,
                 strawberry_info,
                 **kwargs,
             )
 
+            # sync resolvers can't be interrupted, but the awaitables they
+            # return (such as dataloader results) can
+            if timeout is not None and isawaitable(result):
+                return await_with_timeout(result, info.field_name, timeout)
+
+            return result
+
         async def _async_resolver(
             _source: Any, info: GraphQLResolveInfo, **kwargs: Any
         ) -> Any:
             strawberry_info = _strawberry_info_from_graphql(info)
+            check_deadline(info.field_name)
 
-            return await await_maybe(
-                _get_result_with_extensions(
-                    _source,
-                    strawberry_info,
-                    **kwargs,
-                )
+            result = _get_result_with_extensions(
+                _source,
+                strawberry_info,
+                **kwargs,
             )
 
+            # the operation's deadline is enforced around the whole execution,
+            # only the fields with their own timeout are awaited with one
+            if timeout is not None:
+                return await await_with_timeout(result, info.field_name, timeout)
+
+            return await await_maybe(result)
+
         if field.is_async:
             _async_resolver._is_default = not field.base_resolver  # type: ignore
             return _async_resolver
@@ -859,6 +889,17 @@ class GraphQLCoreConverter:
         return GraphQLNonNull(self.from_type(type_))
 
     def from_type(self, type_: Union[StrawberryType, type]) -> GraphQLNullableType:
+        if isinstance(type_, type):
+            graphql_type = self._class_types.get(type_)
+
+            if graphql_type is None:
+                graphql_type = self._class_types[type_] = self._from_type(type_)
+
+            return graphql_type
+
+        return self._from_type(type_)
+
+    def _from_type(self, type_: Union[StrawberryType, type]) -> GraphQLNullableType:
         if compat.is_graphql_generic(type_):
             raise MissingTypesForGenericError(type_)
 
@@ -1,8 +1,67 @@
+from enum import Enum
+from typing import Optional
+
 from strawberry.schema_directive import Location, schema_directive
+from strawberry.types.enum import enum
+from strawberry.types.unset import UNSET
 
 
 @schema_directive(locations=[Location.INPUT_OBJECT], name="oneOf")
 class OneOf: ...
 
 
-__all__ = ["OneOf"]
+@schema_directive(
+    locations=[Location.FIELD_DEFINITION, Location.OBJECT, Location.INTERFACE],
+    name="cost",
+)
+class Cost:
+    """The cost of resolving a field, or any field returning a type.
+
+    Used by the `QueryCostLimiter` extension.
+    """
+
+    weight: int
+
+
+@schema_directive(locations=[Location.FIELD_DEFINITION], name="listSize")
+class ListSize:
+    """How many items a list field returns.
+
+    Used by the `QueryCostLimiter` extension, `slicing_arguments` are the
+    arguments limiting the number of items returned (e.g. `first`) and
+    `assumed_size` is used when none of them is passed.
+    """
+
+    assumed_size: Optional[int] = UNSET
+    slicing_arguments: Optional[list[str]] = UNSET
+
+
+@enum(name="CacheControlScope")
+class CacheControlScope(Enum):
+    PUBLIC = "PUBLIC"
+    PRIVATE = "PRIVATE"
+
+
+@schema_directive(
+    locations=[
+        Location.FIELD_DEFINITION,
+        Location.OBJECT,
+        Location.INTERFACE,
+        Location.UNION,
+    ],
+    name="cacheControl",
+)
+class CacheControl:
+    """How long the value of a field, or any field returning a type, can be cached.
+
+    Used by the `ResponseCache` extension. `PRIVATE` values are only cached
+    per client, and fields with `inherit_max_age` use the max age of their
+    parent field instead of the default one.
+    """
+
+    max_age: Optional[int] = UNSET
+    scope: Optional[CacheControlScope] = UNSET
+    inherit_max_age: Optional[bool] = UNSET
+
+
+__all__ = ["CacheControl", "CacheControlScope", "Cost", "ListSize", "OneOf"]
@@ -0,0 +1,217 @@
+"""Process-wide heartbeat scheduling for long-lived streams.
+
+Instead of running one sleeping task per stream (or per WebSocket connection)
+to emit keep-alive messages, streams register a callback with a shared
+hashed timer wheel. The wheel is driven by a single ``loop.call_at`` timer
+per event loop, set for the next slot holding a heartbeat, and fires every
+due callback in one pass, so the number of event loop wakeups no longer grows
+with the number of open streams.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import weakref
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+DEFAULT_RESOLUTION = 0.05
+DEFAULT_WHEEL_SIZE = 512
+
+
+class HeartbeatHandle:
+    """A registration in a `HeartbeatScheduler`, returned by `register`."""
+
+    __slots__ = ("_scheduler", "callback", "cancelled", "rounds", "slot", "ticks")
+
+    def __init__(
+        self,
+        scheduler: HeartbeatScheduler,
+        callback: Callable[[], None],
+        ticks: int,
+    ) -> None:
+        self._scheduler = scheduler
+        self.callback = callback
+        self.ticks = ticks
+        self.slot = 0
+        self.rounds = 0
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        if not self.cancelled:
+            self.cancelled = True
+            self._scheduler._unregister(self)
+
+
+class HeartbeatScheduler:
+    """A hashed timer wheel that runs periodic callbacks for many streams.
+
+    Each registration is placed in the slot of the wheel where it is next
+    due; the timer sleeps until the next slot that isn't empty, rather than
+    waking up every `resolution` seconds, and only looks at the slots it
+    passed, so the cost of a tick is proportional to the number of heartbeats
+    actually due, not the number of registered streams. Callbacks must be
+    cheap and synchronous, if they need to do I/O they should schedule it
+    themselves.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        resolution: float = DEFAULT_RESOLUTION,
+        wheel_size: int = DEFAULT_WHEEL_SIZE,
+    ) -> None:
+        self.loop = loop
+        self.resolution = resolution
+        self.wheel_size = wheel_size
+        self._wheel: list[dict[int, HeartbeatHandle]] = [{} for _ in range(wheel_size)]
+        self._cursor = 0
+        # The loop time of the slot under the cursor
+        self._cursor_at = 0.0
+        self._count = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._next_tick_at = 0.0
+
+    _schedulers: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, HeartbeatScheduler
+    ] = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def get(cls) -> Self:
+        """Return the scheduler shared by everything on the running loop."""
+        loop = asyncio.get_running_loop()
+
+        try:
+            return cls._schedulers[loop]  # type: ignore[return-value]
+        except KeyError:
+            scheduler = cls._schedulers[loop] = cls(loop)
+            return scheduler
+
+    def __len__(self) -> int:
+        return self._count
+
+    def register(
+        self, interval: float, callback: Callable[[], None]
+    ) -> HeartbeatHandle:
+        """Call `callback` every `interval` seconds until the handle is cancelled.
+
+        The first call happens after one interval; callers that want an
+        immediate heartbeat should send it themselves before registering.
+        """
+        ticks = max(1, math.ceil(interval / self.resolution - 1e-9))
+        handle = HeartbeatHandle(self, callback, ticks)
+        now = self.loop.time()
+
+        if not self._count:
+            self._cursor_at = now
+
+        # The cursor only moves when the timer fires, account for the slots
+        # passed since then
+        elapsed = max(0, int((now - self._cursor_at) / self.resolution))
+
+        self._schedule(handle, elapsed)
+        self._count += 1
+
+        if self._timer is None or self._due_at(elapsed + ticks) < self._next_tick_at:
+            self._set_timer()
+
+        return handle
+
+    def _schedule(self, handle: HeartbeatHandle, offset: int = 0) -> None:
+        ticks = offset + handle.ticks
+        handle.slot = (self._cursor + ticks) % self.wheel_size
+        handle.rounds = (ticks - 1) // self.wheel_size
+        self._wheel[handle.slot][id(handle)] = handle
+
+    def _unregister(self, handle: HeartbeatHandle) -> None:
+        if self._wheel[handle.slot].pop(id(handle), None) is not None:
+            self._count -= 1
+
+        if not self._count and self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _due_at(self, ticks: int) -> float:
+        return self._cursor_at + ticks * self.resolution
+
+    def _set_timer(self) -> None:
+        """Set the timer for the next slot holding a heartbeat."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._count:
+            return
+
+        # Handles due in a later revolution of the wheel also wake the timer
+        # up, to count their rounds down
+        ticks = self.wheel_size
+
+        for distance in range(1, self.wheel_size):
+            if self._wheel[(self._cursor + distance) % self.wheel_size]:
+                ticks = distance
+                break
+
+        self._next_tick_at = self._due_at(ticks)
+        self._timer = self.loop.call_at(self._next_tick_at, self._tick)
+
+    def _tick(self) -> None:
+        self._timer = None
+        started_at = self._cursor_at
+
+        # Fire every slot passed since the previous tick, which also catches
+        # up if the loop was busy, so that heartbeats don't drift under load.
+        ticks = max(1, round((self.loop.time() - started_at) / self.resolution))
+
+        for _ in range(min(ticks, self.wheel_size)):
+            self._cursor = (self._cursor + 1) % self.wheel_size
+            self._cursor_at += self.resolution
+            self._fire_slot(self._cursor)
+
+        self._cursor_at = started_at + ticks * self.resolution
+
+        # Also replaces the timer set by callbacks registering new heartbeats
+        self._set_timer()
+
+    def _fire_slot(self, slot: int) -> None:
+        bucket = self._wheel[slot]
+
+        if not bucket:
+            return
+
+        due = []
+
+        for key, handle in list(bucket.items()):
+            if handle.rounds:
+                handle.rounds -= 1
+            else:
+                del bucket[key]
+                due.append(handle)
+
+        for handle in due:
+            if handle.cancelled:
+                # Cancelled by an earlier callback in this pass, after it
+                # had already been taken out of its slot.
+                self._count -= 1
+                continue
+
+            # Reschedule before calling so that a callback cancelling
+            # its own handle removes it from the right slot.
+            self._schedule(handle)
+
+            try:
+                handle.callback()
+            except Exception as exc:  # noqa: BLE001
+                self.loop.call_exception_handler(
+                    {
+                        "message": "Exception in heartbeat callback",
+                        "exception": exc,
+                    }
+                )
+
+
+__all__ = ["HeartbeatHandle", "HeartbeatScheduler"]
@@ -15,6 +15,7 @@ from strawberry.exceptions import ConnectionRejectionError
 from strawberry.http.exceptions import NonTextMessageReceived, WebSocketDisconnected
 from strawberry.http.typevars import Context, RootValue
 from strawberry.schema.exceptions import CannotGetOperationTypeError
+from strawberry.subscriptions.heartbeat import HeartbeatHandle, HeartbeatScheduler
 from strawberry.subscriptions.protocols.graphql_ws.types import (
     CompleteMessage,
     ConnectionInitMessage,
@@ -56,6 +57,7 @@ class BaseGraphQLWSHandler(Generic[Context, RootValue]):
         self.debug = debug
         self.keep_alive = keep_alive
         self.keep_alive_interval = keep_alive_interval
+        self.keep_alive_handle: Optional[HeartbeatHandle] = None
         self.keep_alive_task: Optional[asyncio.Task] = None
         self.subscriptions: dict[str, AsyncGenerator] = {}
         self.tasks: dict[str, asyncio.Task] = {}
@@ -74,6 +76,9 @@ class BaseGraphQLWSHandler(Generic[Context, RootValue]):
         except WebSocketDisconnected:
             pass
         finally:
+            if self.keep_alive_handle:
+                self.keep_alive_handle.cancel()
+
             if self.keep_alive_task:
                 self.keep_alive_task.cancel()
                 with suppress(BaseException):
@@ -124,8 +129,16 @@ class BaseGraphQLWSHandler(Generic[Context, RootValue]):
             )
 
         if self.keep_alive:
-            keep_alive_handler = self.handle_keep_alive()
-            self.keep_alive_task = asyncio.create_task(keep_alive_handler)
+            assert self.keep_alive_interval
+
+            # a repeated connection_init replaces the previous heartbeat
+            if self.keep_alive_handle:
+                self.keep_alive_handle.cancel()
+
+            self.schedule_keep_alive()
+            self.keep_alive_handle = HeartbeatScheduler.get().register(
+                self.keep_alive_interval, self.schedule_keep_alive
+            )
 
     async def handle_connection_terminate(
         self, message: ConnectionTerminateMessage
@@ -151,11 +164,22 @@ class BaseGraphQLWSHandler(Generic[Context, RootValue]):
         operation_id = message["id"]
         await self.cleanup_operation(operation_id)
 
+    def schedule_keep_alive(self) -> None:
+        # Called by the shared heartbeat scheduler, so it must not block: the
+        # keep-alive is sent in a short-lived task, and skipped if the previous
+        # one is still being sent to a slow client.
+        if self.keep_alive_task and not self.keep_alive_task.done():
+            return
+
+        self.keep_alive_task = asyncio.create_task(self.handle_keep_alive())
+        # A failed send means the connection is going away, which is
+        # handled by the main message loop.
+        self.keep_alive_task.add_done_callback(
+            lambda task: task.cancelled() or task.exception()
+        )
+
     async def handle_keep_alive(self) -> None:
-        assert self.keep_alive_interval
-        while True:
-            await self.send_message({"type": "ka"})
-            await asyncio.sleep(self.keep_alive_interval)
+        await self.send_message({"type": "ka"})
 
     async def handle_async_results(
         self,
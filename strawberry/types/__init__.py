@@ -1,13 +1,21 @@
 from .base import get_object_definition, has_object_definition
-from .execution import ExecutionContext, ExecutionResult, SubscriptionExecutionResult
+from .execution import (
+    ExecutionContext,
+    ExecutionResult,
+    IncrementalExecutionResult,
+    SubscriptionExecutionResult,
+    SubsequentExecutionResult,
+)
 from .info import Info
 
 __all__ = [
     "ExecutionContext",
     "ExecutionResult",
+    "IncrementalExecutionResult",
     "Info",
     "Info",
     "SubscriptionExecutionResult",
+    "SubsequentExecutionResult",
     "get_object_definition",
     "has_object_definition",
 ]
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import inspect
 import warnings
+from collections import ChainMap
 from typing import (
     TYPE_CHECKING,
     Annotated,
     Any,
+    Callable,
     Optional,
     Union,
     cast,
@@ -30,10 +32,10 @@ from strawberry.types.unset import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Mapping
+    from collections.abc import Iterable, Mapping, MutableMapping
 
     from strawberry.schema.config import StrawberryConfig
-    from strawberry.types.base import StrawberryType
+    from strawberry.types.base import StrawberryType, WithStrawberryObjectDefinition
     from strawberry.types.scalar import ScalarDefinition, ScalarWrapper
 
 
@@ -182,76 +184,193 @@ def _is_optional_leaf_type(
     return False
 
 
-def convert_argument(
-    value: object,
-    type_: Union[StrawberryType, type],
+ArgumentConverter = Callable[[Any], Any]
+
+
+def _convert_leaf(value: object) -> object:
+    return value
+
+
+def _is_hashable(type_: Union[StrawberryType, type]) -> bool:
+    # enum definitions, or containers of them, can't be used as keys
+    try:
+        hash(type_)
+    except TypeError:
+        return False
+
+    return True
+
+
+def _compile_list_converter(
+    type_: StrawberryList,
     scalar_registry: Mapping[object, Union[ScalarWrapper, ScalarDefinition]],
     config: StrawberryConfig,
-) -> object:
+    compiled: MutableMapping[object, ArgumentConverter],
+) -> ArgumentConverter:
     from strawberry.relay.types import GlobalID
 
-    # TODO: move this somewhere else and make it first class
-    if isinstance(type_, StrawberryOptional):
-        res = convert_argument(value, type_.of_type, scalar_registry, config)
+    if _is_leaf_type(
+        type_.of_type, scalar_registry, skip_classes=(GlobalID,)
+    ) or _is_optional_leaf_type(
+        type_.of_type, scalar_registry, skip_classes=(GlobalID,)
+    ):
+        return _convert_leaf
+
+    convert_item = _compile_argument_converter(
+        type_.of_type, scalar_registry, config, compiled
+    )
 
-        return Some(res) if isinstance(type_, StrawberryMaybe) else res
+    def convert_list(value: object) -> object:
+        if value is None or value is _deprecated_UNSET:
+            return value
 
-    if value is None:
-        return None
+        return [convert_item(item) for item in cast("Iterable", value)]
 
-    if value is _deprecated_UNSET:
-        return _deprecated_UNSET
+    return convert_list
 
-    if isinstance(type_, StrawberryList):
-        value_list = cast("Iterable", value)
 
-        if _is_leaf_type(
-            type_.of_type, scalar_registry, skip_classes=(GlobalID,)
-        ) or _is_optional_leaf_type(
-            type_.of_type, scalar_registry, skip_classes=(GlobalID,)
-        ):
-            return value_list
+def _compile_object_converter(
+    type_: type[WithStrawberryObjectDefinition],
+    scalar_registry: Mapping[object, Union[ScalarWrapper, ScalarDefinition]],
+    config: StrawberryConfig,
+    compiled: MutableMapping[object, ArgumentConverter],
+) -> ArgumentConverter:
+    # (graphql name, python name, converter or None for leaf types)
+    fields: list[tuple[str, str, Optional[ArgumentConverter]]] = []
+
+    def convert_object(value: object) -> object:
+        if value is None or value is _deprecated_UNSET:
+            return value
+
+        value = cast("Mapping", value)
+        kwargs = {}
+
+        for graphql_name, python_name, convert in fields:
+            if graphql_name in value:
+                field_value = value[graphql_name]
+                kwargs[python_name] = (
+                    field_value if convert is None else convert(field_value)
+                )
+
+        return type_(**kwargs)
+
+    # registered before compiling the fields, for input types referencing
+    # themselves
+    compiled[type_] = convert_object
+
+    type_definition = type_.__strawberry_definition__
+
+    for field in type_definition.fields:
+        convert = _compile_argument_converter(
+            field.resolve_type(type_definition=type_definition),
+            scalar_registry,
+            config,
+            compiled,
+        )
+
+        fields.append(
+            (
+                config.name_converter.from_field(field),
+                field.python_name,
+                None if convert is _convert_leaf else convert,
+            )
+        )
+
+    return convert_object
+
+
+def _compile_argument_converter(
+    type_: Union[StrawberryType, type],
+    scalar_registry: Mapping[object, Union[ScalarWrapper, ScalarDefinition]],
+    config: StrawberryConfig,
+    compiled: MutableMapping[object, ArgumentConverter],
+) -> ArgumentConverter:
+    from strawberry.relay.types import GlobalID
+
+    if _is_hashable(type_) and (convert := compiled.get(type_)) is not None:
+        return convert
+
+    if isinstance(type_, StrawberryOptional):
+        convert_inner = _compile_argument_converter(
+            type_.of_type, scalar_registry, config, compiled
+        )
 
-        value_list = cast("Iterable", value)
+        if isinstance(type_, StrawberryMaybe):
+            return lambda value: Some(convert_inner(value))
 
-        return [
-            convert_argument(x, type_.of_type, scalar_registry, config)
-            for x in value_list
-        ]
+        return convert_inner
+
+    if isinstance(type_, StrawberryList):
+        return _compile_list_converter(type_, scalar_registry, config, compiled)
 
     if _is_leaf_type(type_, scalar_registry):
         if type_ is GlobalID:
-            return GlobalID.from_id(value)  # type: ignore
+            return lambda value: (
+                value
+                if value is None or value is _deprecated_UNSET
+                else GlobalID.from_id(value)  # type: ignore
+            )
 
-        return value
+        return _convert_leaf
 
     if isinstance(type_, LazyType):
-        return convert_argument(value, type_.resolve_type(), scalar_registry, config)
-
-    if hasattr(type_, "_enum_definition"):
-        enum_definition: EnumDefinition = type_._enum_definition
-        return convert_argument(value, enum_definition, scalar_registry, config)
+        return _compile_argument_converter(
+            type_.resolve_type(), scalar_registry, config, compiled
+        )
 
     if has_object_definition(type_):
-        kwargs = {}
+        return _compile_object_converter(type_, scalar_registry, config, compiled)
 
-        type_definition = type_.__strawberry_definition__
-        for field in type_definition.fields:
-            value = cast("Mapping", value)
-            graphql_name = config.name_converter.from_field(field)
+    def convert_unsupported(value: object) -> object:
+        if value is None or value is _deprecated_UNSET:
+            return value
 
-            if graphql_name in value:
-                kwargs[field.python_name] = convert_argument(
-                    value[graphql_name],
-                    field.resolve_type(type_definition=type_definition),
-                    scalar_registry,
-                    config,
-                )
+        raise UnsupportedTypeError(type_)
+
+    return convert_unsupported
 
-        type_ = cast("type", type_)
-        return type_(**kwargs)
 
-    raise UnsupportedTypeError(type_)
+def get_argument_converter(
+    type_: Union[StrawberryType, type],
+    scalar_registry: Mapping[object, Union[ScalarWrapper, ScalarDefinition]],
+    config: StrawberryConfig,
+    converters: Optional[dict[object, ArgumentConverter]] = None,
+) -> ArgumentConverter:
+    """Returns a function converting values of `type_` to their Python types.
+
+    The converters compiled for `type_` and the types it references are
+    stored in `converters`, to be reused by the next calls with the same
+    scalar registry and config. Schemas keep one for their arguments.
+    """
+    if converters is None:
+        converters = {}
+
+    hashable = _is_hashable(type_)
+
+    if hashable and (convert := converters.get(type_)) is not None:
+        return convert
+
+    # the converters are only shared once they are complete, as converters of
+    # input types referencing themselves are registered before their fields
+    compiled: ChainMap[object, ArgumentConverter] = ChainMap({}, converters)
+    convert = _compile_argument_converter(type_, scalar_registry, config, compiled)
+
+    if hashable:
+        compiled[type_] = convert
+
+    converters.update(compiled.maps[0])
+
+    return convert
+
+
+def convert_argument(
+    value: object,
+    type_: Union[StrawberryType, type],
+    scalar_registry: Mapping[object, Union[ScalarWrapper, ScalarDefinition]],
+    config: StrawberryConfig,
+    converters: Optional[dict[object, ArgumentConverter]] = None,
+) -> object:
+    return get_argument_converter(type_, scalar_registry, config, converters)(value)
 
 
 def convert_arguments(
@@ -259,6 +378,7 @@ def convert_arguments(
     arguments: list[StrawberryArgument],
     scalar_registry: Mapping[object, Union[ScalarWrapper, ScalarDefinition]],
     config: StrawberryConfig,
+    converters: Optional[dict[object, ArgumentConverter]] = None,
 ) -> dict[str, Any]:
     """Converts a nested dictionary to a dictionary of actual types.
 
@@ -283,6 +403,7 @@ def convert_arguments(
                 type_=argument.type,
                 config=config,
                 scalar_registry=scalar_registry,
+                converters=converters,
             )
 
     return kwargs
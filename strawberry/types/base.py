@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import dataclasses
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -332,10 +333,17 @@ class StrawberryObjectDefinition(StrawberryType):
 
         return new_type
 
+    @cached_property
+    def fields_by_python_name(self) -> Mapping[str, StrawberryField]:
+        """The fields of the type, keyed by their Python name.
+
+        The index is built the first time it is used, when the schema is
+        created at the latest, so fields must not be added afterwards.
+        """
+        return {field.python_name: field for field in self.fields}
+
     def get_field(self, python_name: str) -> Optional[StrawberryField]:
-        return next(
-            (field for field in self.fields if field.python_name == python_name), None
-        )
+        return self.fields_by_python_name.get(python_name)
 
     @property
     def is_graphql_generic(self) -> bool:
@@ -14,7 +14,7 @@ from graphql import specified_rules
 from strawberry.utils.operation import get_first_operation, get_operation_type
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import AsyncGenerator, Iterable
     from typing_extensions import NotRequired
 
     from graphql import ASTValidationRule
@@ -54,6 +54,12 @@ class ExecutionContext:
 
     operation_extensions: Optional[dict[str, Any]] = None
 
+    # The time, from `time.monotonic`, after which resolvers are cancelled
+    deadline: Optional[float] = None
+
+    # The value of the Cache-Control header of the response, if it can be cached
+    cache_control: Optional[str] = None
+
     def __post_init__(self, provided_operation_name: str | None) -> None:
         self._provided_operation_name = provided_operation_name
 
@@ -92,6 +98,7 @@ class ExecutionResult:
     data: Optional[dict[str, Any]]
     errors: Optional[list[GraphQLError]]
     extensions: Optional[dict[str, Any]] = None
+    cache_control: Optional[str] = None
 
 
 @dataclasses.dataclass
@@ -106,6 +113,31 @@ class PreExecutionError(ExecutionResult):
     """
 
 
+@dataclasses.dataclass
+class IncrementalExecutionResult(ExecutionResult):
+    """The initial result of an operation using `@defer` or `@stream`.
+
+    The fields that weren't deferred are available in `data` straight away,
+    everything else is delivered by iterating over `subsequent_results`. The
+    operation hooks of schema extensions have already finished by then.
+    """
+
+    pending: list[Any] = dataclasses.field(default_factory=list)
+    has_next: bool = False
+    subsequent_results: Optional[AsyncGenerator[SubsequentExecutionResult, None]] = None
+
+
+@dataclasses.dataclass
+class SubsequentExecutionResult:
+    """A payload delivered after the initial result of an incremental operation."""
+
+    has_next: bool
+    pending: Optional[list[Any]] = None
+    incremental: Optional[list[Any]] = None
+    completed: Optional[list[Any]] = None
+    extensions: Optional[dict[str, Any]] = None
+
+
 class ParseOptions(TypedDict):
     max_tokens: NotRequired[int]
 
@@ -122,6 +154,8 @@ class SubscriptionExecutionResult(Protocol):
 __all__ = [
     "ExecutionContext",
     "ExecutionResult",
+    "IncrementalExecutionResult",
     "ParseOptions",
     "SubscriptionExecutionResult",
+    "SubsequentExecutionResult",
 ]
@@ -89,6 +89,7 @@ class StrawberryField(dataclasses.Field):
         deprecation_reason: Optional[str] = None,
         directives: Sequence[object] = (),
         extensions: list[FieldExtension] = (),  # type: ignore
+        timeout: Optional[float] = None,
     ) -> None:
         # basic fields are fields with no provided resolver
         is_basic_field = not base_resolver
@@ -155,6 +156,7 @@ class StrawberryField(dataclasses.Field):
                 PermissionExtension(permission_instances, use_directives=False)
             )
         self.deprecation_reason = deprecation_reason
+        self.timeout = timeout
 
     def __copy__(self) -> Self:
         new_field = type(self)(
@@ -180,6 +182,7 @@ class StrawberryField(dataclasses.Field):
         new_field._arguments = (
             self._arguments[:] if self._arguments is not None else None
         )
+        new_field.timeout = self.timeout
         return new_field
 
     def __call__(self, resolver: _RESOLVER_TYPE) -> Self:
@@ -438,6 +441,7 @@ def field(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[list[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    timeout: Optional[float] = None,
 ) -> T: ...
 
 
@@ -457,6 +461,7 @@ def field(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[list[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    timeout: Optional[float] = None,
 ) -> T: ...
 
 
@@ -475,6 +480,7 @@ def field(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[list[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    timeout: Optional[float] = None,
 ) -> Any: ...
 
 
@@ -493,6 +499,7 @@ def field(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[list[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    timeout: Optional[float] = None,
 ) -> StrawberryField: ...
 
 
@@ -511,6 +518,7 @@ def field(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[list[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    timeout: Optional[float] = None,
 ) -> StrawberryField: ...
 
 
@@ -528,6 +536,7 @@ def field(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[list[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    timeout: Optional[float] = None,
     # This init parameter is used by PyRight to determine whether this field
     # is added in the constructor or not. It is not used to change
     # any behavior at the moment.
@@ -549,6 +558,8 @@ def field(
         extensions: The extensions for the field.
         graphql_type: The GraphQL type for the field, useful when you want to use a
             different type in the resolver than the one in the schema.
+        timeout: The number of seconds after which an async resolver is
+            cancelled and the field resolves to an error.
         init: This parameter is used by PyRight to determine whether this field is
             added in the constructor or not. It is not used to change any behavior
             at the moment.
@@ -588,6 +599,7 @@ def field(
         metadata=metadata,
         directives=directives or (),
         extensions=extensions or [],
+        timeout=timeout,
     )
 
     if resolver:
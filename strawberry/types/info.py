@@ -12,6 +12,8 @@ from typing import (
 )
 from typing_extensions import TypeVar
 
+from strawberry.utils.deadline import get_remaining_time
+
 from .nodes import convert_selections
 
 if TYPE_CHECKING:
@@ -123,6 +125,15 @@ class Info(Generic[ContextType, RootValueType]):
         """The root value passed to the query execution."""
         return self._raw_info.root_value
 
+    @property
+    def remaining_time(self) -> Optional[float]:
+        """The number of seconds left before the operation's deadline.
+
+        `None` when the operation has no deadline. Resolvers can pass it on as
+        the timeout of their calls to other services.
+        """
+        return get_remaining_time()
+
     @property
     def variable_values(self) -> dict[str, Any]:
         """The variable values passed to the query execution."""
@@ -46,6 +46,7 @@ def mutation(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[list[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    timeout: Optional[float] = None,
 ) -> T: ...
 
 
@@ -64,6 +65,7 @@ def mutation(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[list[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    timeout: Optional[float] = None,
 ) -> T: ...
 
 
@@ -81,6 +83,7 @@ def mutation(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[list[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    timeout: Optional[float] = None,
 ) -> Any: ...
 
 
@@ -98,6 +101,7 @@ def mutation(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[list[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    timeout: Optional[float] = None,
 ) -> StrawberryField: ...
 
 
@@ -115,6 +119,7 @@ def mutation(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[list[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    timeout: Optional[float] = None,
 ) -> StrawberryField: ...
 
 
@@ -131,6 +136,7 @@ def mutation(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[list[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    timeout: Optional[float] = None,
     # This init parameter is used by PyRight to determine whether this field
     # is added in the constructor or not. It is not used to change
     # any behavior at the moment.
@@ -151,6 +157,8 @@ def mutation(
         extensions: The extensions for the field.
         graphql_type: The GraphQL type for the field, useful when you want to use a
             different type in the resolver than the one in the schema.
+        timeout: The number of seconds after which an async resolver is
+            cancelled and the field resolves to an error.
         init: This parameter is used by PyRight to determine whether this field is
             added in the constructor or not. It is not used to change any behavior at
             the moment.
@@ -184,6 +192,7 @@ def mutation(
         directives=directives,
         extensions=extensions,
         graphql_type=graphql_type,
+        timeout=timeout,
     )
 
 
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import sys
+from contextlib import suppress
+from contextvars import ContextVar, Token
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Union
+from typing_extensions import Self
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
+_FORMAT_VERSION = 1
+
+_build_cache: ContextVar[Optional[SchemaBuildCache]] = ContextVar(
+    "strawberry_build_cache", default=None
+)
+
+
+def get_build_cache() -> Optional[SchemaBuildCache]:
+    """Returns the build cache in use, if any."""
+    return _build_cache.get()
+
+
+def fingerprint_sources(*paths: Union[str, os.PathLike[str]]) -> str:
+    """Returns a fingerprint of the Python files found in `paths`.
+
+    Directories are searched recursively. The fingerprint changes when any of
+    the files is added, removed, renamed or modified.
+    """
+    files: list[Path] = []
+
+    for path in map(Path, paths):
+        files.extend(sorted(path.rglob("*.py")) if path.is_dir() else [path])
+
+    digest = hashlib.sha256()
+
+    for file in files:
+        digest.update(str(file).encode())
+        digest.update(b"\0")
+        digest.update(file.read_bytes())
+        digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+def _strawberry_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("strawberry-graphql")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class SchemaBuildCache:
+    """Persists the evaluated annotations of types between runs.
+
+    Evaluating string annotations, such as those of modules using
+    `from __future__ import annotations`, takes most of the time spent
+    declaring very large schemas. While the cache is in use, the annotations
+    evaluated are stored in `path` when leaving the `with` block, and on
+    the next runs they are loaded from there instead of being evaluated
+    again:
+
+    ```python
+    from strawberry.utils.build_cache import SchemaBuildCache, fingerprint_sources
+
+    with SchemaBuildCache(".cache/schema", fingerprint=fingerprint_sources("app")):
+        from app.schema import schema
+    ```
+
+    The stored annotations are discarded when the fingerprint, Strawberry or
+    Python change, so the fingerprint must change whenever the code declaring
+    the types does. Only annotations evaluated in the namespace of a module
+    are cached, and they are stored with `pickle`: the cache file must not be
+    writable by anyone who shouldn't be able to run code in the application.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike[str]], *, fingerprint: str) -> None:
+        self.path = Path(path)
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+        self._stored: dict[tuple[str, str], bytes] = {}
+        self._added: dict[tuple[str, str], Any] = {}
+        self._token: Optional[Token[Optional[SchemaBuildCache]]] = None
+
+        self._load()
+
+    @property
+    def _header(self) -> tuple[Any, ...]:
+        return (
+            _FORMAT_VERSION,
+            self.fingerprint,
+            _strawberry_version(),
+            sys.version_info[:2],
+        )
+
+    def _load(self) -> None:
+        try:
+            with self.path.open("rb") as file:
+                header, stored = pickle.load(file)  # noqa: S301
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+            return
+
+        if header == self._header:
+            self._stored = stored
+
+    def save(self) -> None:
+        """Stores the annotations evaluated since the cache was loaded."""
+        if not self._added:
+            return
+
+        for key, value in self._added.items():
+            # local classes and some annotations can't be pickled, they are
+            # evaluated every time
+            with suppress(Exception):
+                self._stored[key] = pickle.dumps(value)
+
+        self._added = {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+
+        with temporary_path.open("wb") as file:
+            pickle.dump((self._header, self._stored), file)
+
+        # replaced at once, so that concurrent workers never read a partial file
+        temporary_path.replace(self.path)
+
+    def evaluate(
+        self,
+        annotation: str,
+        namespace: Optional[dict[str, Any]],
+        evaluate: Callable[[], Any],
+    ) -> Any:
+        """Returns the evaluation of a string annotation.
+
+        `evaluate` is called when the annotation isn't cached, its result is
+        stored by `save` unless it can't be pickled.
+        """
+        module_name = namespace.get("__name__") if namespace else None
+        module = sys.modules.get(module_name) if module_name else None
+
+        if module is None or vars(module) is not namespace:
+            return evaluate()
+
+        key = (module_name, annotation)
+        stored = self._stored.get(key)
+
+        if stored is not None:
+            try:
+                # classes are stored by name, so this looks them up in their
+                # module, like evaluating the annotation would
+                value = pickle.loads(stored)  # noqa: S301
+            except Exception:  # noqa: BLE001, S110
+                # a class that isn't declared yet, evaluating the annotation
+                # fails the same way
+                pass
+            else:
+                self.hits += 1
+                return value
+
+        value = evaluate()
+        self.misses += 1
+        self._added[key] = value
+
+        return value
+
+    def __enter__(self) -> Self:
+        self._token = _build_cache.set(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        assert self._token is not None
+        _build_cache.reset(self._token)
+        self._token = None
+
+        if exc_type is None:
+            self.save()
+
+
+__all__ = ["SchemaBuildCache", "fingerprint_sources", "get_build_cache"]
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Optional
+
+from graphql import GraphQLError
+from graphql.execution import ExecutionResult as GraphQLExecutionResult
+
+from strawberry.exceptions import ResolverTimeoutError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Iterator
+
+_operation_deadline: ContextVar[Optional[float]] = ContextVar(
+    "strawberry_operation_deadline", default=None
+)
+
+
+def get_remaining_time() -> Optional[float]:
+    """Returns the number of seconds left before the current operation's deadline.
+
+    `None` is returned when the operation has no deadline.
+    """
+    deadline = _operation_deadline.get()
+
+    if deadline is None:
+        return None
+
+    return max(deadline - time.monotonic(), 0)
+
+
+@contextmanager
+def operation_deadline(deadline: Optional[float]) -> Iterator[None]:
+    """Sets the deadline, from `time.monotonic`, of the resolvers run inside."""
+    token = _operation_deadline.set(deadline)
+
+    try:
+        yield
+    finally:
+        _operation_deadline.reset(token)
+
+
+def check_deadline(field_name: str) -> None:
+    """Raises `ResolverTimeoutError` when the operation's deadline passed.
+
+    This is called before running resolvers, so that they aren't started once
+    it's too late.
+    """
+    deadline = _operation_deadline.get()
+
+    if deadline is not None and deadline <= time.monotonic():
+        raise ResolverTimeoutError(field_name)
+
+
+async def await_with_timeout(
+    awaitable: Awaitable[Any], field_name: str, timeout: float
+) -> Any:
+    """Awaits the result of a resolver, cancelling it after `timeout` seconds.
+
+    Only coroutines are cancelled: other awaitables, like the futures returned
+    by `DataLoader.load`, can be shared with other fields and keep running.
+    """
+    if not asyncio.iscoroutine(awaitable):
+        awaitable = asyncio.shield(awaitable)
+
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        raise ResolverTimeoutError(field_name, timeout) from None
+
+
+async def await_with_deadline(
+    awaitable: Awaitable[GraphQLExecutionResult], deadline: Optional[float]
+) -> GraphQLExecutionResult:
+    """Awaits the execution of an operation, cancelling it at `deadline`.
+
+    The whole execution is bounded at once, rather than each of its
+    resolvers, and an operation running past its deadline results in an
+    error without data.
+    """
+    if deadline is None:
+        return await awaitable
+
+    try:
+        return await asyncio.wait_for(awaitable, deadline - time.monotonic())
+    except asyncio.TimeoutError:
+        return GraphQLExecutionResult(
+            data=None, errors=[GraphQLError("Operation deadline exceeded")]
+        )
+
+
+__all__ = [
+    "await_with_deadline",
+    "await_with_timeout",
+    "check_deadline",
+    "get_remaining_time",
+    "operation_deadline",
+]
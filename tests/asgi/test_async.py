@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+import json
+from typing import TYPE_CHECKING, NewType, Optional
 
 import pytest
 
 import strawberry
+from tests.conftest import skip_if_gql_32
 
 if TYPE_CHECKING:
     from starlette.testclient import TestClient
 
+Opaque = strawberry.scalar(NewType("Opaque", object), serialize=lambda value: value)
+
 
 @pytest.fixture
 def test_client() -> TestClient:
@@ -31,3 +35,139 @@ def test_simple_query(test_client: TestClient):
     response = test_client.post("/", json={"query": "{ hello }"})
 
     assert response.json() == {"data": {"hello": "Hello world"}}
+
+
+@skip_if_gql_32("Incremental execution requires graphql-core 3.3")
+def test_deferred_fragments_are_streamed_as_multipart():
+    from starlette.testclient import TestClient
+
+    from strawberry.asgi import GraphQL
+    from strawberry.schema.config import StrawberryConfig
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        async def hello(self) -> str:
+            return "Hello world"
+
+        @strawberry.field
+        async def slow(self) -> str:
+            return "Slow"
+
+    schema = strawberry.Schema(
+        Query,
+        config=StrawberryConfig(enable_experimental_incremental_execution=True),
+    )
+    test_client = TestClient(GraphQL[None, None](schema))
+
+    response = test_client.post(
+        "/",
+        json={"query": "{ hello ... @defer { slow } }"},
+        headers={"accept": "multipart/mixed;deferSpec=20220824,application/json"},
+    )
+
+    assert response.headers["content-type"].startswith("multipart/mixed")
+    parts = [
+        json.loads(part.split("\r\n\r\n", 1)[1])
+        for part in response.text.split("\r\n--graphql")
+        if "\r\n\r\n" in part
+    ]
+
+    assert parts == [
+        {
+            "data": {"hello": "Hello world"},
+            "pending": [{"id": "0", "path": []}],
+            "hasNext": True,
+        },
+        {
+            "hasNext": False,
+            "incremental": [{"data": {"slow": "Slow"}, "id": "0"}],
+            "completed": [{"id": "0"}],
+        },
+    ]
+
+
+@skip_if_gql_32("Incremental execution requires graphql-core 3.3")
+def test_deferred_fragments_require_accepting_multipart():
+    from starlette.testclient import TestClient
+
+    from strawberry.asgi import GraphQL
+    from strawberry.schema.config import StrawberryConfig
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        async def hello(self) -> str:
+            return "Hello world"
+
+    schema = strawberry.Schema(
+        Query,
+        config=StrawberryConfig(enable_experimental_incremental_execution=True),
+    )
+    test_client = TestClient(GraphQL[None, None](schema))
+
+    response = test_client.post(
+        "/",
+        json={"query": "{ ... @defer { hello } }"},
+        headers={"accept": "application/json"},
+    )
+
+    assert response.status_code == 406
+
+    # operations that aren't deferred are still sent as JSON
+    response = test_client.post(
+        "/", json={"query": "{ hello }"}, headers={"accept": "application/json"}
+    )
+
+    assert response.json() == {"data": {"hello": "Hello world"}}
+
+
+def test_json_responses_can_be_streamed():
+    from starlette.testclient import TestClient
+
+    from strawberry.asgi import GraphQL
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        async def items(self) -> list[str]:
+            return [f"item {i}" for i in range(1000)]
+
+    class StreamingGraphQL(GraphQL[None, None]):
+        stream_json_responses = True
+        json_stream_chunk_size = 1024
+
+    test_client = TestClient(StreamingGraphQL(strawberry.Schema(Query)))
+
+    response = test_client.post("/", json={"query": "{ items }"})
+
+    assert response.headers["content-type"] == "application/json"
+    assert "content-length" not in response.headers
+    assert response.json() == {"data": {"items": [f"item {i}" for i in range(1000)]}}
+
+
+def test_streamed_json_responses_report_values_that_cant_be_encoded():
+    from starlette.testclient import TestClient
+
+    from strawberry.asgi import GraphQL
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def items(self) -> list[Opaque]:
+            return [1, object(), 3]
+
+    class StreamingGraphQL(GraphQL[None, None]):
+        stream_json_responses = True
+
+    test_client = TestClient(StreamingGraphQL(strawberry.Schema(Query)))
+
+    response = test_client.post("/", json={"query": "{ items }"})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "data": {"items": [1, None, 3]},
+        "errors": [
+            {"message": "Unable to encode the value as JSON", "path": ["items", 1]}
+        ],
+    }
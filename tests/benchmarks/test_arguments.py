@@ -1,6 +1,10 @@
+from typing import Optional
+
 import pytest
 from pytest_codspeed import BenchmarkFixture
 
+import strawberry
+from strawberry.annotation import StrawberryAnnotation
 from strawberry.schema.config import StrawberryConfig
 from strawberry.schema.types.scalar import DEFAULT_SCALAR_REGISTRY
 from strawberry.types.arguments import convert_argument
@@ -19,3 +23,89 @@ def test_convert_argument_large_list(benchmark: BenchmarkFixture, ntypes):
         assert test_value == result
 
     benchmark(run)
+
+
+@strawberry.input
+class AddressInput:
+    street: str
+    city: str
+    zip_code: Optional[str] = None
+
+
+@strawberry.input
+class OrderLineInput:
+    product_id: strawberry.ID
+    quantity: int
+    tags: list[str]
+
+
+@strawberry.input
+class OrderInput:
+    customer_name: str
+    shipping_address: AddressInput
+    lines: list[OrderLineInput]
+    notes: Optional[str] = None
+
+
+def create_orders(count: int) -> list[dict]:
+    return [
+        {
+            "customerName": f"Customer {i}",
+            "shippingAddress": {"street": "Main St", "city": "Rome", "zipCode": None},
+            "lines": [
+                {"productId": str(j), "quantity": j, "tags": ["a", "b"]}
+                for j in range(3)
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("count", [100, 1_000, 5_000])
+def test_convert_argument_list_of_nested_inputs(
+    benchmark: BenchmarkFixture, count: int
+):
+    test_value = create_orders(count)
+    type_ = StrawberryAnnotation(list[OrderInput]).resolve()
+    config = StrawberryConfig()
+
+    def run():
+        return convert_argument(test_value, type_, DEFAULT_SCALAR_REGISTRY, config)
+
+    result = benchmark(run)
+
+    assert len(result) == count
+    assert result[0].lines[1].product_id == "1"
+
+
+@strawberry.type
+class Query:
+    hello: str = "world"
+
+
+@strawberry.type
+class Mutation:
+    @strawberry.mutation
+    def create_orders(self, orders: list[OrderInput]) -> int:
+        return len(orders)
+
+
+schema = strawberry.Schema(query=Query, mutation=Mutation)
+
+
+@pytest.mark.parametrize("count", [100, 1_000, 5_000])
+def test_execute_mutation_with_list_of_nested_inputs(
+    benchmark: BenchmarkFixture, count: int
+):
+    variable_values = {"orders": create_orders(count)}
+
+    def run():
+        return schema.execute_sync(
+            "mutation ($orders: [OrderInput!]!) { createOrders(orders: $orders) }",
+            variable_values=variable_values,
+        )
+
+    result = benchmark(run)
+
+    assert not result.errors
+    assert result.data == {"createOrders": count}
@@ -7,6 +7,7 @@ import pytest
 from pytest_codspeed.plugin import BenchmarkFixture
 
 import strawberry
+from strawberry.extensions import MetricsExtension
 from strawberry.extensions.base_extension import SchemaExtension
 from strawberry.utils.await_maybe import AwaitableOrValue
 
@@ -35,7 +36,7 @@ items_query = (ROOT / "items.graphql").read_text()
 @pytest.mark.parametrize("items", [1_000, 10_000], ids=lambda x: f"items_{x}")
 @pytest.mark.parametrize(
     "extensions",
-    [[], [SimpleExtension()], [ResolveExtension()]],
+    [[], [SimpleExtension()], [ResolveExtension()], [MetricsExtension()]],
     ids=lambda x: f"with_{'_'.join(type(ext).__name__.lower() for ext in x) or 'no_extensions'}",
 )
 def test_execute(
@@ -0,0 +1,120 @@
+import asyncio
+from typing import Any
+
+import pytest
+from pytest_codspeed.plugin import BenchmarkFixture
+
+import strawberry
+
+NTYPES = 200
+
+
+def create_entity_types(*, async_resolve_reference: bool = False) -> list[type]:
+    types = []
+
+    for i in range(NTYPES):
+        if async_resolve_reference:
+
+            async def resolve_reference(cls: type, id: strawberry.ID) -> Any:
+                return cls(id=id, name="Product")
+
+        else:
+
+            def resolve_reference(cls: type, id: strawberry.ID) -> Any:
+                return cls(id=id, name="Product")
+
+        cls = type(
+            f"Product{i}",
+            (),
+            {
+                "__annotations__": {"id": strawberry.ID, "name": str},
+                "resolve_reference": classmethod(resolve_reference),
+            },
+        )
+
+        types.append(strawberry.federation.type(keys=["id"])(cls))
+
+    return types
+
+
+def create_schema(types: list[type]) -> strawberry.federation.Schema:
+    @strawberry.type
+    class Query:
+        hello: str = "world"
+
+    return strawberry.federation.Schema(
+        query=Query, types=types, enable_federation_2=True
+    )
+
+
+@pytest.mark.benchmark
+def test_federation_schema_construction(benchmark: BenchmarkFixture):
+    types = create_entity_types()
+
+    benchmark(create_schema, types)
+
+
+@pytest.mark.benchmark
+def test_federation_service_sdl(benchmark: BenchmarkFixture):
+    schema = create_schema(create_entity_types())
+
+    def run():
+        return schema.execute_sync("{ _service { sdl } }")
+
+    result = benchmark(run)
+
+    assert not result.errors
+
+
+ENTITIES_QUERY = """
+    query ($representations: [_Any!]!) {
+        _entities(representations: $representations) {
+            ... on Product0 {
+                id
+                name
+            }
+            ... on Product1 {
+                id
+                name
+            }
+        }
+    }
+"""
+
+
+def create_representations(count: int) -> list[dict[str, Any]]:
+    return [{"__typename": f"Product{i % NTYPES}", "id": str(i)} for i in range(count)]
+
+
+@pytest.mark.parametrize("count", [10, 1_000, 10_000])
+def test_federation_entities_sync(benchmark: BenchmarkFixture, count: int):
+    schema = create_schema(create_entity_types())
+
+    def run():
+        return schema.execute_sync(
+            ENTITIES_QUERY,
+            variable_values={"representations": create_representations(count)},
+        )
+
+    result = benchmark(run)
+
+    assert not result.errors
+    assert len(result.data["_entities"]) == count
+
+
+@pytest.mark.parametrize("count", [10, 1_000, 10_000])
+def test_federation_entities_async(benchmark: BenchmarkFixture, count: int):
+    schema = create_schema(create_entity_types(async_resolve_reference=True))
+
+    def run():
+        return asyncio.run(
+            schema.execute(
+                ENTITIES_QUERY,
+                variable_values={"representations": create_representations(count)},
+            )
+        )
+
+    result = benchmark(run)
+
+    assert not result.errors
+    assert len(result.data["_entities"]) == count
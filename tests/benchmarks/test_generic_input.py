@@ -73,3 +73,56 @@ def test_execute_generic_input(benchmark: BenchmarkFixture):
     result = benchmark(run)
 
     assert not result.errors
+
+
+@strawberry.input
+class PriceRange:
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+
+
+@strawberry.input
+class BookFilter:
+    title_contains: Optional[str] = None
+    author_name: Optional[GraphQLFilter[str]] = None
+    price_range: Optional[PriceRange] = None
+    and_filters: Optional[list["BookFilter"]] = None
+
+
+@strawberry.type
+class NestedInputQuery:
+    @strawberry.field
+    def count_books(self, book_filter: BookFilter) -> int:
+        return 0
+
+
+nested_input_schema = strawberry.Schema(query=NestedInputQuery)
+
+
+def create_book_filter(depth: int, width: int) -> dict:
+    book_filter = {
+        "titleContains": "Gatsby",
+        "authorName": {"eq": "F. Scott Fitzgerald", "in_": ["a", "b", "c"]},
+        "priceRange": {"minPrice": 1.0, "maxPrice": 10.0},
+    }
+
+    if depth:
+        book_filter["andFilters"] = [
+            create_book_filter(depth - 1, width) for _ in range(width)
+        ]
+
+    return book_filter
+
+
+def test_execute_large_nested_input(benchmark: BenchmarkFixture):
+    variable_values = {"bookFilter": create_book_filter(depth=4, width=5)}
+
+    def run():
+        return nested_input_schema.execute_sync(
+            "query ($bookFilter: BookFilter!) { countBooks(bookFilter: $bookFilter) }",
+            variable_values=variable_values,
+        )
+
+    result = benchmark(run)
+
+    assert not result.errors
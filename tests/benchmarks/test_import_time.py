@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+import pytest
+from pytest_codspeed.plugin import BenchmarkFixture
+
+
+def get_import_time(module: str) -> int:
+    """Returns the cumulative import time of `module`, in microseconds."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    for line in process.stderr.splitlines():
+        _, _, cumulative, name = (
+            part.strip() for part in line.replace(":", "|", 1).split("|")
+        )
+
+        if name == module:
+            return int(cumulative)
+
+    raise AssertionError(f"{module} was not imported")  # pragma: no cover
+
+
+@pytest.mark.benchmark
+def test_import_strawberry(benchmark: BenchmarkFixture):
+    import_time = benchmark(get_import_time, "strawberry")
+
+    assert import_time > 0
@@ -0,0 +1,66 @@
+import pytest
+from pytest_codspeed.plugin import BenchmarkFixture
+
+import strawberry
+from strawberry.extensions import MetricsExtension
+from strawberry.extensions.base_extension import SchemaExtension
+from strawberry.extensions.metrics import CallbackExporter
+
+
+@strawberry.type
+class Item:
+    index: int
+
+    @strawberry.field
+    def name(self) -> str:
+        return f"Item {self.index}"
+
+    @strawberry.field
+    def double(self) -> int:
+        return self.index * 2
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def items(self, count: int) -> list[Item]:
+        return [Item(index=i) for i in range(count)]
+
+
+ITEMS_QUERY = """
+    query Items($count: Int!) {
+        items(count: $count) {
+            index
+            name
+            double
+        }
+    }
+"""
+
+
+# Compared with each other, these measure the overhead of the metrics on
+# fields with custom resolvers, which are the ones that are measured
+@pytest.mark.benchmark
+@pytest.mark.parametrize("items", [1_000, 10_000], ids=lambda x: f"items_{x}")
+@pytest.mark.parametrize(
+    "extension",
+    [
+        None,
+        MetricsExtension(),
+        MetricsExtension(exporters=[CallbackExporter(lambda registry: None)]),
+    ],
+    ids=["without_metrics", "with_metrics", "with_metrics_and_exporter"],
+)
+def test_execute_with_metrics(
+    benchmark: BenchmarkFixture, items: int, extension: SchemaExtension
+):
+    schema = strawberry.Schema(
+        query=Query, extensions=[extension] if extension is not None else []
+    )
+
+    def run():
+        return schema.execute_sync(ITEMS_QUERY, variable_values={"count": items})
+
+    results = benchmark(run)
+
+    assert results.errors is None
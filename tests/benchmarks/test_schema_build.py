@@ -0,0 +1,106 @@
+import sys
+import types
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from pytest_codspeed.plugin import BenchmarkFixture
+
+import strawberry
+from strawberry.utils.build_cache import SchemaBuildCache
+
+
+def create_query_type(ntypes: int) -> type:
+    types: list[type] = []
+
+    for i in range(ntypes):
+        annotations = {
+            "id": strawberry.ID,
+            "name": str,
+            "count": int,
+            "tags": list[str],
+            "ratio": Optional[float],
+        }
+        namespace: dict = {"__annotations__": annotations}
+
+        if types:
+            annotations["previous"] = Optional[types[-1]]
+            annotations["others"] = list[types[-1]]  # type: ignore[valid-type]
+            namespace["previous"] = None
+            namespace["others"] = strawberry.field(default_factory=list)
+
+        types.append(strawberry.type(type(f"Type{i}", (), namespace)))
+
+    return strawberry.type(
+        type(
+            "Query",
+            (),
+            {"__annotations__": {f"type{i}": type_ for i, type_ in enumerate(types)}},
+        )
+    )
+
+
+@pytest.mark.parametrize("ntypes", [10, 100, 1_000])
+def test_schema_build(benchmark: BenchmarkFixture, ntypes: int):
+    query = create_query_type(ntypes)
+
+    schema = benchmark(strawberry.Schema, query=query)
+
+    assert len(schema._schema.type_map) > ntypes
+
+
+def create_types_source(ntypes: int) -> str:
+    lines = [
+        "from __future__ import annotations",
+        "from typing import Optional",
+        "import strawberry",
+    ]
+
+    for i in range(ntypes):
+        lines += [
+            "@strawberry.type",
+            f"class Type{i}:",
+            "    id: strawberry.ID",
+            "    name: str",
+            "    tags: list[str]",
+            "    ratio: Optional[float]",
+            f"    previous: Optional[Type{max(i - 1, 0)}] = None",
+        ]
+
+    lines += ["@strawberry.type", "class Query:"]
+    lines += [f"    type{i}: Type{i}" for i in range(ntypes)]
+
+    return "\n".join(lines)
+
+
+def declare_and_build(source: str) -> strawberry.Schema:
+    module = types.ModuleType("benchmark_schema_types")
+    sys.modules[module.__name__] = module
+    exec(compile(source, module.__name__, "exec"), vars(module))  # noqa: S102
+
+    return strawberry.Schema(query=module.Query)
+
+
+@pytest.mark.parametrize("use_cache", [False, True], ids=["no_cache", "warm_cache"])
+def test_schema_startup_with_build_cache(
+    benchmark: BenchmarkFixture, tmp_path: Path, use_cache: bool
+):
+    source = create_types_source(500)
+    cache_path = tmp_path / "schema"
+
+    with SchemaBuildCache(cache_path, fingerprint="benchmark"):
+        declare_and_build(source)
+
+    def run():
+        if not use_cache:
+            return declare_and_build(source)
+
+        with SchemaBuildCache(cache_path, fingerprint="benchmark"):
+            return declare_and_build(source)
+
+    try:
+        schema = benchmark(run)
+    finally:
+        sys.modules.pop("benchmark_schema_types", None)
+
+    assert len(schema._schema.type_map) > 500
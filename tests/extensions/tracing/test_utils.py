@@ -0,0 +1,46 @@
+from unittest.mock import Mock
+
+import pytest
+
+from strawberry.extensions.tracing.utils import TracingSampler
+
+
+def _info(type_name: str, field_name: str) -> Mock:
+    info = Mock(field_name=field_name)
+    info.parent_type.name = type_name
+    return info
+
+
+def test_sample_rate():
+    assert TracingSampler().sample_operation()
+    assert not TracingSampler(sample_rate=0).sample_operation()
+
+
+@pytest.mark.parametrize("sample_rate", [-0.1, 1.5])
+def test_invalid_sample_rate(sample_rate: float):
+    with pytest.raises(ValueError, match="sample_rate must be between 0 and 1"):
+        TracingSampler(sample_rate=sample_rate)
+
+
+def test_slow_operations():
+    assert not TracingSampler().is_slow(100)
+    assert TracingSampler(slow_operation_threshold=0.5).is_slow(0.5)
+    assert not TracingSampler(slow_operation_threshold=0.5).is_slow(0.1)
+
+
+def test_field_filters():
+    sampler = TracingSampler(
+        include_fields=["Query.*", "User.posts", "User.name"],
+        exclude_fields=["Query.secret", "User.name"],
+    )
+
+    assert sampler.should_trace_field(_info("Query", "user"))
+    assert not sampler.should_trace_field(_info("Query", "secret"))
+    assert sampler.should_trace_field(_info("User", "posts"))
+    assert not sampler.should_trace_field(_info("User", "name"))
+    assert not sampler.should_trace_field(_info("Post", "title"))
+
+
+def test_invalid_field_coordinate():
+    with pytest.raises(ValueError, match="expected `Type.field` or `Type.\\*`"):
+        TracingSampler(include_fields=["Query"])
@@ -497,3 +497,309 @@ async def test_can_use_async_resolve_reference_multiple_representations():
     assert not result.errors
 
     assert result.data == {"_entities": [{"upc": "B00005N5PF"}, {"upc": "B00005N5PG"}]}
+
+
+ENTITIES_QUERY = """
+    query ($representations: [_Any!]!) {
+        _entities(representations: $representations) {
+            ... on Product {
+                upc
+            }
+            ... on Review {
+                id
+            }
+        }
+    }
+"""
+
+
+def test_resolve_references_receives_all_representations_of_a_type():
+    batches = []
+
+    @strawberry.federation.type(keys=["upc"])
+    class Product:
+        upc: str
+
+        @classmethod
+        def resolve_references(
+            cls, info: Info, representations: typing.List[dict]
+        ) -> typing.List["Product"]:
+            assert info.field_name == "_entities"
+            batches.append([r["upc"] for r in representations])
+            return [Product(upc=r["upc"]) for r in representations]
+
+    @strawberry.federation.type(keys=["id"])
+    class Review:
+        id: int
+
+        @classmethod
+        def resolve_reference(cls, id: int) -> "Review":
+            return Review(id=id)
+
+    @strawberry.federation.type(extend=True)
+    class Query:
+        @strawberry.field
+        def top_products(self, first: int) -> typing.List[Product]:  # pragma: no cover
+            return []
+
+        @strawberry.field
+        def reviews(self) -> typing.List[Review]:  # pragma: no cover
+            return []
+
+    schema = strawberry.federation.Schema(query=Query, enable_federation_2=True)
+
+    result = schema.execute_sync(
+        ENTITIES_QUERY,
+        variable_values={
+            "representations": [
+                {"__typename": "Product", "upc": "1"},
+                {"__typename": "Review", "id": 1},
+                {"__typename": "Product", "upc": "2"},
+            ]
+        },
+    )
+
+    assert not result.errors
+    assert result.data == {"_entities": [{"upc": "1"}, {"id": 1}, {"upc": "2"}]}
+    assert batches == [["1", "2"]]
+
+
+def test_resolve_references_errors():
+    @strawberry.federation.type(keys=["upc"])
+    class Product:
+        upc: str
+
+        @classmethod
+        def resolve_references(
+            cls, representations: typing.List[dict]
+        ) -> typing.List[typing.Union["Product", Exception]]:
+            return [
+                Exception("Not found") if r["upc"] == "missing" else Product(**r)
+                for r in representations
+            ]
+
+    @strawberry.federation.type(keys=["id"])
+    class Review:
+        id: int
+
+        @classmethod
+        def resolve_references(
+            cls, representations: typing.List[dict]
+        ) -> typing.List["Review"]:
+            raise Exception("Reviews are down")
+
+    @strawberry.federation.type(extend=True)
+    class Query:
+        @strawberry.field
+        def top_products(self, first: int) -> typing.List[Product]:  # pragma: no cover
+            return []
+
+        @strawberry.field
+        def reviews(self) -> typing.List[Review]:  # pragma: no cover
+            return []
+
+    schema = strawberry.federation.Schema(query=Query, enable_federation_2=True)
+
+    result = schema.execute_sync(
+        ENTITIES_QUERY,
+        variable_values={
+            "representations": [
+                {"__typename": "Product", "upc": "1"},
+                {"__typename": "Product", "upc": "missing"},
+                {"__typename": "Review", "id": 1},
+            ]
+        },
+    )
+
+    assert result.data == {"_entities": [{"upc": "1"}, None, None]}
+    assert [(error.message, error.path) for error in result.errors] == [
+        ("Not found", ["_entities", 1]),
+        ("Reviews are down", ["_entities", 2]),
+    ]
+
+
+def test_resolve_references_must_return_one_entity_per_representation():
+    @strawberry.federation.type(keys=["upc"])
+    class Product:
+        upc: str
+
+        @classmethod
+        def resolve_references(
+            cls, representations: typing.List[dict]
+        ) -> typing.List["Product"]:
+            return []
+
+    @strawberry.federation.type(extend=True)
+    class Query:
+        @strawberry.field
+        def top_products(self, first: int) -> typing.List[Product]:  # pragma: no cover
+            return []
+
+    schema = strawberry.federation.Schema(query=Query, enable_federation_2=True)
+
+    result = schema.execute_sync(
+        """
+        query ($representations: [_Any!]!) {
+            _entities(representations: $representations) {
+                ... on Product {
+                    upc
+                }
+            }
+        }
+        """,
+        variable_values={"representations": [{"__typename": "Product", "upc": "1"}]},
+    )
+
+    assert result.data == {"_entities": [None]}
+    assert result.errors[0].message == (
+        "`resolve_references` of Product returned 0 entities for 1 representations"
+    )
+
+
+async def test_async_resolve_references():
+    batches = []
+
+    @strawberry.federation.type(keys=["upc"])
+    class Product:
+        upc: str
+
+        @classmethod
+        async def resolve_references(
+            cls, representations: typing.List[dict]
+        ) -> typing.List["Product"]:
+            batches.append(len(representations))
+            return [Product(upc=r["upc"]) for r in representations]
+
+    @strawberry.federation.type(keys=["id"])
+    class Review:
+        id: int
+
+        @classmethod
+        async def resolve_references(
+            cls, representations: typing.List[dict]
+        ) -> typing.List["Review"]:
+            batches.append(len(representations))
+            return [Review(id=r["id"]) for r in representations]
+
+    @strawberry.federation.type(extend=True)
+    class Query:
+        @strawberry.field
+        def top_products(self, first: int) -> typing.List[Product]:  # pragma: no cover
+            return []
+
+        @strawberry.field
+        def reviews(self) -> typing.List[Review]:  # pragma: no cover
+            return []
+
+    schema = strawberry.federation.Schema(query=Query, enable_federation_2=True)
+
+    result = await schema.execute(
+        ENTITIES_QUERY,
+        variable_values={
+            "representations": [
+                {"__typename": "Review", "id": index}
+                if index % 2
+                else {"__typename": "Product", "upc": str(index)}
+                for index in range(100)
+            ]
+        },
+    )
+
+    assert not result.errors
+    assert result.data == {
+        "_entities": [
+            {"id": index} if index % 2 else {"upc": str(index)} for index in range(100)
+        ]
+    }
+    assert batches == [50, 50]
+
+
+def test_entity_resolvers_are_prepared_once_per_type(mocker):
+    @strawberry.federation.type(keys=["upc"])
+    class Product:
+        upc: str
+
+        @classmethod
+        def resolve_reference(cls, info: Info, upc: str) -> "Product":
+            return Product(upc=upc)
+
+    @strawberry.federation.type(extend=True)
+    class Query:
+        @strawberry.field
+        def top_products(self, first: int) -> typing.List[Product]:  # pragma: no cover
+            return []
+
+    schema = strawberry.federation.Schema(query=Query, enable_federation_2=True)
+    get_func_args = mocker.spy(strawberry.federation.schema, "get_func_args")
+
+    assert schema._entity_resolvers == {}
+
+    result = schema.execute_sync(
+        """
+        query ($representations: [_Any!]!) {
+            _entities(representations: $representations) {
+                ... on Product {
+                    upc
+                }
+            }
+        }
+        """,
+        variable_values={
+            "representations": [
+                {"__typename": "Product", "upc": str(index)} for index in range(10)
+            ]
+        },
+    )
+
+    assert not result.errors
+    assert len(result.data["_entities"]) == 10
+    get_func_args.assert_called_once()
+    assert list(schema._entity_resolvers) == ["Product"]
+
+
+def test_representations_are_not_changed():
+    @strawberry.federation.type(keys=["upc"])
+    class Product:
+        upc: str
+
+        @classmethod
+        def resolve_reference(cls, info: Info, upc: str) -> "Product":
+            return Product(upc=upc)
+
+    @strawberry.federation.type(keys=["id"])
+    class Review:
+        id: int
+
+        @classmethod
+        def resolve_references(
+            cls, representations: typing.List[dict]
+        ) -> typing.List["Review"]:
+            assert all("__typename" not in r for r in representations)
+            return [Review(id=r["id"]) for r in representations]
+
+    @strawberry.federation.type(extend=True)
+    class Query:
+        @strawberry.field
+        def top_products(self, first: int) -> typing.List[Product]:  # pragma: no cover
+            return []
+
+        @strawberry.field
+        def reviews(self) -> typing.List[Review]:  # pragma: no cover
+            return []
+
+    schema = strawberry.federation.Schema(query=Query, enable_federation_2=True)
+    representations = [
+        {"__typename": "Product", "upc": "1"},
+        {"__typename": "Review", "id": 1},
+    ]
+
+    result = schema.execute_sync(
+        ENTITIES_QUERY, variable_values={"representations": representations}
+    )
+
+    assert not result.errors
+    assert result.data == {"_entities": [{"upc": "1"}, {"id": 1}]}
+    assert representations == [
+        {"__typename": "Product", "upc": "1"},
+        {"__typename": "Review", "id": 1},
+    ]
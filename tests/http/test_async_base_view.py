@@ -8,6 +8,7 @@ from typing import Any, cast
 import pytest
 
 from strawberry.http.async_base_view import AsyncBaseHTTPView
+from strawberry.http.base import BaseView
 
 
 @pytest.mark.parametrize(
@@ -38,6 +39,8 @@ async def test_stream_with_heartbeat_should_yield_items_correctly(
     assert len(set(expected)) == len(expected), "Test requires unique elements"
 
     class MockAsyncBaseHTTPView:
+        heartbeat_interval = 5
+
         def encode_multipart_data(self, *_: Any, **__: Any) -> str:
             return ""
 
@@ -78,3 +81,20 @@ async def test_stream_with_heartbeat_should_yield_items_correctly(
                 f"Order incorrect: '{curr}' (at index {item_indices[curr]}) "
                 f"should appear before '{next_item}' (at index {item_indices[next_item]})"
             )
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        ("", True),
+        ("*/*", True),
+        ("multipart/mixed", True),
+        ("multipart/mixed;deferSpec=20220824,application/json", True),
+        ("application/json, multipart/mixed; deferSpec=20220824", True),
+        ("application/json", False),
+        ("application/graphql-response+json, application/json", False),
+        ("multipart/mixed;deferSpec=19990101", False),
+    ],
+)
+def test_accepts_incremental_delivery(accept: str, expected: bool) -> None:
+    assert BaseView()._accepts_incremental_delivery(accept) is expected
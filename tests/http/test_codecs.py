@@ -0,0 +1,192 @@
+import contextlib
+import json
+from decimal import Decimal
+from typing import Any, Union
+from unittest.mock import Mock
+
+import pytest
+
+from strawberry.http.base import BaseView
+from strawberry.http.codecs import (
+    MsgspecJSONCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    get_fastest_json_codec,
+    iter_json_chunks,
+)
+from strawberry.schema.config import StrawberryConfig
+
+
+def _codecs() -> list:
+    codecs: list = [StdlibJSONCodec()]
+
+    for codec_class in (OrjsonCodec, MsgspecJSONCodec):
+        with contextlib.suppress(ImportError):
+            codecs.append(codec_class())
+
+    return codecs
+
+
+@pytest.fixture(params=_codecs(), ids=lambda codec: type(codec).__name__)
+def codec(request: pytest.FixtureRequest):
+    return request.param
+
+
+def test_codec_round_trip(codec):
+    data = {"data": {"hello": "Hello world", "list": [1, 2.5, None, True]}}
+
+    encoded = codec.encode(data)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == data
+    assert codec.decode(encoded) == data
+    assert codec.decode(encoded.decode()) == data
+
+
+def test_codec_raises_json_decode_error(codec):
+    with pytest.raises(json.JSONDecodeError):
+        codec.decode(b"{ not json")
+
+
+def test_codec_falls_back_for_values_the_fast_library_rejects(codec):
+    data = {"big": 2**70}
+
+    assert json.loads(codec.encode(data)) == data
+
+
+def test_default_codec_is_the_standard_library():
+    assert isinstance(BaseView.default_json_codec, StdlibJSONCodec)
+
+
+def test_fastest_codec():
+    codec = get_fastest_json_codec()
+
+    assert json.loads(codec.encode({"a": 1})) == {"a": 1}
+
+
+def test_stdlib_codec_decodes_with_the_configured_options():
+    codec = StdlibJSONCodec(loads_params={"parse_float": Decimal})
+
+    assert codec.decode('{"a": 1.1}') == {"a": Decimal("1.1")}
+
+
+def test_stdlib_codec_decodes_with_the_configured_decoder():
+    class Decoder(json.JSONDecoder):
+        def __init__(self, **kwargs: Any) -> None:
+            super().__init__(object_hook=lambda value: sorted(value), **kwargs)
+
+    codec = StdlibJSONCodec(decoder=Decoder)
+
+    assert codec.decode('{"b": 1, "a": 2}') == ["a", "b"]
+
+
+class UpperCodec:
+    def encode(self, data: object) -> bytes:
+        return json.dumps(data).upper().encode()
+
+    def decode(self, data: Union[str, bytes]) -> object:
+        return json.loads(data)
+
+
+class FakeSchema:
+    def __init__(self, config: StrawberryConfig) -> None:
+        self.config = config
+
+
+def test_view_uses_the_schema_codec():
+    view = BaseView()
+    view.schema = FakeSchema(StrawberryConfig(json_codec=UpperCodec()))  # type: ignore
+
+    assert view.encode_json({"a": "b"}) == b'{"A": "B"}'
+    assert view.encode_json_text({"a": "b"}) == '{"A": "B"}'
+
+
+def test_view_codec_takes_precedence_over_the_schema_codec():
+    view = BaseView()
+    view.schema = FakeSchema(StrawberryConfig(json_codec=UpperCodec()))  # type: ignore
+    view.json_codec = StdlibJSONCodec()
+
+    assert view.encode_json({"a": "b"}) == b'{"a": "b"}'
+
+
+def test_invalid_json_is_a_bad_request():
+    from strawberry.http.exceptions import HTTPException
+
+    view = BaseView()
+
+    with pytest.raises(HTTPException) as exc_info:
+        view.parse_json(b"{ not json")
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        [],
+        None,
+        "string",
+        {"data": {"a": [1, {"b": []}, {}], "c": {"d": None}}},
+        [[[]], [1, [2, [3]]]],
+        {"data": {"items": [{"name": "é" * 5, "id": i} for i in range(100)]}},
+    ],
+)
+def test_iter_json_chunks(data: object):
+    chunks = list(iter_json_chunks(data, StdlibJSONCodec().encode, chunk_size=16))
+
+    assert json.loads(b"".join(chunks)) == data
+    for chunk in chunks:
+        chunk.decode()
+
+
+def test_iter_json_chunks_respects_chunk_size():
+    data = {"data": {"items": [f"item {i}" for i in range(1000)]}}
+
+    chunks = list(iter_json_chunks(data, StdlibJSONCodec().encode, chunk_size=64))
+
+    assert len(chunks) > 50
+    # a chunk is flushed once it's over the size, with at most one more batch
+    assert all(len(chunk) < 2 * 64 + 16 for chunk in chunks)
+
+
+def test_iter_json_chunks_encodes_batches_of_items():
+    encode = Mock(side_effect=json.dumps)
+    data = {"items": [f"item {i}" for i in range(1000)]}
+
+    chunks = list(iter_json_chunks(data, encode, chunk_size=1024))
+
+    assert json.loads(b"".join(chunks)) == data
+    assert encode.call_count < 100
+
+
+def test_iter_json_chunks_accepts_str_encoders():
+    chunks = iter_json_chunks({"a": [1, 2]}, json.dumps)
+
+    assert json.loads(b"".join(chunks)) == {"a": [1, 2]}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1024])
+def test_iter_json_chunks_encodes_keys_like_the_standard_library(chunk_size: int):
+    data = {True: {"a": [1]}, None: [2], 3: {"b": None}, 1.5: "c"}
+
+    chunks = iter_json_chunks(data, json.dumps, chunk_size=chunk_size)
+
+    assert json.loads(b"".join(chunks)) == json.loads(json.dumps(data))
+
+
+def test_iter_json_chunks_reports_values_that_cant_be_encoded():
+    errors = []
+    data = {"a": [1, object(), {"b": object()}], "c": 2}
+
+    chunks = iter_json_chunks(
+        data, json.dumps, on_error=lambda path, error: errors.append(path)
+    )
+
+    assert json.loads(b"".join(chunks)) == {"a": [1, None, {"b": None}], "c": 2}
+    assert errors == [("a", 1), ("a", 2, "b")]
+
+
+def test_iter_json_chunks_raises_without_on_error():
+    with pytest.raises(TypeError):
+        list(iter_json_chunks({"a": [object()]}, json.dumps))
@@ -1,8 +1,10 @@
-from typing import Union
+from typing import Any, Optional, Union
 from typing_extensions import Literal
 
 import pytest
 
+from strawberry.http.ides import get_graphql_ide_etag, get_graphql_ide_html
+
 from .clients.base import HttpClient
 
 
@@ -88,3 +90,62 @@ async def test_renders_graphiql_disabled_deprecated(
         response = await http_client.get("/graphql", headers={"Accept": "text/html"})
 
     assert response.status_code == 404
+
+
+def _get_header(response: Any, name: str) -> Optional[str]:
+    headers = {key.lower(): value for key, value in response.headers.items()}
+
+    return headers.get(name)
+
+
+async def test_graphql_ide_is_sent_with_etag_and_cache_control(
+    http_client_class: type[HttpClient],
+):
+    http_client = http_client_class()
+
+    response = await http_client.get("/graphql", headers={"Accept": "text/html"})
+
+    assert response.status_code == 200
+    assert _get_header(response, "etag") == get_graphql_ide_etag(response.text)
+    assert _get_header(response, "cache-control") == "no-cache"
+
+
+@pytest.mark.parametrize("weak", [False, True])
+async def test_graphql_ide_not_modified(
+    http_client_class: type[HttpClient], weak: bool
+):
+    http_client = http_client_class()
+
+    response = await http_client.get("/graphql", headers={"Accept": "text/html"})
+    etag = _get_header(response, "etag")
+    assert etag is not None
+
+    response = await http_client.get(
+        "/graphql",
+        headers={
+            "Accept": "text/html",
+            "If-None-Match": f'"other", W/{etag}' if weak else etag,
+        },
+    )
+
+    assert response.status_code == 304
+    assert not response.data
+    assert _get_header(response, "etag") == etag
+
+
+async def test_graphql_ide_is_sent_when_etag_does_not_match(
+    http_client_class: type[HttpClient],
+):
+    http_client = http_client_class()
+
+    response = await http_client.get(
+        "/graphql", headers={"Accept": "text/html", "If-None-Match": '"outdated"'}
+    )
+
+    assert response.status_code == 200
+    assert "<title>Strawberry" in response.text
+
+
+def test_graphql_ide_html_is_cached():
+    assert get_graphql_ide_html("pathfinder") is get_graphql_ide_html("pathfinder")
+    assert get_graphql_ide_html("graphiql") != get_graphql_ide_html("pathfinder")
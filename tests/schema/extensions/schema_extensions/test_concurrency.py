@@ -0,0 +1,168 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from typing import Any, Callable
+
+import pytest
+
+import strawberry
+from strawberry.extensions import SchemaExtension
+from strawberry.extensions.tracing import ApolloTracingExtension
+from strawberry.types.graphql import OperationType
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    async def hello(self, name: str) -> str:
+        await asyncio.sleep(0)
+        return f"Hello {name}"
+
+    @strawberry.field
+    def hello_sync(self, name: str) -> str:
+        return f"Hello {name}"
+
+
+class RecordingExtension(SchemaExtension):
+    """Records the query seen by each hook."""
+
+    def __init__(self) -> None:
+        self.seen: list[tuple[str, str, str]] = []
+
+    def record(self, hook: str, expected: str) -> None:
+        self.seen.append((hook, expected, self.execution_context.query))
+
+    async def on_operation(self):
+        query = self.execution_context.query
+        self.record("on_operation", query)
+        await asyncio.sleep(0)
+        yield
+        await asyncio.sleep(0)
+        self.record("on_operation exit", query)
+
+    async def resolve(
+        self,
+        _next: Callable,
+        root: Any,
+        info: strawberry.Info,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        await asyncio.sleep(0)
+        self.record("resolve", info.context["query"])
+        return await _next(root, info, *args, **kwargs)
+
+    def get_results(self) -> dict[str, Any]:
+        self.record("get_results", self.execution_context.context["query"])
+        return {}
+
+
+async def test_shared_extension_instances_see_their_own_execution_context():
+    extension = RecordingExtension()
+    schema = strawberry.Schema(query=Query, extensions=[extension])
+
+    queries = [f'query Op{i} {{ hello(name: "{i}") }}' for i in range(10)]
+
+    results = await asyncio.gather(
+        *(schema.execute(query, context_value={"query": query}) for query in queries)
+    )
+
+    assert all(not result.errors for result in results)
+    assert len(extension.seen) == 40
+    for hook, expected, seen in extension.seen:
+        assert seen == expected, hook
+
+
+def test_shared_extension_instances_in_threads():
+    class SyncRecordingExtension(SchemaExtension):
+        def __init__(self) -> None:
+            self.mismatches = 0
+
+        def on_operation(self):
+            query = self.execution_context.query
+            yield
+            if self.execution_context.query != query:
+                self.mismatches += 1
+
+    extension = SyncRecordingExtension()
+    schema = strawberry.Schema(query=Query, extensions=[extension])
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(
+            executor.map(
+                lambda i: schema.execute_sync(
+                    f'query Op{i} {{ helloSync(name: "{i}") }}'
+                ),
+                range(50),
+            )
+        )
+
+    assert all(not result.errors for result in results)
+    assert extension.mismatches == 0
+
+
+async def test_extension_classes_are_instantiated_for_each_operation():
+    schema = strawberry.Schema(query=Query, extensions=[ApolloTracingExtension])
+
+    results = await asyncio.gather(
+        schema.execute('query A { hello(name: "a") }'),
+        schema.execute('query B { hello(name: "b") }'),
+        schema.execute('query C { hello(name: "c") }'),
+    )
+
+    for result in results:
+        assert not result.errors
+        resolvers = result.extensions["tracing"]["execution"]["resolvers"]
+        assert [resolver["field_name"] for resolver in resolvers] == ["hello"]
+
+
+def test_execution_context_of_the_last_operation_is_kept_on_shared_instances():
+    class MyExtension(SchemaExtension):
+        def on_execute(self):
+            self.operation_type = self.execution_context.operation_type
+            yield
+
+    extension = MyExtension()
+    schema = strawberry.Schema(query=Query, extensions=[extension])
+
+    with pytest.raises(AttributeError):
+        extension.execution_context
+
+    result = schema.execute_sync('{ helloSync(name: "a") }')
+
+    assert not result.errors
+    assert extension.operation_type == OperationType.QUERY
+    # outside of the hooks, the execution context of the last operation is
+    # returned, as extensions used to read it later on
+    assert extension.execution_context.query == '{ helloSync(name: "a") }'
+
+
+async def test_shared_extension_instances_can_be_copied_for_each_operation():
+    class PerOperationExtension(SchemaExtension):
+        def __init__(self, prefix: str) -> None:
+            self.prefix = prefix
+            self.queries: list[str] = []
+
+        def for_operation(self) -> SchemaExtension:
+            extension = copy(self)
+            extension.queries = []
+            return extension
+
+        async def on_operation(self):
+            self.queries.append(self.execution_context.query)
+            await asyncio.sleep(0)
+            yield
+
+        def get_results(self) -> dict[str, Any]:
+            return {self.prefix: self.queries}
+
+    extension = PerOperationExtension("queries")
+    schema = strawberry.Schema(query=Query, extensions=[extension])
+    queries = [f'{{ hello(name: "{i}") }}' for i in range(5)]
+
+    results = await asyncio.gather(*(schema.execute(query) for query in queries))
+
+    assert [result.extensions["queries"] for result in results] == [
+        [query] for query in queries
+    ]
+    assert extension.queries == []
@@ -0,0 +1,215 @@
+import asyncio
+from collections.abc import Hashable
+from typing import Any, Optional
+
+import pytest
+
+import strawberry
+from strawberry.field_extensions import CachedField
+from strawberry.field_extensions.cached_field import (
+    CachedFieldBackend,
+    InMemoryCachedFieldBackend,
+    freeze_arguments,
+)
+
+
+@strawberry.input
+class Filter:
+    tags: list[str]
+    limit: Optional[int] = None
+
+
+def test_freeze_arguments():
+    frozen = freeze_arguments({"filter": Filter(tags=["a"]), "ids": [1, 2]})
+
+    assert hash(frozen)
+    assert frozen == freeze_arguments({"ids": [1, 2], "filter": Filter(tags=["a"])})
+    assert frozen != freeze_arguments({"filter": Filter(tags=["b"]), "ids": [1, 2]})
+
+
+def make_schema(extension: CachedField, calls: list[Any]) -> strawberry.Schema:
+    @strawberry.type
+    class Product:
+        id: int
+
+        @strawberry.field(extensions=[extension])
+        def rate(self, currency: str) -> float:
+            calls.append(currency)
+            return 1.5
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def products(self) -> list[Product]:
+            return [Product(id=1), Product(id=2), Product(id=1)]
+
+    return strawberry.Schema(query=Query)
+
+
+def test_request_scope():
+    calls: list[Any] = []
+    schema = make_schema(CachedField(), calls)
+    query = '{ products { eur: rate(currency: "EUR") usd: rate(currency: "USD") } }'
+
+    for _ in range(2):
+        result = schema.execute_sync(query)
+        assert not result.errors
+        assert result.data == {"products": [{"eur": 1.5, "usd": 1.5}] * 3}
+
+    assert calls == ["EUR", "USD", "EUR", "USD"]
+
+
+def test_parent_key():
+    calls: list[Any] = []
+    schema = make_schema(CachedField(parent_key=lambda product: product.id), calls)
+
+    result = schema.execute_sync('{ products { rate(currency: "EUR") } }')
+
+    assert not result.errors
+    assert len(calls) == 2
+
+
+def test_process_scope_with_ttl():
+    calls: list[Any] = []
+    clock_time = 0.0
+    extension = CachedField(ttl=5)
+    assert isinstance(extension.backend, InMemoryCachedFieldBackend)
+    extension.backend.clock = lambda: clock_time
+    schema = make_schema(extension, calls)
+    query = '{ products { rate(currency: "EUR") } }'
+
+    schema.execute_sync(query)
+    schema.execute_sync(query)
+    assert calls == ["EUR"]
+
+    clock_time = 5
+    schema.execute_sync(query)
+    assert calls == ["EUR", "EUR"]
+
+
+def test_custom_backend():
+    class DictBackend(CachedFieldBackend):
+        def __init__(self) -> None:
+            self.values: dict[Hashable, tuple[Any, float]] = {}
+
+        def load(self, key: Hashable) -> Any:
+            return self.values[key][0]
+
+        def store(self, key: Hashable, value: Any, ttl: float) -> None:
+            self.values[key] = (value, ttl)
+
+    backend = DictBackend()
+    calls: list[Any] = []
+    schema = make_schema(CachedField(ttl=30, backend=backend), calls)
+
+    schema.execute_sync('{ products { rate(currency: "EUR") } }')
+
+    assert calls == ["EUR"]
+    assert list(backend.values.values()) == [(1.5, 30)]
+
+
+def test_backend_requires_ttl():
+    with pytest.raises(ValueError, match="needs a ttl"):
+        CachedField(backend=InMemoryCachedFieldBackend())
+
+
+def test_errors_are_not_cached():
+    calls = []
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(extensions=[CachedField(ttl=30)])
+        def failing(self) -> Optional[str]:
+            calls.append(True)
+            raise ValueError("Failed")
+
+    schema = strawberry.Schema(query=Query)
+
+    for _ in range(2):
+        assert schema.execute_sync("{ failing }").errors
+
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("ttl", [None, 30])
+async def test_concurrent_calls_are_deduplicated(ttl: Optional[float]):
+    calls = []
+
+    @strawberry.type
+    class Item:
+        id: int
+
+        @strawberry.field(extensions=[CachedField(ttl=ttl)])
+        async def flag(self, name: str) -> bool:
+            calls.append(name)
+            await asyncio.sleep(0.01)
+            return True
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def items(self) -> list[Item]:
+            return [Item(id=i) for i in range(50)]
+
+    schema = strawberry.Schema(query=Query)
+
+    result = await schema.execute('{ items { a: flag(name: "a") b: flag(name: "b") } }')
+
+    assert not result.errors
+    assert result.data == {"items": [{"a": True, "b": True}] * 50}
+    assert sorted(calls) == ["a", "b"]
+
+
+async def test_concurrent_calls_share_errors():
+    calls = []
+
+    @strawberry.type
+    class Item:
+        @strawberry.field(extensions=[CachedField()])
+        async def flag(self) -> Optional[bool]:
+            calls.append(True)
+            await asyncio.sleep(0.01)
+            raise ValueError("Failed")
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def items(self) -> list[Item]:
+            return [Item() for _ in range(3)]
+
+    schema = strawberry.Schema(query=Query)
+
+    result = await schema.execute("{ items { flag } }")
+
+    assert [error.message for error in result.errors] == ["Failed"] * 3
+    assert len(calls) == 1
+
+
+async def test_cancelling_a_caller_does_not_cancel_the_others():
+    calls = []
+    started = asyncio.Event()
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(extensions=[CachedField(ttl=5)])
+        async def rate(self, currency: str) -> float:
+            calls.append(currency)
+            started.set()
+            await asyncio.sleep(0.01)
+            return 1.5
+
+    schema = strawberry.Schema(query=Query)
+    query = '{ rate(currency: "EUR") }'
+
+    first = asyncio.ensure_future(schema.execute(query))
+    await started.wait()
+    second = asyncio.ensure_future(schema.execute(query))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    result = await second
+
+    assert first.cancelled()
+    assert not result.errors
+    assert result.data == {"rate": 1.5}
+    assert calls == ["EUR"]
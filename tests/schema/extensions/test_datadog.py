@@ -332,3 +332,48 @@ async def test_uses_query_missing_operation_if_no_query(datadog_extension, mocke
             mocker.call.trace().set_tag("graphql.operation_type", "query_missing"),
         ]
     )
+
+
+@pytest.mark.asyncio
+async def test_unsampled_operations_are_not_traced(datadog_extension):
+    extension, mock = datadog_extension
+
+    schema = strawberry.Schema(query=Query, extensions=[extension(sample_rate=0)])
+
+    result = await schema.execute("query { personAsync { name } }")
+
+    assert not result.errors
+    mock.tracer.trace.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_slow_unsampled_operations_get_an_operation_span(datadog_extension):
+    extension, mock = datadog_extension
+
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[extension(sample_rate=0, slow_operation_threshold=0)],
+    )
+
+    await schema.execute("query Example { personAsync { name } }")
+
+    mock.tracer.trace.assert_called_once()
+    assert mock.tracer.trace.call_args.args == ("Example",)
+    mock.tracer.trace().set_tag.assert_any_call("graphql.sampled", False)
+
+
+@pytest.mark.asyncio
+async def test_excluded_fields_are_not_traced(datadog_extension):
+    extension, mock = datadog_extension
+
+    schema = strawberry.Schema(
+        query=Query, extensions=[extension(exclude_fields=["Query.personAsync"])]
+    )
+
+    await schema.execute("query { personAsync { name } }")
+
+    assert [call.args[0] for call in mock.tracer.trace.call_args_list] == [
+        "Anonymous Query",
+        "Parsing",
+        "Validation",
+    ]
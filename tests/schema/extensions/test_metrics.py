@@ -0,0 +1,253 @@
+import asyncio
+import socket
+import threading
+
+import pytest
+
+import strawberry
+from strawberry.extensions import MetricsExtension
+from strawberry.extensions.metrics import (
+    CallbackExporter,
+    Histogram,
+    MetricsRegistry,
+    PrometheusExporter,
+    StatsDExporter,
+)
+
+
+@strawberry.type
+class Person:
+    name: str
+
+    @strawberry.field
+    async def age(self) -> int:
+        await asyncio.sleep(0)
+        return 42
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def person(self) -> Person:
+        return Person(name="Jess")
+
+    @strawberry.field
+    def fail(self) -> str:
+        raise ValueError("Boom")
+
+    @strawberry.field
+    async def async_fail(self) -> str:
+        raise ValueError("Boom")
+
+
+def test_histogram_buckets():
+    histogram = Histogram((0.1, 1.0))
+
+    for value in (0.05, 0.1, 0.5, 5):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(5.65)
+
+
+def test_collects_field_metrics():
+    metrics = MetricsExtension()
+    schema = strawberry.Schema(query=Query, extensions=[metrics])
+
+    for _ in range(3):
+        result = schema.execute_sync("query Q { person { name } }")
+        assert not result.errors
+
+    fields = metrics.registry.fields
+    assert fields[("Query", "person")].calls == 3
+    assert fields[("Query", "person")].errors == 0
+    # Fields using the default resolver aren't measured
+    assert ("Person", "name") not in fields
+
+
+def test_collects_errors():
+    metrics = MetricsExtension()
+    schema = strawberry.Schema(query=Query, extensions=[metrics])
+
+    result = schema.execute_sync("query Failing { fail }")
+
+    assert result.errors
+    assert metrics.registry.fields[("Query", "fail")].errors == 1
+    assert metrics.registry.operations["Failing"].errors == 1
+
+
+async def test_collects_async_field_metrics():
+    metrics = MetricsExtension()
+    schema = strawberry.Schema(query=Query, extensions=[metrics])
+
+    result = await schema.execute("{ person { age } asyncFail }")
+
+    assert result.errors
+    fields = metrics.registry.fields
+    assert fields[("Person", "age")].calls == 1
+    assert fields[("Query", "asyncFail")].calls == 1
+    assert fields[("Query", "asyncFail")].errors == 1
+
+
+async def test_concurrent_operations_are_timed_separately():
+    metrics = MetricsExtension()
+    schema = strawberry.Schema(query=Query, extensions=[metrics])
+
+    await asyncio.gather(
+        schema.execute("query A { person { age } }"),
+        schema.execute("query B { person { age } }"),
+    )
+
+    for name in ("A", "B"):
+        operation = metrics.registry.operations[name]
+
+        assert operation.count == 1
+        assert operation.errors == 0
+        for phase in ("parse", "validate", "execute", "operation"):
+            assert operation.phases[phase].count == 1
+
+
+def test_exporters_run_periodically_in_a_thread():
+    exported = threading.Event()
+    threads: list[threading.Thread] = []
+
+    def export(registry: MetricsRegistry) -> None:
+        threads.append(threading.current_thread())
+        exported.set()
+
+    metrics = MetricsExtension(
+        exporters=[CallbackExporter(export)], export_interval=0.01
+    )
+    schema = strawberry.Schema(query=Query, extensions=[metrics])
+
+    assert metrics._export_thread is None
+
+    schema.execute_sync("{ person { name } }")
+
+    assert exported.wait(5)
+    assert threads[0] is not threading.current_thread()
+
+    metrics.stop()
+    exported.clear()
+    schema.execute_sync("{ person { name } }")
+
+    assert not metrics._export_thread.is_alive()
+    assert not exported.wait(0.05)
+
+
+def test_operations_do_not_wait_for_exporters():
+    release = threading.Event()
+    metrics = MetricsExtension(
+        exporters=[CallbackExporter(lambda registry: release.wait(5))],
+        export_interval=0,
+    )
+    schema = strawberry.Schema(query=Query, extensions=[metrics])
+
+    try:
+        for _ in range(3):
+            result = schema.execute_sync("{ person { name } }")
+            assert not result.errors
+    finally:
+        release.set()
+        metrics.stop()
+
+    assert metrics.registry.operations["anonymous"].count == 3
+
+
+def test_stop_exports_the_last_metrics():
+    exported: list[MetricsRegistry] = []
+    metrics = MetricsExtension(
+        exporters=[CallbackExporter(exported.append)], export_interval=3600
+    )
+    schema = strawberry.Schema(query=Query, extensions=[metrics])
+
+    schema.execute_sync("{ person { name } }")
+    assert exported == []
+
+    metrics.stop()
+    assert exported == [metrics.registry]
+
+
+def test_failing_exporters_do_not_fail_operations():
+    def fail(registry: MetricsRegistry) -> None:
+        raise RuntimeError("Exporter failed")
+
+    metrics = MetricsExtension(exporters=[CallbackExporter(fail)], export_interval=0)
+    schema = strawberry.Schema(query=Query, extensions=[metrics])
+
+    result = schema.execute_sync("{ person { name } }")
+
+    assert not result.errors
+    metrics.stop()
+
+
+def test_prometheus_exporter():
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry.field("Query", "person").duration.observe(0.05)
+    registry.field("Query", "person").duration.observe(0.5)
+    registry.field("Query", "person").errors += 1
+    registry.operation('My "Op"').count += 1
+
+    text = PrometheusExporter().render(registry)
+
+    assert 'strawberry_field_calls_total{type="Query",field="person"} 2' in text
+    assert 'strawberry_field_errors_total{type="Query",field="person"} 1' in text
+    assert (
+        'strawberry_field_duration_seconds_bucket{type="Query",field="person",le="0.1"} 1'
+        in text
+    )
+    assert (
+        'strawberry_field_duration_seconds_bucket{type="Query",field="person",le="+Inf"} 2'
+        in text
+    )
+    assert (
+        'strawberry_field_duration_seconds_count{type="Query",field="person"} 2' in text
+    )
+    assert 'strawberry_operations_total{operation="My \\"Op\\""} 1' in text
+    assert "# TYPE strawberry_field_duration_seconds histogram" in text
+
+
+def test_prometheus_exporter_writes_file(tmp_path):
+    path = tmp_path / "strawberry.prom"
+    registry = MetricsRegistry()
+    registry.operation("Op").count += 1
+
+    PrometheusExporter(path=path).export(registry)
+
+    assert 'strawberry_operations_total{operation="Op"} 1' in path.read_text()
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_statsd_exporter_sends_deltas():
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(1)
+    port = receiver.getsockname()[1]
+
+    registry = MetricsRegistry()
+    exporter = StatsDExporter(port=port, prefix="app")
+
+    field = registry.field("Query", "person")
+    field.duration.observe(0.002)
+    field.duration.observe(0.004)
+    field.errors += 1
+
+    exporter.export(registry)
+    lines = receiver.recv(65535).decode().split("\n")
+
+    assert lines == [
+        "app.field.Query.person.calls:2|c",
+        "app.field.Query.person.errors:1|c",
+        "app.field.Query.person.duration:3.000|ms",
+    ]
+
+    field.duration.observe(0.001)
+    assert list(exporter.format(registry)) == [
+        "app.field.Query.person.calls:1|c",
+        "app.field.Query.person.duration:1.000|ms",
+    ]
+    # Nothing changed since the last call
+    assert list(exporter.format(registry)) == []
+
+    receiver.close()
@@ -219,3 +219,96 @@ async def test_tracing_filter_kwargs(global_tracer_mock, mocker):
             mocker.call().__enter__().set_attribute("graphql.param.name", "[...]"),
         ]
     )
+
+
+@pytest.mark.asyncio
+async def test_unsampled_operations_are_not_traced(global_tracer_mock, mocker):
+    extension = OpenTelemetryExtension(sample_rate=0)
+    schema = strawberry.Schema(query=Query, extensions=[extension])
+    resolve = mocker.spy(extension, "resolve")
+
+    result = await schema.execute("query { person { name } }")
+
+    assert not result.errors
+    global_tracer_mock.return_value.start_span.assert_not_called()
+    global_tracer_mock.return_value.start_as_current_span.assert_not_called()
+    # The field middleware isn't used at all
+    resolve.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_slow_unsampled_operations_get_an_operation_span(
+    global_tracer_mock, mocker
+):
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[OpenTelemetryExtension(sample_rate=0, slow_operation_threshold=0)],
+    )
+
+    await schema.execute("query Example { person { name } }")
+
+    start_span = global_tracer_mock.return_value.start_span
+    start_span.assert_called_once_with(
+        "GraphQL Query: Example", kind=SpanKind.SERVER, start_time=mocker.ANY
+    )
+    start_span.return_value.set_attribute.assert_any_call("graphql.sampled", False)
+    start_span.return_value.end.assert_called_once_with()
+    global_tracer_mock.return_value.start_as_current_span.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_sampling_of_fields(global_tracer_mock, mocker):
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def hi(self) -> str:
+            return "Hi"
+
+        @strawberry.field
+        def bye(self) -> str:
+            return "Bye"
+
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[OpenTelemetryExtension(include_fields=["Query.*"])],
+    )
+    await schema.execute("query { hi bye }")
+
+    assert global_tracer_mock.return_value.start_as_current_span.call_count == 2
+
+    global_tracer_mock.reset_mock()
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[OpenTelemetryExtension(exclude_fields=["Query.bye"])],
+    )
+    await schema.execute("query { hi bye }")
+
+    global_tracer_mock.return_value.start_as_current_span.assert_called_once_with(
+        "GraphQL Resolving: hi", context=mocker.ANY
+    )
+
+
+@pytest.mark.asyncio
+async def test_arguments_are_not_converted_for_non_recording_spans(
+    global_tracer_mock, mocker
+):
+    from opentelemetry.trace import INVALID_SPAN_CONTEXT, NonRecordingSpan
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def hi(self, name: str) -> str:
+            return f"Hi {name}"
+
+    start_as_current_span = global_tracer_mock.return_value.start_as_current_span
+    start_as_current_span.return_value.__enter__.return_value = NonRecordingSpan(
+        INVALID_SPAN_CONTEXT
+    )
+    extension = OpenTelemetryExtension()
+    convert = mocker.spy(extension, "convert_to_allowed_types")
+    schema = strawberry.Schema(query=Query, extensions=[extension])
+
+    result = await schema.execute('query { hi(name: "Patrick") }')
+
+    assert result.data == {"hi": "Hi Patrick"}
+    convert.assert_not_called()
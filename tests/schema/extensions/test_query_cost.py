@@ -0,0 +1,266 @@
+from collections.abc import Iterable
+from typing import Optional
+
+import pytest
+from graphql import parse
+
+import strawberry
+from strawberry import relay
+from strawberry.extensions import ParserCache, QueryCostLimiter
+from strawberry.extensions.query_cost import QueryCostAnalyzer
+from strawberry.schema.config import StrawberryConfig
+from strawberry.schema_directives import Cost, ListSize
+
+
+@strawberry.type
+class Comment:
+    text: str
+
+
+@strawberry.type(directives=[Cost(weight=2)])
+class Author:
+    name: str
+
+
+@strawberry.type
+class Book(relay.Node):
+    id: relay.NodeID[int]
+    title: str
+    author: Author
+
+    @strawberry.field
+    def comments(self, limit: int = 10) -> list[Comment]:
+        return [Comment(text="Nice")] * limit
+
+    @strawberry.field(directives=[ListSize(assumed_size=5)])
+    def tags(self) -> list[str]:
+        return []
+
+    @strawberry.field(directives=[ListSize(assumed_size=3)])
+    def reviews(self) -> list[Comment]:
+        return []
+
+
+@strawberry.type
+class Query:
+    @relay.connection(relay.ListConnection[Book])
+    def books(self) -> Iterable[Book]:
+        return [Book(id=i, title="Book", author=Author(name="Ann")) for i in range(3)]
+
+    @strawberry.field(directives=[Cost(weight=10)])
+    def search(self, first: Optional[int] = None) -> list[Book]:
+        return []
+
+
+def get_cost(
+    query: str, variables: Optional[dict] = None, default_list_size: int = 1
+) -> int:
+    schema = strawberry.Schema(
+        query=Query,
+        config=StrawberryConfig(relay_max_results=50),
+        extensions=[
+            QueryCostLimiter(max_cost=10**9, default_list_size=default_list_size)
+        ],
+    )
+
+    result = schema.execute_sync(query, variable_values=variables)
+
+    assert not result.errors
+    return result.extensions["cost"]["requested"]
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("{ search { title } }", 10),
+        ("{ search(first: 4) { title } }", 40),
+        ("{ search(first: 4) { title author { name } } }", 4 * (10 + 2)),
+        # the default value of the argument is used when it isn't passed
+        ("{ search(first: 1) { comments { text } } }", 10 + 10),
+        ("{ search(first: 1) { comments(limit: 7) { text } } }", 10 + 7),
+        ("{ search(first: 1) { tags reviews { text } } }", 10 + 3),
+        # relay connections default to relay_max_results items
+        ("{ books { edges { node { title } } } }", 1 + 50 * (1 + 1)),
+        ("{ books(first: 2) { edges { node { title } } } }", 1 + 2 * (1 + 1)),
+        (
+            "{ books(first: 2) { pageInfo { hasNextPage } edges { node { id } } } }",
+            1 + 1 + 2 * (1 + 1),
+        ),
+        (
+            "query { ...F } fragment F on Query { search(first: 3) { title } }",
+            30,
+        ),
+        ("{ __typename __schema { types { name } } }", 0),
+    ],
+)
+def test_query_cost(query: str, expected: int):
+    assert get_cost(query) == expected
+
+
+def test_query_cost_uses_variables():
+    query = "query ($first: Int) { search(first: $first) { title } }"
+
+    assert get_cost(query, {"first": 5}) == 50
+    assert get_cost(query, {"first": None}) == 10
+
+
+def test_query_cost_uses_variable_defaults():
+    query = "query ($first: Int = 4) { search(first: $first) { title } }"
+
+    assert get_cost(query) == 40
+    assert get_cost(query, {"first": 2}) == 20
+
+
+def test_query_cost_uses_argument_defaults_for_missing_variables():
+    query = (
+        "query ($limit: Int) { search(first: 1) { comments(limit: $limit) { text } } }"
+    )
+
+    assert get_cost(query) == 10 + 10
+    assert get_cost(query, {"limit": 3}) == 10 + 3
+
+
+def test_variable_defaults_cannot_bypass_the_maximum():
+    @strawberry.type
+    class Item:
+        name: str
+
+        @strawberry.field
+        def children(self, first: int = 10) -> list[Comment]:
+            return []
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def items(self, first: int = 10) -> list[Item]:
+            return []
+
+    schema = strawberry.Schema(query=Query, extensions=[QueryCostLimiter(max_cost=100)])
+
+    result = schema.execute_sync(
+        "query ($n: Int = 1000) { items(first: $n) { children(first: $n) { text } } }"
+    )
+    assert result.data is None
+    assert result.errors[0].message == (
+        "Query cost of 1001000 exceeds the maximum of 100"
+    )
+
+    result = schema.execute_sync("{ items { children { text } } }")
+    assert result.extensions == {"cost": {"requested": 10 * (1 + 10), "maximum": 100}}
+
+
+def test_default_list_size():
+    assert get_cost("{ search { title } }") == 10
+    assert get_cost("{ search { title } }", default_list_size=20) == 10 * 20
+
+
+def test_rejects_operations_over_the_maximum():
+    resolved = []
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def items(self, first: int) -> list[Comment]:
+            resolved.append(first)
+            return []
+
+    schema = strawberry.Schema(query=Query, extensions=[QueryCostLimiter(max_cost=100)])
+
+    result = schema.execute_sync("{ items(first: 100) { text } }")
+    assert not result.errors
+    assert result.extensions == {"cost": {"requested": 100, "maximum": 100}}
+
+    result = schema.execute_sync("{ items(first: 101) { text } }")
+    assert result.data is None
+    assert [error.message for error in result.errors] == [
+        "Query cost of 101 exceeds the maximum of 100"
+    ]
+    assert result.extensions == {"cost": {"requested": 101, "maximum": 100}}
+    assert resolved == [100]
+
+
+async def test_rejects_operations_over_the_maximum_async():
+    schema = strawberry.Schema(query=Query, extensions=[QueryCostLimiter(max_cost=5)])
+
+    result = await schema.execute("{ search { title } }")
+
+    assert result.data is None
+    assert result.errors[0].message == "Query cost of 10 exceeds the maximum of 5"
+
+
+def test_estimates_are_cached_per_document():
+    extension = QueryCostLimiter(max_cost=100)
+    schema = strawberry.Schema(query=Query, extensions=[ParserCache(), extension])
+    query = "query ($first: Int) { search(first: $first) { title } }"
+
+    for first in range(1, 6):
+        result = schema.execute_sync(query, variable_values={"first": first})
+        assert result.extensions["cost"]["requested"] == 10 * first
+
+    cache_info = extension.analyzer._estimate.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 4
+
+
+def test_cost_directives_are_printed():
+    schema = strawberry.Schema(query=Query)
+
+    assert "directive @cost(weight: Int!) on FIELD_DEFINITION" in str(schema)
+    assert "search(first: Int = null): [Book!]! @cost(weight: 10)" in str(schema)
+
+
+def test_analyzer_can_be_used_on_its_own():
+    schema = strawberry.Schema(query=Query)
+    analyzer = QueryCostAnalyzer()
+
+    estimates = analyzer.estimate(
+        schema._schema, parse("{ search(first: 2) { title } }"), None
+    )
+
+    assert sum(estimate.evaluate({}) for estimate in estimates) == 20
+
+
+@strawberry.type
+class Tree:
+    name: str = "name"
+
+    @strawberry.field
+    def tree(self) -> "Tree":
+        return Tree()
+
+
+def test_fragments_are_estimated_once():
+    levels = 40
+    fragments = ["fragment F0 on Tree { name }"] + [
+        f"fragment F{i} on Tree {{ ...F{i - 1} tree {{ ...F{i - 1} }} }}"
+        for i in range(1, levels + 1)
+    ]
+    query = f"{{ ...F{levels} }} " + " ".join(fragments)
+
+    # the document would have 2 ** 40 fields if fragments were expanded
+    schema = strawberry.Schema(query=Tree)
+    estimates = QueryCostAnalyzer().estimate(schema._schema, parse(query), None)
+
+    assert sum(estimate.evaluate({}) for estimate in estimates) == 2**levels - 1
+
+    schema = strawberry.Schema(query=Tree, extensions=[QueryCostLimiter(max_cost=100)])
+    result = schema.execute_sync(query)
+
+    assert result.data is None
+    assert result.errors[0].message.startswith("Query cost of ")
+    assert 100 < result.extensions["cost"]["requested"] < 2**levels - 1
+
+
+def test_cost_evaluation_stops_over_the_maximum():
+    schema = strawberry.Schema(query=Query)
+    estimates = QueryCostAnalyzer().estimate(
+        schema._schema,
+        parse("{ search(first: 4) { title author { name } reviews { text } } }"),
+        None,
+    )
+
+    assert [estimate.evaluate({}) for estimate in estimates] == [4 * (10 + 2 + 3)]
+    # the cost of `reviews` isn't added once the maximum is reached
+    assert [estimate.evaluate({}, maximum=45) for estimate in estimates] == [
+        4 * (10 + 2)
+    ]
@@ -464,3 +464,88 @@ def test_should_work_as_extension():
     assert (
         result.errors[0].message == "'anonymous' exceeds maximum operation depth of 4"
     )
+
+
+def test_should_count_nested_fragments_once():
+    fragments = "\n".join(
+        f"fragment f{i} on Human {{ pets {{ owner {{ ...f{i + 1} ...f{i + 1} }} }} }}"
+        for i in range(30)
+    )
+    query = (
+        f"{fragments}\nfragment f30 on Human {{ name }}\nquery q {{ user {{ ...f0 }} }}"
+    )
+
+    ignored = []
+
+    def should_ignore(ignore: IgnoreContext) -> bool:
+        ignored.append(ignore.field_name)
+        return False
+
+    errors, result = run_query(query, 100, should_ignore=should_ignore)
+
+    assert not errors
+    assert result == {"q": 61}
+    assert len(ignored) == 61
+
+
+def test_should_stop_at_max_depth():
+    query = "{ user { pets { owner { pets { owner { pets { owner { name } } } } } } } }"
+
+    ignored = []
+
+    def should_ignore(ignore: IgnoreContext) -> bool:
+        ignored.append(ignore.field_name)
+        return False
+
+    errors, result = run_query(query, 2, should_ignore=should_ignore)
+
+    assert [error.message for error in errors] == [
+        "'anonymous' exceeds maximum operation depth of 2"
+    ]
+    assert result == {"anonymous": 3}
+    assert ignored == ["user", "pets", "owner"]
+
+
+def test_should_handle_fragment_cycles():
+    query = """
+    query read { user { ...A } }
+    fragment A on Human { pets { owner { ...A } } }
+    """
+
+    errors, _ = run_query(query, 10)
+
+    assert [error.message for error in errors] == [
+        "Cannot spread fragment 'A' within itself."
+    ]
+
+
+def test_field_arguments_are_read_when_used():
+    node = (
+        parse('{ user(name: "matt") { name } }')
+        .definitions[0]
+        .selection_set.selections[0]
+    )
+
+    ignore = IgnoreContext("user", None, node, None)
+
+    assert ignore._field_args is None
+    assert ignore.field_args == {"name": "matt"}
+
+
+def test_depths_are_cached_per_document():
+    document = parse("{ user { pets { name } } }")
+    ignored = []
+
+    def should_ignore(ignore: IgnoreContext) -> bool:
+        ignored.append(ignore.field_name)
+        return False
+
+    validation_rule = create_validator(1, should_ignore)
+
+    for _ in range(2):
+        errors = validate(schema._schema, document, rules=(validation_rule,))
+        assert [error.message for error in errors] == [
+            "'anonymous' exceeds maximum operation depth of 1"
+        ]
+
+    assert ignored == ["user", "pets"]
@@ -0,0 +1,237 @@
+import math
+from collections.abc import Hashable
+from typing import Any
+
+import pytest
+
+import strawberry
+from strawberry.extensions import RateLimiter, RateLimiterSync
+from strawberry.extensions.rate_limiter import (
+    AsyncRateLimiterBackend,
+    InMemoryRateLimiterBackend,
+)
+
+
+@strawberry.type
+class Item:
+    name: str
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def items(self, first: int) -> list[Item]:
+        return [Item(name="item")] * first
+
+    @strawberry.field
+    def hello(self) -> str:
+        return "world"
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def get_key(context: Any) -> Hashable:
+    return context["client"]
+
+
+def test_in_memory_backend():
+    clock = Clock()
+    backend = InMemoryRateLimiterBackend(clock=clock)
+
+    assert backend.available("a", 10, 2) == 10
+    assert backend.consume("a", 8, 10, 2) == 0
+    assert backend.available("a", 10, 2) == 2
+    assert backend.consume("a", 4, 10, 2) == 1
+    assert backend.available("a", 10, 2) == 2
+
+    clock.now = 1
+    assert backend.consume("a", 4, 10, 2) == 0
+    assert backend.available("b", 10, 2) == 10
+
+    clock.now = 100
+    assert backend.available("a", 10, 2) == 10
+    assert backend.consume("a", 11, 10, 2) == math.inf
+
+
+def test_in_memory_backend_drops_full_buckets():
+    clock = Clock()
+    backend = InMemoryRateLimiterBackend(shards=1, max_keys_per_shard=2, clock=clock)
+
+    backend.consume("a", 1, 10, 1)
+    backend.consume("b", 5, 10, 1)
+    clock.now = 2
+    backend.consume("c", 1, 10, 1)
+
+    assert set(backend._shards[0]) == {"b", "c"}
+    assert backend.available("a", 10, 1) == 10
+    assert backend.available("b", 10, 1) == 7
+
+
+def test_in_memory_backend_bounds_the_number_of_buckets():
+    clock = Clock()
+    backend = InMemoryRateLimiterBackend(shards=1, max_keys_per_shard=100, clock=clock)
+
+    # buckets that never refill, so that none of them can be dropped as full
+    for key in range(5000):
+        backend.consume(key, 1, 10**6, 0)
+        backend.consume("active", 1, 10**6, 0)
+
+    shard = backend._shards[0]
+
+    assert len(shard) <= 100
+    # the least recently used buckets are dropped first
+    assert "active" in shard
+    assert 4999 in shard
+    assert 0 not in shard
+    assert backend.available("active", 10**6, 0) == 10**6 - 5000
+
+
+def test_charges_the_cost_of_operations():
+    clock = Clock()
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[
+            RateLimiterSync(
+                capacity=10,
+                refill_rate=1,
+                key=get_key,
+                backend=InMemoryRateLimiterBackend(clock=clock),
+            )
+        ],
+    )
+    query = "query ($first: Int!) { items(first: $first) { name } }"
+
+    result = schema.execute_sync(
+        query, variable_values={"first": 6}, context_value={"client": "a"}
+    )
+    assert not result.errors
+
+    result = schema.execute_sync(
+        query, variable_values={"first": 6}, context_value={"client": "a"}
+    )
+    assert result.data is None
+    assert result.errors[0].message == "Rate limit exceeded"
+    assert result.errors[0].extensions == {"code": "RATE_LIMITED", "retryAfter": 2}
+
+    # other clients have their own bucket
+    result = schema.execute_sync(
+        query, variable_values={"first": 6}, context_value={"client": "b"}
+    )
+    assert not result.errors
+
+    clock.now = 2
+    result = schema.execute_sync(
+        query, variable_values={"first": 6}, context_value={"client": "a"}
+    )
+    assert not result.errors
+
+
+def test_empty_buckets_are_rejected_before_parsing():
+    parsed = []
+
+    class RecordParsing(strawberry.extensions.SchemaExtension):
+        def on_parse(self):
+            parsed.append(self.execution_context.query)
+            yield
+
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[
+            RateLimiterSync(
+                capacity=2,
+                refill_rate=0.5,
+                key=get_key,
+                backend=InMemoryRateLimiterBackend(clock=Clock()),
+            ),
+            RecordParsing,
+        ],
+    )
+
+    for _ in range(2):
+        result = schema.execute_sync("{ hello }", context_value={"client": "a"})
+        assert not result.errors
+
+    result = schema.execute_sync("{ hello }", context_value={"client": "a"})
+
+    assert result.errors[0].message == "Rate limit exceeded"
+    assert result.errors[0].extensions == {"code": "RATE_LIMITED", "retryAfter": 2}
+    assert len(parsed) == 2
+
+
+def test_operations_without_key_are_not_limited():
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[RateLimiterSync(capacity=1, refill_rate=0, key=lambda _: None)],
+    )
+
+    for _ in range(3):
+        assert not schema.execute_sync("{ hello }").errors
+
+
+async def test_rate_limiter_async():
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[RateLimiter(capacity=5, refill_rate=0, key=get_key)],
+    )
+
+    result = await schema.execute(
+        "{ items(first: 5) { name } }", context_value={"client": "a"}
+    )
+    assert not result.errors
+
+    result = await schema.execute("{ hello }", context_value={"client": "a"})
+    assert result.errors[0].message == "Rate limit exceeded"
+    assert result.errors[0].extensions == {"code": "RATE_LIMITED"}
+
+
+async def test_rate_limiter_with_async_backend():
+    class RecordingBackend(AsyncRateLimiterBackend):
+        def __init__(self) -> None:
+            self.consumed: list[tuple[Hashable, float]] = []
+
+        async def available(
+            self, key: Hashable, capacity: float, refill_rate: float
+        ) -> float:
+            return capacity
+
+        async def consume(
+            self, key: Hashable, tokens: float, capacity: float, refill_rate: float
+        ) -> float:
+            self.consumed.append((key, tokens))
+            return 0 if tokens <= 3 else 5
+
+    backend = RecordingBackend()
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[
+            RateLimiter(capacity=10, refill_rate=1, key=get_key, backend=backend)
+        ],
+    )
+
+    result = await schema.execute(
+        "{ items(first: 3) { name } }", context_value={"client": "a"}
+    )
+    assert not result.errors
+
+    result = await schema.execute(
+        "{ items(first: 4) { name } }", context_value={"client": "a"}
+    )
+    assert result.errors[0].extensions == {"code": "RATE_LIMITED", "retryAfter": 5}
+
+    assert backend.consumed == [("a", 3), ("a", 4)]
+
+
+def test_sync_rate_limiter_rejects_async_backends():
+    with pytest.raises(TypeError):
+        RateLimiterSync(
+            capacity=1,
+            refill_rate=1,
+            key=get_key,
+            backend=AsyncRateLimiterBackend(),  # type: ignore[arg-type]
+        )
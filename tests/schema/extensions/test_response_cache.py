@@ -0,0 +1,322 @@
+from typing import Any, Optional
+
+import pytest
+from graphql import parse
+
+import strawberry
+from strawberry.extensions import ResponseCache, ResponseCacheSync
+from strawberry.extensions.response_cache import (
+    AsyncResponseCacheBackend,
+    CachePolicy,
+    InMemoryResponseCacheBackend,
+)
+from strawberry.schema_directives import CacheControl, CacheControlScope
+
+PRIVATE = CacheControlScope.PRIVATE
+
+
+@strawberry.type
+class Review:
+    text: str
+
+
+@strawberry.type(directives=[CacheControl(max_age=60)])
+class Product:
+    name: str
+
+    @strawberry.field(directives=[CacheControl(max_age=10)])
+    def price(self) -> int:
+        return 10
+
+    @strawberry.field(directives=[CacheControl(scope=PRIVATE)])
+    def discount(self) -> int:
+        return 1
+
+    @strawberry.field
+    def review(self) -> Review:
+        return Review(text="Great")
+
+
+@strawberry.type
+class User:
+    name: str
+
+
+calls: list[str] = []
+
+
+@strawberry.type
+class Query:
+    @strawberry.field(directives=[CacheControl(max_age=30)])
+    def products(self) -> list[Product]:
+        calls.append("products")
+        return [Product(name="Strawberry")]
+
+    @strawberry.field(directives=[CacheControl(max_age=30)])
+    def reviews(self) -> list[Review]:
+        return [Review(text="Great")]
+
+    @strawberry.field(directives=[CacheControl(max_age=120, scope=PRIVATE)])
+    def me(self, info: strawberry.Info) -> User:
+        calls.append("me")
+        return User(name=info.context["user"])
+
+    @strawberry.field
+    def uncached(self) -> str:
+        return "uncached"
+
+    @strawberry.field(directives=[CacheControl(max_age=30)])
+    def not_stored(self, info: strawberry.Info) -> str:
+        info.context["response"].headers["Cache-Control"] = "no-store"
+        return "not stored"
+
+    @strawberry.field(directives=[CacheControl(max_age=30)])
+    def failing(self) -> Optional[str]:
+        calls.append("failing")
+        raise ValueError("Failed")
+
+
+@strawberry.type
+class Mutation:
+    @strawberry.mutation(directives=[CacheControl(max_age=30)])
+    def rename(self) -> str:
+        calls.append("rename")
+        return "renamed"
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    calls.clear()
+
+
+def make_schema(**kwargs: Any) -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query, mutation=Mutation, extensions=[ResponseCacheSync(**kwargs)]
+    )
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("{ products { name } }", CachePolicy(30)),
+        ("{ products { name price } }", CachePolicy(10)),
+        ("{ products { discount } }", CachePolicy(30, PRIVATE)),
+        ("{ reviews { text } }", CachePolicy(30)),
+        # fields returning objects without hints get the default max age
+        ("{ products { review { text } } }", CachePolicy(0)),
+        ("{ uncached }", CachePolicy(0)),
+        ("{ products { name } uncached }", CachePolicy(0)),
+        ("{ me { name } }", CachePolicy(120, PRIVATE)),
+        (
+            "query { ...F } fragment F on Query { products { price } }",
+            CachePolicy(10),
+        ),
+        ("{ __typename products { name } }", CachePolicy(30)),
+        ("mutation { rename }", CachePolicy(0)),
+    ],
+)
+def test_cache_policy(query: str, expected: CachePolicy):
+    extension = ResponseCacheSync()
+    schema = strawberry.Schema(query=Query, mutation=Mutation)
+
+    assert extension.analyzer.policy(schema._schema, parse(query), None) == expected
+
+
+def test_default_max_age():
+    extension = ResponseCacheSync(default_max_age=5)
+    schema = strawberry.Schema(query=Query)
+    query = parse("{ products { review { text } } }")
+
+    policy = extension.analyzer.policy(schema._schema, query, None)
+
+    assert policy == CachePolicy(5)
+
+
+def test_caches_responses():
+    schema = make_schema()
+
+    first = schema.execute_sync("{ products { name price } }")
+    second = schema.execute_sync("{ products { name price } }")
+
+    assert (
+        first.data == second.data == {"products": [{"name": "Strawberry", "price": 10}]}
+    )
+    assert first.cache_control == "max-age=10, public"
+    assert second.cache_control in ("max-age=9, public", "max-age=10, public")
+    assert calls == ["products"]
+
+
+def test_cached_responses_cannot_be_changed_by_callers():
+    schema = make_schema()
+
+    first = schema.execute_sync("{ products { name } }")
+    first.data["products"][0]["name"] = "Changed"
+
+    second = schema.execute_sync("{ products { name } }")
+    second.data["products"][0]["name"] = "Changed"
+
+    third = schema.execute_sync("{ products { name } }")
+
+    assert third.data == {"products": [{"name": "Strawberry"}]}
+    assert calls == ["products"]
+
+
+def test_cache_control_header_is_sent_by_async_views():
+    from starlette.testclient import TestClient
+
+    from strawberry.asgi import GraphQL
+
+    client = TestClient(GraphQL[Any, None](make_schema()))
+
+    for _ in range(2):
+        response = client.post("/", json={"query": "{ products { name } }"})
+
+        assert response.json() == {"data": {"products": [{"name": "Strawberry"}]}}
+        assert response.headers["cache-control"] in (
+            "max-age=30, public",
+            "max-age=29, public",
+        )
+
+    response = client.post("/", json={"query": "{ products { name } uncached }"})
+    assert "cache-control" not in response.headers
+
+    # headers set by resolvers are kept
+    response = client.post("/", json={"query": "{ notStored }"})
+    assert response.headers["cache-control"] == "no-store"
+
+
+def test_cache_control_header_is_sent_by_sync_views():
+    from flask import Flask
+    from strawberry.flask.views import GraphQLView
+
+    app = Flask(__name__)
+    app.add_url_rule(
+        "/graphql",
+        view_func=GraphQLView.as_view("graphql_view", schema=make_schema()),
+    )
+    client = app.test_client()
+
+    response = client.post("/graphql", json={"query": "{ products { name } }"})
+
+    assert response.json == {"data": {"products": [{"name": "Strawberry"}]}}
+    assert response.headers["cache-control"] == "max-age=30, public"
+
+    response = client.post("/graphql", json={"query": "{ notStored }"})
+    assert response.headers["cache-control"] == "no-store"
+
+
+def test_responses_are_cached_per_variables():
+    schema = make_schema()
+    query = "query ($a: Boolean!) { products { name @include(if: $a) } }"
+
+    schema.execute_sync(query, variable_values={"a": True})
+    schema.execute_sync(query, variable_values={"a": False})
+    result = schema.execute_sync(query, variable_values={"a": False})
+
+    assert result.data == {"products": [{}]}
+    assert calls == ["products", "products"]
+
+
+def test_uncacheable_responses_are_not_cached():
+    schema = make_schema()
+
+    for _ in range(2):
+        result = schema.execute_sync("{ products { name } uncached }")
+        assert result.cache_control is None
+
+    assert calls == ["products", "products"]
+
+
+def test_errors_are_not_cached():
+    schema = make_schema()
+
+    for _ in range(2):
+        result = schema.execute_sync("{ failing }")
+        assert result.errors
+        assert result.cache_control is None
+
+    assert calls == ["failing", "failing"]
+
+
+def test_mutations_are_not_cached():
+    schema = make_schema()
+
+    for _ in range(2):
+        assert schema.execute_sync("mutation { rename }").data == {"rename": "renamed"}
+
+    assert calls == ["rename", "rename"]
+
+
+def test_private_responses_are_cached_per_scope_key():
+    schema = make_schema(scope_key=lambda context: context["user"])
+    query = "{ me { name } }"
+
+    for user in ["ann", "bob", "ann"]:
+        result = schema.execute_sync(query, context_value={"user": user})
+        assert result.data == {"me": {"name": user}}
+
+    assert result.cache_control is not None
+    assert result.cache_control.endswith(", private")
+    assert calls == ["me", "me"]
+
+
+def test_private_responses_are_not_cached_without_scope_key():
+    schema = make_schema()
+
+    for _ in range(2):
+        schema.execute_sync("{ me { name } }", context_value={"user": "ann"})
+
+    assert calls == ["me", "me"]
+
+
+def test_in_memory_backend():
+    class Clock:
+        now = 0.0
+
+        def __call__(self) -> float:
+            return self.now
+
+    clock = Clock()
+    backend = InMemoryResponseCacheBackend(maxsize=2, clock=clock)
+
+    backend.set("a", {"value": "a"}, ttl=10)
+    backend.set("b", {"value": "b"}, ttl=5)
+    assert backend.get("a") == {"value": "a"}
+    assert backend.get("a") is not backend.get("a")
+
+    # "b" is the least recently used entry
+    backend.set("c", {"value": "c"}, ttl=10)
+    assert backend.get("b") is None
+    assert backend.get("a") == {"value": "a"}
+
+    clock.now = 10
+    assert backend.get("a") is None
+    assert backend.get("c") is None
+
+
+async def test_response_cache_with_async_backend():
+    class DictBackend(AsyncResponseCacheBackend):
+        def __init__(self) -> None:
+            self.entries: dict[str, tuple[dict[str, Any], int]] = {}
+
+        async def get(self, key: str) -> Optional[dict[str, Any]]:
+            entry = self.entries.get(key)
+            return entry[0] if entry else None
+
+        async def set(self, key: str, value: dict[str, Any], ttl: int) -> None:
+            self.entries[key] = (value, ttl)
+
+    backend = DictBackend()
+    schema = strawberry.Schema(query=Query, extensions=[ResponseCache(backend=backend)])
+
+    for _ in range(2):
+        result = await schema.execute("{ products { name } }")
+        assert result.data == {"products": [{"name": "Strawberry"}]}
+
+    assert calls == ["products"]
+    assert [ttl for _, ttl in backend.entries.values()] == [30]
+
+
+def test_sync_response_cache_rejects_async_backends():
+    with pytest.raises(TypeError):
+        ResponseCacheSync(backend=AsyncResponseCacheBackend())  # type: ignore[arg-type]
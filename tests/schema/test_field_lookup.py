@@ -0,0 +1,68 @@
+import strawberry
+from strawberry.schema.config import StrawberryConfig
+
+
+@strawberry.input
+class Filter:
+    min_price: int
+
+
+@strawberry.type
+class Product:
+    product_name: str
+    internal: strawberry.Private[str]
+
+    @strawberry.field(name="priceInCents")
+    def price(self) -> int:
+        return 100
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def products(self, filter: Filter) -> list[Product]:
+        return []
+
+
+def test_get_field():
+    definition = Product.__strawberry_definition__
+
+    assert definition.get_field("product_name") is definition.fields[0]
+    assert definition.get_field("price").python_name == "price"
+    assert definition.get_field("missing") is None
+    assert set(definition.fields_by_python_name) == {"product_name", "price"}
+
+
+def test_get_field_for_type():
+    schema = strawberry.Schema(query=Query)
+
+    field = schema.get_field_for_type("productName", "Product")
+    assert field is not None
+    assert field.python_name == "product_name"
+
+    field = schema.get_field_for_type("priceInCents", "Product")
+    assert field is not None
+    assert field.python_name == "price"
+
+    field = schema.get_field_for_type("minPrice", "Filter")
+    assert field is not None
+    assert field.python_name == "min_price"
+
+    assert schema.get_field_for_type("product_name", "Product") is None
+
+
+def test_get_fields_by_graphql_name():
+    schema = strawberry.Schema(query=Query)
+    snake_case_schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(auto_camel_case=False)
+    )
+
+    assert list(schema.get_fields_by_graphql_name("Product")) == [
+        "productName",
+        "priceInCents",
+    ]
+    assert list(snake_case_schema.get_fields_by_graphql_name("Product")) == [
+        "product_name",
+        "priceInCents",
+    ]
+    assert schema.get_fields_by_graphql_name("Missing") == {}
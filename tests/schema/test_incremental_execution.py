@@ -0,0 +1,130 @@
+import asyncio
+from typing import Any, cast
+
+import pytest
+
+import strawberry
+from strawberry.http import process_result, process_subsequent_result
+from strawberry.schema.config import StrawberryConfig
+from strawberry.types import IncrementalExecutionResult
+from strawberry.utils import IS_GQL_32
+from tests.conftest import skip_if_gql_32
+
+requires_gql_33 = skip_if_gql_32("Incremental execution requires graphql-core 3.3")
+
+
+@strawberry.type
+class Hero:
+    name: str
+
+    @strawberry.field
+    async def friends(self) -> list[str]:
+        await asyncio.sleep(0.01)
+        return ["Luke", "Leia"]
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hero(self) -> Hero:
+        return Hero(name="Han")
+
+
+@pytest.fixture
+def schema() -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query,
+        config=StrawberryConfig(enable_experimental_incremental_execution=True),
+    )
+
+
+@requires_gql_33
+def test_defer_and_stream_directives_are_added(schema: strawberry.Schema):
+    assert schema._schema.get_directive("defer") is not None
+    assert schema._schema.get_directive("stream") is not None
+
+
+def test_directives_are_not_added_by_default():
+    schema = strawberry.Schema(query=Query)
+
+    assert schema._schema.get_directive("defer") is None
+    assert schema._schema.get_directive("stream") is None
+
+
+@requires_gql_33
+async def test_defer(schema: strawberry.Schema):
+    result = await schema.execute(
+        """
+        query {
+            hero {
+                name
+                ... @defer(label: "friends") { friends }
+            }
+        }
+        """
+    )
+
+    assert isinstance(result, IncrementalExecutionResult)
+    assert not result.errors
+    assert result.data == {"hero": {"name": "Han"}}
+    assert result.has_next
+
+    initial = process_result(result)
+    assert initial["hasNext"] is True
+    assert initial["pending"] == [{"id": "0", "path": ["hero"], "label": "friends"}]
+
+    assert result.subsequent_results is not None
+    subsequent = [
+        process_subsequent_result(value) async for value in result.subsequent_results
+    ]
+
+    assert subsequent == [
+        {
+            "hasNext": False,
+            "incremental": [{"data": {"friends": ["Luke", "Leia"]}, "id": "0"}],
+            "completed": [{"id": "0"}],
+        }
+    ]
+
+
+@requires_gql_33
+async def test_stream(schema: strawberry.Schema):
+    result = await schema.execute(
+        """
+        query {
+            hero {
+                friends @stream(initialCount: 1)
+            }
+        }
+        """
+    )
+
+    assert isinstance(result, IncrementalExecutionResult)
+    assert result.data == {"hero": {"friends": ["Luke"]}}
+
+    assert result.subsequent_results is not None
+    items: list[Any] = []
+    async for value in result.subsequent_results:
+        for payload in value.incremental or ():
+            items.extend(cast("Any", payload).items)
+
+    assert items == ["Leia"]
+
+
+@requires_gql_33
+async def test_operations_without_incremental_directives_return_a_single_result(
+    schema: strawberry.Schema,
+):
+    result = await schema.execute("query { hero { name } }")
+
+    assert not isinstance(result, IncrementalExecutionResult)
+    assert result.data == {"hero": {"name": "Han"}}
+
+
+@pytest.mark.skipif(not IS_GQL_32, reason="Only relevant for graphql-core 3.2")
+def test_raises_when_graphql_core_does_not_support_incremental_execution():
+    with pytest.raises(RuntimeError, match="Incremental execution requires"):
+        strawberry.Schema(
+            query=Query,
+            config=StrawberryConfig(enable_experimental_incremental_execution=True),
+        )
@@ -0,0 +1,122 @@
+from typing import Any, Callable
+
+import strawberry
+from strawberry.extensions import SchemaExtension
+from strawberry.schema.middleware import FieldKind, classify_fields
+
+
+@strawberry.type
+class User:
+    name: str
+
+    @strawberry.field
+    def greeting(self) -> str:
+        return f"Hello, {self.name}"
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def user(self) -> User:
+        return User(name="Patrick")
+
+
+def make_extension(*, trivial: bool) -> tuple[type[SchemaExtension], list[str]]:
+    resolved: list[str] = []
+
+    class RecordingExtension(SchemaExtension):
+        resolve_trivial_fields = trivial
+
+        def resolve(
+            self,
+            _next: Callable,
+            root: Any,
+            info: strawberry.Info,
+            *args: Any,
+            **kwargs: Any,
+        ) -> Any:
+            resolved.append(f"{info.parent_type.name}.{info.field_name}")
+            return _next(root, info, *args, **kwargs)
+
+    return RecordingExtension, resolved
+
+
+def test_classify_fields():
+    schema = strawberry.Schema(query=Query)
+
+    kinds = classify_fields(schema._schema)
+
+    assert kinds["Query", "user"] is FieldKind.CUSTOM
+    assert kinds["User", "greeting"] is FieldKind.CUSTOM
+    assert kinds["User", "name"] is FieldKind.TRIVIAL
+    assert kinds["__Type", "name"] is FieldKind.INTROSPECTION
+    assert kinds["__Type", "isOneOf"] is FieldKind.INTROSPECTION
+
+
+def test_extensions_resolve_trivial_fields_by_default():
+    extension, resolved = make_extension(trivial=True)
+    schema = strawberry.Schema(query=Query, extensions=[extension])
+
+    result = schema.execute_sync("{ __typename user { name greeting } }")
+
+    assert not result.errors
+    assert resolved == [
+        "Query.__typename",
+        "Query.user",
+        "User.name",
+        "User.greeting",
+    ]
+
+
+def test_extensions_can_skip_trivial_fields():
+    extension, resolved = make_extension(trivial=False)
+    schema = strawberry.Schema(query=Query, extensions=[extension])
+
+    result = schema.execute_sync(
+        "{ __typename user { name greeting } __schema { queryType { name } } }"
+    )
+
+    assert not result.errors
+    assert resolved == ["Query.user", "User.greeting"]
+
+
+async def test_trivial_fields_only_use_the_extensions_that_need_them():
+    skipping, skipping_resolved = make_extension(trivial=False)
+    recording, recording_resolved = make_extension(trivial=True)
+    schema = strawberry.Schema(query=Query, extensions=[skipping, recording])
+
+    result = await schema.execute("{ user { name greeting } }")
+
+    assert not result.errors
+    assert skipping_resolved == ["Query.user", "User.greeting"]
+    assert recording_resolved == ["Query.user", "User.name", "User.greeting"]
+
+
+async def test_middleware_managers_are_shared_by_operations():
+    class CountingExtension(SchemaExtension):
+        def __init__(self, *, execution_context: Any = None) -> None:
+            self.resolved: list[str] = []
+
+        def resolve(
+            self,
+            _next: Callable,
+            root: Any,
+            info: strawberry.Info,
+            *args: Any,
+            **kwargs: Any,
+        ) -> Any:
+            self.resolved.append(info.field_name)
+            return _next(root, info, *args, **kwargs)
+
+        def get_results(self) -> dict[str, Any]:
+            return {"resolved": self.resolved}
+
+    schema = strawberry.Schema(query=Query, extensions=[CountingExtension])
+
+    first = await schema.execute("{ user { greeting } }")
+    second = schema.execute_sync("{ user { name } }")
+
+    # each operation's own instance is called
+    assert first.extensions == {"resolved": ["user", "greeting"]}
+    assert second.extensions == {"resolved": ["user", "name"]}
+    assert len(schema._cached_middleware_managers) == 1
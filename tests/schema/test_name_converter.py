@@ -2,6 +2,8 @@ import textwrap
 from enum import Enum
 from typing import Generic, Optional, TypeVar, Union
 
+from pytest_mock import MockerFixture
+
 import strawberry
 from strawberry.directive import StrawberryDirective
 from strawberry.schema.config import StrawberryConfig
@@ -202,3 +204,41 @@ def test_can_use_enum_value_with_variable():
     assert not result.errors
 
     assert result.data == {"printX": "a"}
+
+
+def test_names_are_converted_once(mocker: MockerFixture):
+    @strawberry.input
+    class BookFilter:
+        published_after: int
+        author_name: Optional[str] = None
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def books_count(self, book_filter: BookFilter, max_results: int) -> int:
+            return book_filter.published_after + max_results
+
+    schema = strawberry.Schema(query=Query)
+    to_camel_case = mocker.patch(
+        "strawberry.schema.name_converter.to_camel_case", side_effect=AssertionError
+    )
+
+    for _ in range(2):
+        result = schema.execute_sync(
+            "{ booksCount(bookFilter: { publishedAfter: 1 }, maxResults: 2) }"
+        )
+
+        assert not result.errors
+        assert result.data == {"booksCount": 3}
+
+    to_camel_case.assert_not_called()
+
+
+def test_cached_names_follow_auto_camel_case():
+    converter = NameConverter()
+
+    assert converter.apply_naming_config("book_filter") == "bookFilter"
+
+    converter.auto_camel_case = False
+
+    assert converter.apply_naming_config("book_filter") == "book_filter"
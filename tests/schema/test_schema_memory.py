@@ -0,0 +1,86 @@
+import gc
+import tracemalloc
+import weakref
+
+import strawberry
+from strawberry.directive import DirectiveLocation
+from strawberry.schema.config import StrawberryConfig
+
+
+@strawberry.directive(locations=[DirectiveLocation.FIELD])
+def uppercase(value: str) -> str:
+    return value.upper()
+
+
+@strawberry.type
+class Query:
+    hello: str = "world"
+
+
+def create_schema() -> strawberry.Schema:
+    schema = strawberry.Schema(query=Query, directives=[uppercase])
+
+    assert schema.get_type_by_name("Query") is Query.__strawberry_definition__
+    assert schema.get_type_by_name("Missing") is None
+    assert schema.get_directive_by_name("uppercase") is not None
+    assert schema.get_directive_by_name("missing") is None
+
+    return schema
+
+
+def test_schemas_can_be_garbage_collected():
+    schemas = weakref.WeakSet(create_schema() for _ in range(10))
+
+    gc.collect()
+
+    assert len(schemas) == 0
+
+
+def test_schemas_sharing_a_config_can_be_garbage_collected():
+    @strawberry.input
+    class Filter:
+        value: str
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def echo(self, filter: Filter) -> str:
+            return filter.value
+
+    config = StrawberryConfig()
+    schemas = weakref.WeakSet()
+    converters = weakref.WeakSet()
+
+    for _ in range(10):
+        schema = strawberry.Schema(query=Query, config=config)
+        result = schema.execute_sync('{ echo(filter: { value: "a" }) }')
+        assert result.data == {"echo": "a"}
+        schemas.add(schema)
+        converters.add(schema.schema_converter.argument_converters[Filter])
+
+    del schema
+    gc.collect()
+
+    assert len(schemas) == 0
+    assert len(converters) == 0
+
+
+def test_memory_is_stable_across_schema_constructions():
+    for _ in range(50):
+        create_schema()
+
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+
+        for _ in range(1_000):
+            create_schema()
+
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert after - before < 100_000
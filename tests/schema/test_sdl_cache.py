@@ -0,0 +1,49 @@
+import strawberry
+
+
+@strawberry.type
+class Query:
+    hello: str
+
+
+def test_sdl_is_printed_once(mocker):
+    schema = strawberry.Schema(query=Query)
+    print_schema = mocker.patch(
+        "strawberry.printer.print_schema", return_value="type Query"
+    )
+
+    assert schema.as_str() == "type Query"
+    assert str(schema) == "type Query"
+    print_schema.assert_called_once_with(schema)
+
+
+def test_invalidate_sdl():
+    schema = strawberry.Schema(query=Query)
+
+    assert schema.as_str() == "type Query {\n  hello: String!\n}"
+
+    schema._schema.query_type.description = "The root"
+    assert "The root" not in schema.as_str()
+
+    schema.invalidate_sdl()
+    assert schema.as_str().startswith('"""The root"""')
+
+
+def test_load_sdl(mocker):
+    schema = strawberry.Schema(query=Query)
+    print_schema = mocker.patch("strawberry.printer.print_schema")
+
+    schema.load_sdl("type Query { hello: String! }")
+
+    assert schema.as_str() == "type Query { hello: String! }"
+    print_schema.assert_not_called()
+
+
+def test_federation_service_uses_cached_sdl():
+    schema = strawberry.federation.Schema(query=Query)
+    schema.load_sdl("type Query { hello: String! }")
+
+    result = schema.execute_sync("{ _service { sdl } }")
+
+    assert not result.errors
+    assert result.data == {"_service": {"sdl": "type Query { hello: String! }"}}
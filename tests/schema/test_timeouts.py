@@ -0,0 +1,246 @@
+import asyncio
+import time
+from typing import Optional
+
+import strawberry
+from strawberry.dataloader import DataLoader
+from strawberry.schema.config import StrawberryConfig
+
+
+async def test_field_timeout():
+    cancelled = []
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(timeout=0.01)
+        async def slow(self) -> Optional[str]:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return "slow"
+
+        @strawberry.field(timeout=1)
+        async def fast(self) -> str:
+            return "fast"
+
+    schema = strawberry.Schema(query=Query)
+
+    result = await schema.execute("{ slow fast }")
+
+    assert result.data == {"slow": None, "fast": "fast"}
+    assert len(result.errors) == 1
+    assert result.errors[0].message == (
+        'Resolver for field "slow" timed out after 0.01s'
+    )
+    assert result.errors[0].path == ["slow"]
+    assert cancelled == [True]
+
+
+async def test_field_timeout_of_awaitables_returned_by_sync_resolvers():
+    @strawberry.type
+    class Query:
+        @strawberry.field(timeout=0.01)
+        def slow(self) -> Optional[str]:
+            return asyncio.sleep(1, "slow")  # type: ignore[return-value]
+
+    schema = strawberry.Schema(query=Query)
+
+    result = await schema.execute("{ slow }")
+
+    assert result.data == {"slow": None}
+    assert result.errors[0].message == (
+        'Resolver for field "slow" timed out after 0.01s'
+    )
+
+
+async def test_field_timeout_does_not_cancel_shared_dataloader_futures():
+    async def load_names(keys: list[int]) -> list[str]:
+        await asyncio.sleep(0.05)
+        return [f"name {key}" for key in keys]
+
+    loader = DataLoader(load_fn=load_names)
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(timeout=0.01)
+        def hurried(self) -> Optional[str]:
+            return loader.load(1)  # type: ignore[return-value]
+
+        @strawberry.field
+        def patient(self) -> str:
+            return loader.load(1)  # type: ignore[return-value]
+
+    schema = strawberry.Schema(query=Query)
+
+    result = await schema.execute("{ hurried patient }")
+
+    assert result.data == {"hurried": None, "patient": "name 1"}
+    assert len(result.errors) == 1
+    assert result.errors[0].message == (
+        'Resolver for field "hurried" timed out after 0.01s'
+    )
+    assert await loader.load(1) == "name 1"
+
+
+async def test_mutation_timeout():
+    @strawberry.type
+    class Mutation:
+        @strawberry.mutation(timeout=0.01)
+        async def slow(self) -> Optional[str]:
+            await asyncio.sleep(1)
+            return "slow"
+
+    @strawberry.type
+    class Query:
+        hello: str = "world"
+
+    schema = strawberry.Schema(query=Query, mutation=Mutation)
+
+    result = await schema.execute("mutation { slow }")
+
+    assert result.data == {"slow": None}
+    assert result.errors[0].message == (
+        'Resolver for field "slow" timed out after 0.01s'
+    )
+
+
+@strawberry.type
+class Item:
+    @strawberry.field
+    async def name(self) -> Optional[str]:
+        await asyncio.sleep(0.2)
+        return "item"
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    async def items(self) -> list[Item]:
+        return [Item(), Item()]
+
+    @strawberry.field
+    async def remaining_time(self, info: strawberry.Info) -> Optional[float]:
+        return info.remaining_time
+
+
+async def test_operation_deadline():
+    schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(operation_timeout=0.1)
+    )
+
+    result = await schema.execute("{ items { name } }")
+
+    assert result.data is None
+    assert [error.message for error in result.errors] == ["Operation deadline exceeded"]
+
+
+async def test_operation_deadline_cancels_resolvers():
+    cancelled = []
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(timeout=5)
+        async def slow(self) -> Optional[str]:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return "slow"
+
+    schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(operation_timeout=0.05)
+    )
+
+    result = await schema.execute("{ slow }")
+
+    assert result.data is None
+    assert result.errors[0].message == "Operation deadline exceeded"
+    assert cancelled == [True]
+
+
+async def test_operation_timeout_argument():
+    schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(operation_timeout=0.1)
+    )
+
+    result = await schema.execute("{ items { name } }", operation_timeout=5)
+
+    assert not result.errors
+
+    result = await schema.execute("{ items { name } }", operation_timeout=None)
+
+    assert not result.errors
+
+
+async def test_fields_without_timeout_are_not_awaited_separately(mocker):
+    wait_for = mocker.spy(asyncio, "wait_for")
+    schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(operation_timeout=5)
+    )
+
+    result = await schema.execute("{ items { name } }")
+
+    assert not result.errors
+    # the whole execution is awaited once with the operation's deadline
+    assert wait_for.call_count == 1
+
+
+async def test_remaining_time():
+    schema = strawberry.Schema(query=Query)
+
+    result = await schema.execute("{ remainingTime }")
+    assert result.data == {"remainingTime": None}
+
+    result = await schema.execute("{ remainingTime }", operation_timeout=10)
+    assert 0 < result.data["remainingTime"] <= 10
+
+
+def test_resolvers_are_not_started_after_the_deadline():
+    resolved = []
+
+    @strawberry.type
+    class Child:
+        @strawberry.field
+        def name(self) -> Optional[str]:
+            resolved.append("name")
+            return "child"
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def child(self) -> Child:
+            time.sleep(0.15)
+            return Child()
+
+    schema = strawberry.Schema(
+        query=Query, config=StrawberryConfig(operation_timeout=0.1)
+    )
+
+    result = schema.execute_sync("{ child { name } }")
+
+    assert result.data == {"child": {"name": None}}
+    assert result.errors[0].message == (
+        'Operation deadline exceeded while resolving field "name"'
+    )
+    assert resolved == []
+
+
+async def test_federation_field_timeout():
+    @strawberry.type
+    class Query:
+        @strawberry.federation.field(timeout=0.01, shareable=True)
+        async def slow(self) -> Optional[str]:
+            await asyncio.sleep(1)
+            return "slow"
+
+    schema = strawberry.federation.Schema(query=Query, enable_federation_2=True)
+
+    result = await schema.execute("{ slow }")
+
+    assert result.data == {"slow": None}
+    assert result.errors[0].message == (
+        'Resolver for field "slow" timed out after 0.01s'
+    )
@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def get_imported_modules(code: str) -> set[str]:
+    process = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return set(process.stdout.splitlines())
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "pydantic",
+        "strawberry.experimental",
+        "strawberry.federation",
+        "strawberry.relay",
+        "strawberry.printer",
+        "strawberry.extensions.query_cost",
+    ],
+)
+def test_optional_modules_are_not_imported(module: str):
+    assert module not in get_imported_modules("import strawberry")
+
+
+def test_optional_modules_are_imported_when_used():
+    modules = get_imported_modules(
+        "import strawberry\n"
+        "strawberry.federation.Schema\n"
+        "from strawberry.extensions import QueryCostLimiter"
+    )
+
+    assert "strawberry.federation" in modules
+    assert "strawberry.extensions.query_cost" in modules
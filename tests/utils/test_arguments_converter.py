@@ -2,13 +2,19 @@ from enum import Enum
 from typing import Annotated, Optional
 
 import pytest
+from pytest_mock import MockerFixture
 
 import strawberry
 from strawberry.annotation import StrawberryAnnotation
 from strawberry.exceptions import UnsupportedTypeError
 from strawberry.schema.config import StrawberryConfig
 from strawberry.schema.types.scalar import DEFAULT_SCALAR_REGISTRY
-from strawberry.types.arguments import StrawberryArgument, convert_arguments
+from strawberry.types.arguments import (
+    StrawberryArgument,
+    convert_argument,
+    convert_arguments,
+    get_argument_converter,
+)
 from strawberry.types.lazy_type import LazyType
 from strawberry.types.unset import UNSET
 
@@ -463,3 +469,80 @@ def test_fails_when_passing_non_strawberry_classes():
         )
         == {}
     )
+
+
+@strawberry.input
+class Filter:
+    name: str
+    and_: Optional[list["Filter"]] = None
+
+
+def test_self_referencing_input_types():
+    args = {
+        "filter": {"name": "a", "and_": [{"name": "b"}, {"name": "c", "and_": None}]}
+    }
+
+    arguments = [
+        StrawberryArgument(
+            graphql_name=None,
+            python_name="filter",
+            type_annotation=StrawberryAnnotation(Filter),
+        )
+    ]
+
+    assert convert_arguments(
+        args,
+        arguments,
+        scalar_registry=DEFAULT_SCALAR_REGISTRY,
+        config=StrawberryConfig(),
+    ) == {"filter": Filter(name="a", and_=[Filter(name="b"), Filter(name="c")])}
+
+
+def test_converters_are_compiled_once(mocker: MockerFixture):
+    @strawberry.input
+    class Item:
+        item_name: str
+
+    config = StrawberryConfig()
+    converters = {}
+    from_field = mocker.spy(config.name_converter, "from_field")
+    type_ = StrawberryAnnotation(list[Item]).resolve()
+
+    for _ in range(2):
+        assert convert_argument(
+            [{"itemName": "a"}, {"itemName": "b"}],
+            type_,
+            DEFAULT_SCALAR_REGISTRY,
+            config,
+            converters,
+        ) == [Item(item_name="a"), Item(item_name="b")]
+
+    assert get_argument_converter(
+        type_, DEFAULT_SCALAR_REGISTRY, config, converters
+    ) is get_argument_converter(type_, DEFAULT_SCALAR_REGISTRY, config, converters)
+    assert from_field.call_count == 1
+    assert set(converters) == {type_, Item}
+
+
+def test_schemas_sharing_a_config_keep_their_own_converters():
+    @strawberry.input
+    class Input:
+        value: int
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def double(self, input: Input) -> int:
+            return input.value * 2
+
+    config = StrawberryConfig()
+    schemas = [strawberry.Schema(query=Query, config=config) for _ in range(2)]
+
+    for schema in schemas:
+        result = schema.execute_sync("{ double(input: { value: 2 }) }")
+
+        assert result.data == {"double": 4}
+        assert Input in schema.schema_converter.argument_converters
+
+    first, second = (schema.schema_converter.argument_converters for schema in schemas)
+    assert first[Input] is not second[Input]
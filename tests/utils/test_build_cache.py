@@ -0,0 +1,139 @@
+import sys
+import textwrap
+import types
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+import strawberry
+from strawberry.annotation import StrawberryAnnotation
+from strawberry.utils.build_cache import SchemaBuildCache, fingerprint_sources
+
+SOURCE = textwrap.dedent(
+    """
+    from __future__ import annotations
+
+    from typing import Optional
+
+    import strawberry
+
+
+    @strawberry.type
+    class Book:
+        title: str
+        author: Optional[Author]
+
+
+    @strawberry.type
+    class Author:
+        name: str
+        books: list[Book]
+
+
+    @strawberry.type
+    class Query:
+        books: list[Book]
+    """
+)
+
+
+@pytest.fixture
+def module_name() -> Iterator[str]:
+    name = "build_cache_types"
+
+    yield name
+
+    sys.modules.pop(name, None)
+
+
+def import_types(name: str, source: str = SOURCE) -> types.ModuleType:
+    module = types.ModuleType(name)
+    sys.modules[name] = module
+    exec(compile(source, name, "exec"), vars(module))  # noqa: S102
+
+    return module
+
+
+def build_schema(cache: SchemaBuildCache, module_name: str) -> strawberry.Schema:
+    with cache:
+        module = import_types(module_name)
+
+        return strawberry.Schema(query=module.Query)
+
+
+def test_annotations_are_loaded_on_warm_starts(tmp_path: Path, module_name: str):
+    path = tmp_path / "schema"
+
+    cold = SchemaBuildCache(path, fingerprint="a")
+    cold_schema = build_schema(cold, module_name)
+    assert cold.hits == 0
+    assert cold.misses > 0
+    assert path.exists()
+
+    warm = SchemaBuildCache(path, fingerprint="a")
+    warm_schema = build_schema(warm, module_name)
+    assert warm.misses == 0
+    assert warm.hits > 0
+
+    assert str(warm_schema) == str(cold_schema)
+    assert warm_schema.get_type_by_name("Book") is (
+        sys.modules[module_name].Book.__strawberry_definition__
+    )
+
+
+def test_annotations_are_evaluated_when_the_fingerprint_changes(
+    tmp_path: Path, module_name: str
+):
+    path = tmp_path / "schema"
+    build_schema(SchemaBuildCache(path, fingerprint="a"), module_name)
+
+    cache = SchemaBuildCache(path, fingerprint="b")
+    build_schema(cache, module_name)
+
+    assert cache.hits == 0
+    assert cache.misses > 0
+
+
+def test_cache_is_only_used_inside_the_with_block(tmp_path: Path, module_name: str):
+    cache = SchemaBuildCache(tmp_path / "schema", fingerprint="a")
+
+    import_types(module_name)
+
+    assert cache.hits == cache.misses == 0
+    assert not (tmp_path / "schema").exists()
+
+
+def test_annotations_outside_of_modules_are_not_cached(tmp_path: Path):
+    cache = SchemaBuildCache(tmp_path / "schema", fingerprint="a")
+
+    with cache:
+        annotation = StrawberryAnnotation("list[int]", namespace={})
+
+        assert annotation.evaluate() == list[int]
+
+    assert cache.hits == cache.misses == 0
+    assert not (tmp_path / "schema").exists()
+
+
+def test_corrupted_cache_files_are_ignored(tmp_path: Path, module_name: str):
+    path = tmp_path / "schema"
+    path.write_bytes(b"not a pickle")
+
+    cache = SchemaBuildCache(path, fingerprint="a")
+    build_schema(cache, module_name)
+
+    assert cache.hits == 0
+    assert SchemaBuildCache(path, fingerprint="a")._stored
+
+
+def test_fingerprint_sources(tmp_path: Path):
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "types.py").write_text("x: int")
+    fingerprint = fingerprint_sources(tmp_path / "app")
+
+    assert fingerprint == fingerprint_sources(tmp_path / "app")
+
+    (tmp_path / "app" / "types.py").write_text("x: str")
+
+    assert fingerprint != fingerprint_sources(tmp_path / "app")
@@ -0,0 +1,170 @@
+import asyncio
+
+from strawberry.subscriptions.heartbeat import HeartbeatScheduler
+from strawberry.subscriptions.protocols.graphql_ws.handlers import BaseGraphQLWSHandler
+
+
+async def test_scheduler_is_shared_per_event_loop():
+    assert HeartbeatScheduler.get() is HeartbeatScheduler.get()
+
+
+async def test_fires_all_registered_callbacks():
+    scheduler = HeartbeatScheduler(asyncio.get_running_loop(), resolution=0.01)
+    calls = {"a": 0, "b": 0}
+
+    def increment(key: str) -> None:
+        calls[key] += 1
+
+    handle_a = scheduler.register(0.02, lambda: increment("a"))
+    handle_b = scheduler.register(0.05, lambda: increment("b"))
+    assert len(scheduler) == 2
+
+    await asyncio.sleep(0.12)
+
+    handle_a.cancel()
+    handle_b.cancel()
+
+    assert calls["a"] >= 3
+    assert 1 <= calls["b"] < calls["a"]
+    assert len(scheduler) == 0
+    assert scheduler._timer is None
+
+
+async def test_cancelled_callback_is_not_called():
+    scheduler = HeartbeatScheduler(asyncio.get_running_loop(), resolution=0.01)
+    calls = []
+
+    handle = scheduler.register(0.02, lambda: calls.append(1))
+    handle.cancel()
+    handle.cancel()
+
+    await asyncio.sleep(0.05)
+
+    assert calls == []
+    assert len(scheduler) == 0
+
+
+async def test_callback_can_cancel_other_handles():
+    scheduler = HeartbeatScheduler(asyncio.get_running_loop(), resolution=0.01)
+    calls = []
+
+    def first() -> None:
+        calls.append("first")
+        second_handle.cancel()
+
+    first_handle = scheduler.register(0.01, first)
+    second_handle = scheduler.register(0.01, lambda: calls.append("second"))
+
+    await asyncio.sleep(0.035)
+    first_handle.cancel()
+
+    assert "second" not in calls
+    assert len(scheduler) == 0
+
+
+async def test_intervals_longer_than_a_wheel_revolution():
+    scheduler = HeartbeatScheduler(
+        asyncio.get_running_loop(), resolution=0.01, wheel_size=4
+    )
+    calls = []
+
+    handle = scheduler.register(0.1, lambda: calls.append(1))
+
+    await asyncio.sleep(0.05)
+    assert calls == []
+
+    await asyncio.sleep(0.1)
+    handle.cancel()
+
+    assert calls == [1]
+
+
+async def test_timer_sleeps_until_the_next_heartbeat_is_due():
+    loop = asyncio.get_running_loop()
+    scheduler = HeartbeatScheduler(loop, resolution=0.01)
+    ticks = 0
+    tick = scheduler._tick
+
+    def count_ticks() -> None:
+        nonlocal ticks
+        ticks += 1
+        tick()
+
+    scheduler._tick = count_ticks  # type: ignore[method-assign]
+    calls = []
+
+    handle = scheduler.register(0.1, lambda: calls.append(1))
+    assert scheduler._next_tick_at - loop.time() > 0.09
+
+    # an earlier heartbeat brings the timer forward
+    short_handle = scheduler.register(0.03, lambda: None)
+    assert scheduler._next_tick_at - loop.time() < 0.04
+    short_handle.cancel()
+
+    await asyncio.sleep(0.25)
+    handle.cancel()
+
+    assert len(calls) >= 2
+    assert ticks <= len(calls) + 2
+
+
+async def test_graphql_ws_repeated_connection_init_replaces_the_heartbeat():
+    class View:
+        async def on_ws_connect(self, context: object) -> None:
+            return None
+
+    class Handler(BaseGraphQLWSHandler):
+        async def send_message(self, message: object) -> None:
+            pass
+
+    handler = Handler(
+        view=View(),  # type: ignore[arg-type]
+        websocket=None,  # type: ignore[arg-type]
+        context={},
+        root_value=None,
+        schema=None,  # type: ignore[arg-type]
+        debug=False,
+        keep_alive=True,
+        keep_alive_interval=10,
+    )
+    scheduler = HeartbeatScheduler.get()
+    registered = len(scheduler)
+
+    await handler.handle_connection_init({"type": "connection_init"})
+    first_handle = handler.keep_alive_handle
+    await handler.handle_connection_init({"type": "connection_init"})
+
+    assert first_handle is not None
+    assert first_handle.cancelled
+    assert handler.keep_alive_handle is not first_handle
+    assert len(scheduler) == registered + 1
+
+    handler.keep_alive_handle.cancel()
+
+
+async def test_graphql_ws_keep_alives_await_handle_keep_alive():
+    sent = []
+
+    class KeepAliveHandler(BaseGraphQLWSHandler):
+        async def handle_keep_alive(self) -> None:
+            await asyncio.sleep(0)
+            sent.append("custom ka")
+
+    handler = KeepAliveHandler(
+        view=None,  # type: ignore[arg-type]
+        websocket=None,  # type: ignore[arg-type]
+        context=None,
+        root_value=None,
+        schema=None,  # type: ignore[arg-type]
+        debug=False,
+        keep_alive=True,
+        keep_alive_interval=0.01,
+    )
+
+    handler.schedule_keep_alive()
+    # skipped, as the previous keep-alive is still being sent
+    handler.schedule_keep_alive()
+    assert handler.keep_alive_task is not None
+    await handler.keep_alive_task
+
+    assert sent == ["custom ka"]